@@ -0,0 +1,166 @@
+"""CPU and allocations of decoding an atlas catalog response.
+
+Compares the previous path (text JSON decode into a regular dataclass, with
+``created_at`` parsed by ``strptime`` on every /client view) against the
+current one (bytes decode, orjson when installed, into the slotted ``Client``
+with ``created_at`` parsed once). A 304 Not Modified refresh skips both.
+
+Run from the repository root: ``python -m benchmarks.bench_catalog``
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, List
+
+from utils.catalog import Client
+from utils.http import decode_json, orjson
+from utils.memory import format_size
+
+
+def size(value: float) -> str:
+    return format_size(value).lstrip("+")
+
+
+@dataclass
+class LegacyClient:
+    id: int
+    name: str
+    version: str
+    filename: str
+    md5_hash: str
+    size: int
+    main_class: str
+    show: bool
+    working: bool
+    launches: int
+    downloads: int
+    client_type: str
+    created_at: str
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LegacyClient":
+        return cls(
+            id=data.get("id", 0),
+            name=data.get("name", ""),
+            version=data.get("version", ""),
+            filename=data.get("filename", ""),
+            md5_hash=data.get("md5_hash", ""),
+            size=data.get("size", 0),
+            main_class=data.get("main_class", ""),
+            show=data.get("show", False),
+            working=data.get("working", False),
+            launches=data.get("launches", 0),
+            downloads=data.get("downloads", 0),
+            client_type=data.get("client_type", "default"),
+            created_at=data.get("created_at", ""),
+        )
+
+
+def make_body(count: int) -> bytes:
+    return json.dumps(
+        {
+            "data": [
+                {
+                    "id": i,
+                    "name": f"Client{i}",
+                    "version": "1.16.5",
+                    "filename": f"client{i}.jar",
+                    "md5_hash": f"{i:032x}",
+                    "size": 1024 * i,
+                    "main_class": "net.minecraft.client.main.Main",
+                    "show": i % 5 != 0,
+                    "working": True,
+                    "launches": i * 10,
+                    "downloads": i * 3,
+                    "client_type": "default",
+                    "created_at": "2024-05-01T12:00:00.000Z",
+                }
+                for i in range(count)
+            ]
+        }
+    ).encode()
+
+
+def legacy_decode(body: bytes) -> List[LegacyClient]:
+    # aiohttp's response.json() decodes the body to text before json.loads
+    return [LegacyClient.from_dict(client) for client in json.loads(body.decode())["data"]]
+
+
+def current_decode(body: bytes) -> List[Client]:
+    return [Client.from_dict(client) for client in decode_json(body)["data"]]
+
+
+def legacy_view(client: LegacyClient) -> int:
+    try:
+        created_at = datetime.strptime(client.created_at, "%Y-%m-%dT%H:%M:%S.%fZ")
+    except ValueError:
+        created_at = datetime.fromisoformat(client.created_at.replace("Z", "+00:00"))
+    return int(created_at.timestamp())
+
+
+def current_view(client: Client) -> int:
+    return int(client.created_at.timestamp())
+
+
+def cpu_ms(func: Callable, repeat: int) -> float:
+    """Best CPU time of ``repeat`` runs, in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.process_time()
+        func()
+        best = min(best, time.process_time() - started)
+    return best * 1000
+
+
+def allocations(func: Callable):
+    """Peak traced memory while ``func`` runs and the size of what it returns"""
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    peak = tracemalloc.get_traced_memory()[1]
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return peak, retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=5_000)
+    parser.add_argument("--views", type=int, default=1_000, help="/client views per refresh")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    body = make_body(args.clients)
+    print(
+        f"{args.clients:,} clients, {size(len(body))} body, "
+        f"{args.views:,} views, decoder: {'orjson' if orjson else 'json'}"
+    )
+    print(f"{'path':>8} {'decode ms':>10} {'views ms':>9} {'peak':>10} {'retained':>10}")
+
+    paths = (
+        ("previous", legacy_decode, legacy_view),
+        ("current", current_decode, current_view),
+    )
+    for name, decode, view in paths:
+        clients = decode(body)
+        viewed = clients[: args.views] * (args.views // len(clients) + 1)
+        viewed = viewed[: args.views]
+        peak, retained = allocations(lambda: decode(body))
+        print(
+            f"{name:>8} {cpu_ms(lambda: decode(body), args.repeat):>10.2f} "
+            f"{cpu_ms(lambda: [view(client) for client in viewed], args.repeat):>9.2f} "
+            f"{size(peak):>10} {size(retained):>10}"
+        )
+    print("A 304 Not Modified refresh skips reading and decoding the body entirely.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""Resident memory and event-processing CPU of each gateway profile.
+
+Feeds a simulated large guild through discord's ConnectionState: the member
+list that chunking would cache, a stream of presence updates and messages.
+Each profile runs in a fresh interpreter so RSS numbers do not bleed into each
+other.
+
+Run from the repository root: ``python -m benchmarks.bench_gateway``
+"""
+
+import argparse
+import gc
+import json
+import subprocess
+import sys
+import time
+
+import discord
+from discord.state import ConnectionState
+
+from utils.gateway import PROFILES
+from utils.helpers import get_rss_mb
+
+GUILD_ID = 1_000_000
+CHANNEL_ID = 1_000_001
+BOT_ID = 1_000_002
+TIMESTAMP = "2024-05-01T12:00:00.000000+00:00"
+
+
+def _user(user_id: int) -> dict:
+    return {
+        "id": str(user_id),
+        "username": f"user{user_id}",
+        "global_name": f"User {user_id}",
+        "discriminator": "0",
+        "avatar": None,
+    }
+
+
+def _member(user_id: int) -> dict:
+    return {
+        "user": _user(user_id),
+        "roles": [],
+        "joined_at": TIMESTAMP,
+        "deaf": False,
+        "mute": False,
+        "flags": 0,
+    }
+
+
+def _presence(user_id: int, status: str) -> dict:
+    return {
+        "user": {"id": str(user_id)},
+        "guild_id": str(GUILD_ID),
+        "status": status,
+        "activities": [{"name": "Minecraft", "type": 0}],
+        "client_status": {"desktop": status},
+    }
+
+
+def _message(message_id: int, user_id: int) -> dict:
+    return {
+        "id": str(message_id),
+        "channel_id": str(CHANNEL_ID),
+        "guild_id": str(GUILD_ID),
+        "author": _user(user_id),
+        "member": {"roles": [], "joined_at": TIMESTAMP, "deaf": False, "mute": False},
+        "content": "my loader does not start, any help?",
+        "timestamp": TIMESTAMP,
+        "edited_timestamp": None,
+        "tts": False,
+        "mention_everyone": False,
+        "mentions": [],
+        "mention_roles": [],
+        "attachments": [],
+        "embeds": [],
+        "pinned": False,
+        "type": 0,
+    }
+
+
+def _guild() -> dict:
+    return {
+        "id": str(GUILD_ID),
+        "name": "CollapseLoader",
+        "member_count": 0,
+        "large": True,
+        "members": [_member(BOT_ID)],
+        "channels": [
+            {
+                "id": str(CHANNEL_ID),
+                "type": 0,
+                "name": "general",
+                "position": 0,
+                "permission_overwrites": [],
+            }
+        ],
+        "roles": [
+            {
+                "id": str(GUILD_ID),
+                "name": "@everyone",
+                "permissions": "0",
+                "position": 0,
+                "color": 0,
+                "colors": {"primary_color": 0, "secondary_color": None, "tertiary_color": None},
+                "hoist": False,
+                "managed": False,
+                "mentionable": False,
+            }
+        ],
+    }
+
+
+def run_profile(name: str, members: int, presences: int, messages: int) -> dict:
+    profile = PROFILES[name]()
+    state = ConnectionState(
+        dispatch=lambda *args, **kwargs: None,
+        handlers={},
+        hooks={},
+        http=None,
+        loop=None,
+        **profile.options(),
+    )
+    state.user = discord.ClientUser(state=state, data=_user(BOT_ID))
+
+    gc.collect()
+    baseline = get_rss_mb()
+    started = time.process_time()
+
+    guild = state._add_guild_from_data(_guild())
+    guild._member_count = members
+    if profile.chunk_guilds_at_startup:
+        # What GUILD_MEMBERS_CHUNK leaves behind once startup chunking completes
+        for user_id in range(1, members + 1):
+            guild._add_member(discord.Member(data=_member(user_id), guild=guild, state=state))
+
+    if profile.intents.presences:
+        statuses = ("online", "idle", "dnd", "offline")
+        for i in range(presences):
+            state.parse_presence_update(_presence(i % members + 1, statuses[i % 4]))
+
+    for i in range(messages):
+        state.parse_message_create(_message(10_000_000 + i, i % members + 1))
+
+    cpu = time.process_time() - started
+    gc.collect()
+    return {
+        "profile": name,
+        "cached_members": len(guild._members),
+        "cached_messages": len(state._messages or ()),
+        "rss_mb": get_rss_mb() - baseline,
+        "cpu_s": cpu,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=100_000)
+    parser.add_argument("--presences", type=int, default=200_000)
+    parser.add_argument("--messages", type=int, default=5_000)
+    parser.add_argument("--profile", choices=sorted(PROFILES), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.profile:
+        print(json.dumps(run_profile(args.profile, args.members, args.presences, args.messages)))
+        return
+
+    print(
+        f"{args.members:,} members, {args.presences:,} presence updates, "
+        f"{args.messages:,} messages"
+    )
+    print(f"{'profile':>8} {'members':>10} {'messages':>9} {'RSS MB':>8} {'CPU s':>7}")
+    for name in PROFILES:
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_gateway", "--profile", name]
+            + [f"--members={args.members}", f"--presences={args.presences}"]
+            + [f"--messages={args.messages}"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"{name:>8} {result['cached_members']:>10,} {result['cached_messages']:>9,} "
+            f"{result['rss_mb']:>8.1f} {result['cpu_s']:>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Messages/sec of the trigger matcher vs the old per-rule substring scan.
+
+Run from the repository root: ``python -m benchmarks.bench_matcher``
+"""
+
+import random
+import string
+import time
+
+from utils.matcher import TriggerMatcher
+
+RULE_COUNTS = (10, 100, 1000)
+TRIGGERS_PER_RULE = 4
+MESSAGE_COUNT = 2000
+
+
+def _word(rng: random.Random, length: int) -> str:
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(length))
+
+
+def _build_rules(rng: random.Random, count: int):
+    return [
+        (f"rule_{i}", [f"{_word(rng, 5)} {_word(rng, 6)}" for _ in range(TRIGGERS_PER_RULE)])
+        for i in range(count)
+    ]
+
+
+def _build_messages(rng: random.Random, rules):
+    messages = []
+    for _ in range(MESSAGE_COUNT):
+        words = [_word(rng, rng.randint(2, 8)) for _ in range(rng.randint(5, 25))]
+        if rng.random() < 0.1:
+            words.insert(rng.randrange(len(words)), rng.choice(rng.choice(rules)[1]))
+        messages.append(" ".join(words).upper())
+    return messages
+
+
+def _naive(rules, messages):
+    for message in messages:
+        content = message.lower()
+        for _, triggers in rules:
+            if any(trigger.lower() in content for trigger in triggers):
+                break
+
+
+def _compiled(matcher, messages):
+    for message in messages:
+        matcher.match(message.lower())
+
+
+def _rate(func, *args) -> float:
+    started = time.perf_counter()
+    func(*args)
+    return MESSAGE_COUNT / (time.perf_counter() - started)
+
+
+def main():
+    rng = random.Random(1337)
+    print(f"{'rules':>6} | {'naive msg/s':>12} | {'automaton msg/s':>15} | {'build ms':>8}")
+    for count in RULE_COUNTS:
+        rules = _build_rules(rng, count)
+        messages = _build_messages(rng, rules)
+
+        started = time.perf_counter()
+        matcher = TriggerMatcher(rules)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        naive = _rate(_naive, rules, messages)
+        compiled = _rate(_compiled, matcher, messages)
+        print(f"{count:>6} | {naive:>12,.0f} | {compiled:>15,.0f} | {build_ms:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
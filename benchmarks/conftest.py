@@ -0,0 +1,13 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.fakes import make_bot  # noqa: E402
+
+
+@pytest.fixture
+def bot(tmp_path):
+    return make_bot(tmp_path)
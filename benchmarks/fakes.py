@@ -0,0 +1,187 @@
+"""Lightweight stand-ins for the discord objects the hot paths touch."""
+
+import time
+import types
+from typing import List, Optional
+
+import discord
+import yaml
+
+import config
+from utils.catalog import Client, ClientCatalog, parse_timestamp
+from utils.registry import ConfigRegistry
+from utils.rules import Ruleset
+from utils.snippets import SnippetSet
+from utils.stats import StatsCache
+
+
+class FakeRole:
+    def __init__(self, id: int):
+        self.id = id
+
+
+class FakeMember:
+    def __init__(self, id: int = 1, roles: Optional[List[FakeRole]] = None, bot: bool = False):
+        self.id = id
+        self.bot = bot
+        self.name = f"user{id}"
+        self.display_name = f"User {id}"
+        self.mention = f"<@{id}>"
+        self.display_avatar = types.SimpleNamespace(url=f"https://cdn.discordapp.com/embed/avatars/{id % 5}.png")
+        self.roles = roles or []
+
+
+class FakeGuildMember(FakeMember, discord.Member):
+    """FakeMember that passes the ``isinstance(ctx.author, discord.Member)`` checks"""
+
+    id = name = display_name = mention = roles = bot = display_avatar = None
+
+
+class FakeGuild:
+    def __init__(self, name: str = "CollapseLoader"):
+        self.name = name
+
+
+class FakeTextChannel(discord.TextChannel):
+    category_id = None
+
+    def __init__(self, name: str = "general", category_id: Optional[int] = None, id: int = 10):
+        self.id = id
+        self.name = name
+        self.category_id = category_id
+
+
+class FakeThread(discord.Thread):
+    category_id = None
+
+    def __init__(self, name: str = "help-thread", category_id: Optional[int] = None, id: int = 11):
+        self.id = id
+        self.name = name
+        self.category_id = category_id
+
+
+class FakeMessage:
+    def __init__(self, content: str, author: FakeMember, channel, guild=None):
+        self.content = content
+        self.author = author
+        self.channel = channel
+        self.guild = guild
+
+    async def reply(self, content: str):
+        return None
+
+    async def delete(self):
+        return None
+
+
+class RecordingScheduler:
+    """ReplyScheduler stand-in that keeps submitted replies instead of sending them"""
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, reply) -> bool:
+        self.submitted.append(reply)
+        return True
+
+    def close(self):
+        self.submitted.clear()
+
+
+class FakeApplicationContext:
+    def __init__(self, author: FakeMember, channel_id: int = 1):
+        self.author = author
+        self.channel_id = channel_id
+        self.command = None
+        self.sent = []
+
+    async def defer(self, *args, **kwargs):
+        return None
+
+    async def respond(self, *args, **kwargs):
+        self.sent.append(kwargs.get("embed"))
+
+
+def run(coro):
+    """Drive a coroutine that never actually suspends, without an event loop"""
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    raise RuntimeError("coroutine suspended; fakes must not block")
+
+
+def make_rules(count: int) -> dict:
+    return {
+        f"rule_{i}": {
+            "triggers": [f"trigger {i} alpha", f"phrase {i} beta"],
+            "responses": ["Hi {user}, see {channel} on {server}", "Plain answer"],
+            "conditions": {"channel_types": ["text", "thread"], "cooldown": 0},
+            "enabled": True,
+        }
+        for i in range(count)
+    }
+
+
+def make_clients(count: int) -> List[Client]:
+    return [
+        Client(
+            id=i,
+            name=f"Client{i}",
+            version="1.16.5",
+            filename=f"client{i}.jar",
+            md5_hash="0" * 32,
+            size=1024,
+            main_class="net.minecraft.client.main.Main",
+            show=i % 5 != 0,
+            working=True,
+            launches=i * 10,
+            downloads=i * 3,
+            client_type="default",
+            created_at=parse_timestamp("2024-05-01T12:00:00.000Z"),
+        )
+        for i in range(count)
+    ]
+
+
+def make_bot(tmp_path, rule_count: int = 50, client_count: int = 500):
+    """Bot stand-in with a registry over generated config files and a filled catalog"""
+    rules_file = tmp_path / "automatic_responses.yml"
+    rules_file.write_text(yaml.dump(make_rules(rule_count)), encoding="utf-8")
+    snippets_file = tmp_path / "snippets.yml"
+    snippets_file.write_text(
+        yaml.dump({"install": {"title": "Install", "content": "Steps"}}),
+        encoding="utf-8",
+    )
+
+    registry = ConfigRegistry(str(tmp_path / "snapshots"))
+    registry.register("automatic_responses", str(rules_file), Ruleset.from_data)
+    registry.register("snippets", str(snippets_file), SnippetSet.from_data)
+
+    catalog = ClientCatalog(atlas=None)
+    catalog.update("clients", make_clients(client_count))
+
+    stats = StatsCache(atlas=None)
+    stats.update(
+        {
+            "total_loader_launches": 1_000_000,
+            "total_client_downloads": 250_000,
+            "total_client_launches": 750_000,
+        }
+    )
+
+    return types.SimpleNamespace(
+        user=None,
+        guilds=[],
+        latency=0.05,
+        registry=registry,
+        catalog=catalog,
+        stats=stats,
+        started_at=time.time(),
+        commands=[],
+    )
+
+
+def staff_member() -> FakeGuildMember:
+    return FakeGuildMember(roles=[FakeRole(1), FakeRole(2), FakeRole(config.ADMIN_ROLES[-1])])
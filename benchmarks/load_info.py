@@ -0,0 +1,259 @@
+"""Load test of InfoCog's slash commands against the local atlas stand-in.
+
+Points ``config.API_BASE_URL`` at a mock atlas (started in a background thread
+unless ``--url`` names one that is already running), builds the catalog,
+statistics cache and ``InfoCog`` the way the bot does, then fires concurrent
+simulated command invocations and reports throughput, per-command latency and
+event-loop lag.
+
+Run from the repository root: ``python -m benchmarks.load_info --clients 20000``
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import types
+from collections import defaultdict
+from contextlib import nullcontext
+from typing import Dict, List, Sequence, Tuple
+
+import config
+from benchmarks.fakes import FakeApplicationContext, staff_member
+from benchmarks.mock_atlas import add_arguments, client_name, from_arguments, serve_in_thread
+from cogs.info_cog import InfoCog
+from utils.catalog import ClientCatalog
+from utils.http import AtlasClient
+from utils.stats import StatsCache
+
+DEFAULT_MIX = "client=6,clients=2,stats=1,fabric-clients=1"
+
+
+def percentile(values: Sequence[float], share: float) -> float:
+    """Nearest-rank percentile of already sorted ``values``"""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(share * len(values)))]
+
+
+def parse_mix(mix: str) -> Tuple[List[str], List[int]]:
+    commands, weights = [], []
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        commands.append(name.strip())
+        weights.append(int(weight or 1))
+    return commands, weights
+
+
+def client_query(rng: random.Random, clients: int) -> str:
+    """A /client argument as users type it: exact, prefix, partial, or misspelled"""
+    name = client_name(rng.randrange(max(1, clients)))
+    kind = rng.random()
+    if kind < 0.5:
+        return name
+    if kind < 0.7:
+        return name[: max(3, len(name) - 2)].lower()
+    if kind < 0.9:
+        return name[2:]
+    position = rng.randrange(len(name) - 1)
+    return name[:position] + name[position + 1] + name[position] + name[position + 2 :]
+
+
+class LoopLagMonitor:
+    """Measures how late a periodic wake-up fires, i.e. how long the loop was blocked"""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.samples: List[float] = []
+        self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - expected))
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+
+class LoadContext(FakeApplicationContext):
+    """Application context whose responses take a simulated, jittered Discord round trip"""
+
+    def __init__(self, response_latency: float):
+        super().__init__(staff_member())
+        self.response_latency = response_latency
+
+    async def _round_trip(self):
+        await asyncio.sleep(self.response_latency * random.uniform(0.5, 1.5))
+
+    async def defer(self, *args, **kwargs):
+        await self._round_trip()
+
+    async def respond(self, *args, **kwargs):
+        await self._round_trip()
+        self.sent.append(kwargs.get("embed"))
+
+
+def make_bot() -> types.SimpleNamespace:
+    """The parts of CollapseBot that InfoCog reads, wired to ``config.API_BASE_URL``"""
+    atlas = AtlasClient(config.API_BASE_URL, timeout=config.HTTP_TIMEOUT)
+    return types.SimpleNamespace(
+        user=None,
+        guilds=[],
+        latency=0.05,
+        atlas=atlas,
+        catalog=ClientCatalog(atlas, refresh_interval=config.CATALOG_REFRESH_INTERVAL),
+        stats=StatsCache(atlas, refresh_interval=config.STATS_REFRESH_INTERVAL),
+        started_at=time.time(),
+        commands=[],
+    )
+
+
+async def invoke(
+    cog: InfoCog, command: str, query: str, response_latency: float
+) -> str:
+    """Run one command callback and classify its answer as ok, not found or error"""
+    ctx = LoadContext(response_latency)
+    if command == "client":
+        await cog.client_cmd.callback(cog, ctx, query)
+    elif command == "clients":
+        await cog.clients.callback(cog, ctx)
+    elif command == "fabric-clients":
+        await cog.fabric_clients.callback(cog, ctx)
+    elif command == "forge-clients":
+        await cog.forge_clients.callback(cog, ctx)
+    elif command == "stats":
+        await cog.stats.callback(cog, ctx)
+    else:
+        raise ValueError(f"unknown command {command!r}")
+
+    title = (ctx.sent[-1].title or "") if ctx.sent and ctx.sent[-1] else ""
+    if title == "❌ Client Not Found":
+        return "not found"
+    return "error" if not ctx.sent or title.startswith("❌") else "ok"
+
+
+async def run_load(args: argparse.Namespace) -> Dict[str, object]:
+    bot = make_bot()
+    cog = InfoCog(bot)
+    commands, weights = parse_mix(args.mix)
+    rng = random.Random(args.seed)
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    outcomes: Dict[Tuple[str, str], int] = defaultdict(int)
+    remaining = args.requests
+
+    if not args.cold:
+        await asyncio.gather(bot.catalog.refresh_all(), bot.stats.refresh())
+    if args.refresh_interval:
+        bot.catalog.refresh_interval = args.refresh_interval
+        bot.stats.refresh_interval = args.refresh_interval
+        bot.catalog.start()
+        bot.stats.start()
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            command = rng.choices(commands, weights)[0]
+            query = client_query(rng, args.clients)
+            started = time.perf_counter()
+            try:
+                outcome = await invoke(cog, command, query, args.response_latency)
+            except Exception:
+                outcome = "error"
+            latencies[command].append(time.perf_counter() - started)
+            outcomes[(command, outcome)] += 1
+
+    monitor = LoopLagMonitor()
+    monitor.start()
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    finally:
+        elapsed = time.perf_counter() - started
+        await monitor.stop()
+        await bot.catalog.stop()
+        await bot.stats.stop()
+        await bot.atlas.close()
+
+    return {
+        "elapsed": elapsed,
+        "latencies": latencies,
+        "outcomes": outcomes,
+        "lag": sorted(monitor.samples),
+        "catalog": bot.catalog,
+    }
+
+
+def report(result: Dict[str, object], mock=None):
+    latencies = result["latencies"]
+    outcomes = result["outcomes"]
+    total = sum(len(values) for values in latencies.values())
+    print(
+        f"{total:,} invocations in {result['elapsed']:.2f}s, "
+        f"{total / result['elapsed']:,.0f}/s"
+    )
+    print(
+        f"{'command':>15} {'count':>7} {'errors':>7} {'missing':>8} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'p99 ms':>8} {'max ms':>8}"
+    )
+    for command, values in sorted(latencies.items()):
+        values.sort()
+        print(
+            f"{command:>15} {len(values):>7,} {outcomes[(command, 'error')]:>7,} "
+            f"{outcomes[(command, 'not found')]:>8,} "
+            f"{percentile(values, 0.5) * 1000:>8.2f} {percentile(values, 0.95) * 1000:>8.2f} "
+            f"{percentile(values, 0.99) * 1000:>8.2f} {values[-1] * 1000:>8.2f}"
+        )
+
+    lag = result["lag"]
+    print(
+        f"loop lag: p50 {percentile(lag, 0.5) * 1000:.2f} ms, "
+        f"p99 {percentile(lag, 0.99) * 1000:.2f} ms, max {(lag[-1] if lag else 0) * 1000:.2f} ms"
+    )
+    catalog = result["catalog"]
+    print(
+        f"catalog: {catalog.hits:,} hits, {catalog.misses:,} misses, "
+        f"{catalog.failures:,} failed and {catalog.not_modified:,} not modified refreshes"
+    )
+    if mock is not None:
+        print(
+            f"mock atlas: {sum(mock.requests.values()):,} requests, "
+            f"{mock.failures:,} injected failures, {mock.not_modified:,} answered 304"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="base URL of an already running mock atlas")
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"command weights, default {DEFAULT_MIX}")
+    parser.add_argument(
+        "--response-latency", type=float, default=0.05, help="simulated Discord round trip"
+    )
+    parser.add_argument("--cold", action="store_true", help="start with empty caches")
+    parser.add_argument(
+        "--refresh-interval", type=float, default=0, help="run background refreshes this often"
+    )
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    mock = None if args.url else from_arguments(args)
+    with serve_in_thread(mock) if mock is not None else nullcontext(args.url) as url:
+        config.API_BASE_URL = url
+        result = asyncio.run(run_load(args))
+    report(result, mock)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""Local stand-in for the atlas API.
+
+Serves generated catalogs on ``/api/v1/clients``, ``/api/v1/fabric-clients``
+and ``/api/v1/forge-clients`` plus ``/api/statistics``, with ETag/304 support
+like the real server, configurable latency and injected failures.
+
+Run from the repository root: ``python -m benchmarks.mock_atlas --clients 20000``
+and start the bot with ``API_BASE_URL=http://127.0.0.1:8081``.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+from aiohttp import web
+
+STEMS = ("Nova", "Vortex", "Celestial", "Rise", "Dev", "Meteor", "Eclipse", "Zenith")
+FAILURE_MODES = ("error", "timeout", "garbage")
+LAST_MODIFIED = "Wed, 01 May 2024 12:00:00 GMT"
+
+
+def client_name(index: int) -> str:
+    return f"{STEMS[index % len(STEMS)]}{index}"
+
+
+def make_catalog(count: int, client_type: str = "default", start: int = 0) -> list:
+    return [
+        {
+            "id": index,
+            "name": client_name(index),
+            "version": "1.16.5" if index % 3 else "1.12.2",
+            "filename": f"{client_name(index).lower()}.jar",
+            "md5_hash": f"{index:032x}",
+            "size": 1024 * (index % 4096 + 1),
+            "main_class": "net.minecraft.client.main.Main",
+            "show": index % 5 != 0,
+            "working": index % 7 != 0,
+            "launches": index * 10,
+            "downloads": index * 3,
+            "client_type": client_type,
+            "created_at": "2024-05-01T12:00:00.000Z",
+        }
+        for index in range(start, start + count)
+    ]
+
+
+class MockAtlas:
+    """aiohttp application imitating the atlas endpoints the bot reads.
+
+    Every request waits ``latency`` plus up to ``jitter`` seconds. A
+    ``failure_rate`` share of requests then fails according to
+    ``failure_mode``: ``error`` answers 503, ``timeout`` stalls for
+    ``stall`` seconds and ``garbage`` returns a body that is not JSON.
+    """
+
+    def __init__(
+        self,
+        clients: int = 500,
+        fabric_clients: int = 100,
+        forge_clients: int = 100,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        failure_mode: str = "error",
+        stall: float = 30.0,
+        seed: int = 0,
+    ):
+        if failure_mode not in FAILURE_MODES:
+            raise ValueError(f"failure_mode must be one of {', '.join(FAILURE_MODES)}")
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.failure_mode = failure_mode
+        self.stall = stall
+        self.random = random.Random(seed)
+        self.catalogs: Dict[str, Tuple[bytes, str]] = {}
+        self.requests: Counter = Counter()
+        self.not_modified = 0
+        self.failures = 0
+
+        offset = 0
+        for endpoint, count, client_type in (
+            ("clients", clients, "default"),
+            ("fabric-clients", fabric_clients, "fabric"),
+            ("forge-clients", forge_clients, "forge"),
+        ):
+            self.set_catalog(endpoint, make_catalog(count, client_type, offset))
+            offset += count
+
+        self.statistics = {
+            "total_loader_launches": 1_250_000,
+            "total_client_downloads": 310_000,
+            "total_client_launches": 940_000,
+        }
+
+    def set_catalog(self, endpoint: str, clients: list):
+        """Replace a catalog, which changes its ETag like a real update would"""
+        body = json.dumps({"data": clients}).encode()
+        self.catalogs[endpoint] = (body, f'"{hashlib.md5(body).hexdigest()}"')
+
+    async def _delay_or_fail(self, request: web.Request) -> Optional[web.Response]:
+        """Apply the configured latency, then return a failure response if one is injected"""
+        self.requests[request.path] += 1
+        delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            await asyncio.sleep(delay)
+        if not self.failure_rate or self.random.random() >= self.failure_rate:
+            return None
+
+        self.failures += 1
+        if self.failure_mode == "timeout":
+            await asyncio.sleep(self.stall)
+        elif self.failure_mode == "garbage":
+            return web.Response(text="<html>upstream error</html>", content_type="text/html")
+        return web.Response(status=503, text="injected failure")
+
+    async def catalog(self, request: web.Request) -> web.Response:
+        failure = await self._delay_or_fail(request)
+        if failure is not None:
+            return failure
+        body, etag = self.catalogs[request.match_info["endpoint"]]
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(
+            body=body,
+            content_type="application/json",
+            headers={"ETag": etag, "Last-Modified": LAST_MODIFIED},
+        )
+
+    async def statistics_handler(self, request: web.Request) -> web.Response:
+        failure = await self._delay_or_fail(request)
+        if failure is not None:
+            return failure
+        return web.json_response(self.statistics)
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get(
+            "/api/v1/{endpoint:clients|fabric-clients|forge-clients}", self.catalog
+        )
+        app.router.add_get("/api/statistics", self.statistics_handler)
+        return app
+
+
+@contextmanager
+def serve_in_thread(mock: MockAtlas, host: str = "127.0.0.1", port: int = 0) -> Iterator[str]:
+    """Serve ``mock`` from its own thread and event loop, yielding its base URL.
+
+    Keeping the server off the caller's loop means its work does not show up in
+    the caller's latency and loop-lag measurements.
+    """
+    loop = asyncio.new_event_loop()
+    runner = web.AppRunner(mock.app(), access_log=None, shutdown_timeout=1.0)
+    loop.run_until_complete(runner.setup())
+    loop.run_until_complete(web.TCPSite(runner, host, port).start())
+    thread = threading.Thread(target=loop.run_forever, name="mock-atlas", daemon=True)
+    thread.start()
+
+    async def shutdown():
+        await runner.cleanup()
+        # Handlers still stalled by the "timeout" failure mode
+        pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    try:
+        yield f"http://{host}:{runner.addresses[0][1]}"
+    finally:
+        asyncio.run_coroutine_threadsafe(shutdown(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--fabric-clients", type=int, default=100)
+    parser.add_argument("--forge-clients", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random seconds")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--failure-mode", choices=FAILURE_MODES, default="error")
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def from_arguments(args: argparse.Namespace) -> MockAtlas:
+    return MockAtlas(
+        clients=args.clients,
+        fabric_clients=args.fabric_clients,
+        forge_clients=args.forge_clients,
+        latency=args.latency,
+        jitter=args.jitter,
+        failure_rate=args.failure_rate,
+        failure_mode=args.failure_mode,
+        seed=args.seed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    add_arguments(parser)
+    args = parser.parse_args()
+    web.run_app(from_arguments(args).app(), host=args.host, port=args.port, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Hot-path benchmarks, run with ``pytest benchmarks``.
+
+Every run is saved as a JSON baseline under benchmarks/baselines; compare
+against the previous one with ``pytest benchmarks --benchmark-compare
+--benchmark-compare-fail=mean:20%``.
+"""
+
+import pytest
+
+from benchmarks.fakes import (
+    FakeApplicationContext,
+    FakeGuild,
+    FakeMember,
+    FakeMessage,
+    FakeTextChannel,
+    FakeThread,
+    RecordingScheduler,
+    make_bot,
+    make_clients,
+    run,
+    staff_member,
+)
+from cogs.admin_cog import AdminCog
+from cogs.automatic_responses_cog import AutomaticResponsesCog
+from cogs.info_cog import InfoCog
+from utils.catalog import ClientCatalog
+from utils.helpers import check_word_list, is_staff
+
+CHATTER = "hey does anyone know why my game keeps stuttering after the last update " * 2
+
+
+@pytest.fixture
+def responses_cog(bot):
+    return AutomaticResponsesCog(bot)
+
+
+@pytest.fixture
+def info_cog(bot):
+    return InfoCog(bot)
+
+
+def _message(content: str, channel=None) -> FakeMessage:
+    return FakeMessage(content, FakeMember(), channel or FakeTextChannel(), FakeGuild())
+
+
+@pytest.mark.parametrize("rule_count", [10, 100, 1000])
+def test_on_message_no_match(benchmark, tmp_path, rule_count):
+    cog = AutomaticResponsesCog(make_bot(tmp_path, rule_count=rule_count))
+    message = _message(CHATTER)
+    benchmark(lambda: run(cog.on_message(message)))
+
+
+@pytest.mark.parametrize("rule_count", [10, 100, 1000])
+def test_on_message_match(benchmark, tmp_path, rule_count):
+    cog = AutomaticResponsesCog(make_bot(tmp_path, rule_count=rule_count))
+    cog.replies = RecordingScheduler()
+    message = _message(f"{CHATTER} phrase {rule_count - 1} beta", FakeThread())
+    benchmark(lambda: run(cog.on_message(message)))
+    assert cog.replies.submitted
+
+
+def test_check_conditions(benchmark, responses_cog):
+    rule = responses_cog.ruleset.rules[0]
+    message = _message(CHATTER, FakeThread())
+    assert benchmark(responses_cog.check_conditions, rule, message)
+
+
+def test_format_response(benchmark, responses_cog):
+    template = responses_cog.ruleset.rules[0].responses[0]
+    message = _message(CHATTER)
+    assert benchmark(responses_cog.format_response, template, message).startswith("Hi User")
+
+
+def test_check_word_list(benchmark):
+    keywords = [f"keyword{i}" for i in range(20)] + ["update"]
+    message = _message(CHATTER)
+    assert benchmark(check_word_list, keywords, message)
+
+
+def test_is_staff(benchmark):
+    assert benchmark(is_staff, staff_member())
+
+
+def test_create_clients_embed(benchmark, info_cog, bot):
+    clients = bot.catalog.peek("clients")
+    benchmark(info_cog._create_clients_embed, clients, "Client Library")
+
+
+def test_client_lookup(benchmark, info_cog):
+    ctx = FakeApplicationContext(staff_member())
+    callback = info_cog.client_cmd.callback
+    benchmark(lambda: run(callback(info_cog, ctx, "client499")))
+    assert ctx.sent[-1].title == "Client499"
+
+
+@pytest.mark.parametrize("client_count", [500, 5000, 50000])
+@pytest.mark.parametrize("query", ["client499", "ent499", "clinet499"])
+def test_lookup_index(benchmark, client_count, query):
+    catalog = ClientCatalog(atlas=None)
+    catalog.update("clients", make_clients(client_count))
+    index = catalog.lookup_index("clients")
+    benchmark(lambda: index.lookup(query) or index.suggest(query))
+
+
+def test_stats(benchmark, info_cog):
+    ctx = FakeApplicationContext(FakeMember())
+    callback = info_cog.stats.callback
+    benchmark(lambda: run(callback(info_cog, ctx)))
+    assert ctx.sent[-1].title == "📊 CollapseLoader Statistics"
+
+
+def test_snippet(benchmark, bot):
+    admin_cog = AdminCog(bot)
+    ctx = FakeApplicationContext(staff_member())
+    callback = admin_cog.snippet.callback
+    benchmark(lambda: run(callback(admin_cog, ctx, "install")))
+    assert ctx.sent[-1].footer.text.startswith("Snippet: install")
@@ -2,55 +2,117 @@ from datetime import datetime
 from typing import cast
 
 import discord
-import yaml
 from discord.ext import commands
 from loguru import logger
 
 import config
+from utils.bulk import BulkResult, run_bulk
+from utils.embeds import MAIN_ADMIN_ONLY, STAFF_ONLY, THREAD_STAFF_ONLY
 from utils.helpers import is_staff
+from utils.registry import ConfigError
+from utils.search import NameIndex
+from utils.snippets import SnippetSet
+from utils.tracing import tracer
+from utils.watcher import FileWatcher
 
 
-def get_snippets_list(_):
-    """Get snippets list for autocomplete"""
-    try:
-        with open("snippets.yml", "r", encoding="utf-8") as file:
-            snippets = yaml.safe_load(file) or {}
-            return list(snippets.keys())
-    except:
+def get_snippets_list(ctx: discord.AutocompleteContext):
+    """Get snippets list for autocomplete from the loaded snippet index"""
+    cog = ctx.cog
+    if not isinstance(cog, AdminCog):
         return []
+    return cog.snippet_index.search(ctx.value or "")
+
+
+def _deletion_embed(category: discord.CategoryChannel, result: BulkResult) -> discord.Embed:
+    """Progress, and once finished the final report, of a category channel deletion"""
+    if result.finished is None:
+        embed = discord.Embed(
+            title="🗑️ Deleting Channels",
+            description=f"Deleting channels in **{category.name}**...",
+            color=0xFF8800,
+        )
+    else:
+        embed = discord.Embed(
+            title="✅ Channels Deleted" if not result.failures else "⚠️ Channels Partially Deleted",
+            description=f"Deleted {result.succeeded} channel(s) in {category.name}.",
+            color=0x00FF88 if not result.failures else 0xFFAA00,
+        )
+
+    embed.add_field(
+        name="📊 Progress",
+        value=f"**{result.done}/{result.total}** • {result.rate:.1f}/s • {result.elapsed:.1f}s",
+        inline=False,
+    )
+    if result.rate_limited:
+        embed.add_field(name="⏳ Rate Limited", value=f"{result.rate_limited} time(s)", inline=True)
+    if result.failures:
+        lines = [f"`#{ch.name}` {error}" for ch, error in result.failures[:10]]
+        if len(result.failures) > 10:
+            lines.append(f"... and {len(result.failures) - 10} more")
+        embed.add_field(
+            name=f"❌ Failed ({len(result.failures)})",
+            value="\n".join(lines)[:1024],
+            inline=False,
+        )
+    return embed
 
 
 class AdminCog(commands.Cog):
     def __init__(self, bot: discord.Bot):
         self.bot = bot
         self.snippets = {}
+        self.snippet_index = NameIndex([])
+        self.snippet_embeds = {}
+        self.snippets_list_embed = None
+        self.watcher = FileWatcher(
+            bot.registry.path("snippets"),
+            self.reload_snippets_file,
+            interval=config.CONFIG_WATCH_INTERVAL,
+        )
         self.load_snippets()
 
-    def load_snippets(self):
-        """Load snippets from YAML file"""
+    def cog_unload(self):
+        self.watcher.stop()
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        self.watcher.start()
+
+    def apply_snippets(self, snippet_set: SnippetSet):
+        for error in snippet_set.errors:
+            logger.error(f"Invalid snippet: {error}")
+
+        self.snippets = snippet_set.snippets
+        self.snippet_index = snippet_set.index
+        self.snippet_embeds = snippet_set.embeds
+        self.snippets_list_embed = snippet_set.list_embed
+        logger.info(f"✅ Loaded {len(snippet_set)} snippets")
+
+    def load_snippets(self) -> bool:
+        """Load snippets from the config registry, keeping the current ones on failure"""
         try:
-            with open("snippets.yml", "r", encoding="utf-8") as file:
-                self.snippets = yaml.safe_load(file) or {}
-                logger.info(f"✅ Loaded {len(self.snippets)} snippets")
-        except FileNotFoundError:
-            logger.warning("Snippets file not found, creating empty config")
-            self.snippets = {}
-        except yaml.YAMLError as e:
+            self.apply_snippets(self.bot.registry.load("snippets"))
+            return True
+        except ConfigError as e:
             logger.error(f"Failed to parse snippets YAML: {e}")
-            self.snippets = {}
+            return False
+
+    async def reload_snippets_file(self) -> bool:
+        """Like load_snippets, but parses off the event loop"""
+        try:
+            self.apply_snippets(await self.bot.registry.reload("snippets"))
+            return True
+        except ConfigError as e:
+            logger.error(
+                f"Failed to parse snippets YAML, keeping the last good version: {e}"
+            )
+            return False
 
     async def check_thread_permissions(self, ctx: discord.ApplicationContext) -> bool:
         """Check if user has permissions and command is in a thread"""
         if not (isinstance(ctx.author, discord.Member) and is_staff(ctx.author)):
-            error_embed = discord.Embed(
-                title="❌ Access Denied",
-                description="You don't have permission to use this command.",
-                color=0xFF4444,
-            )
-            error_embed.add_field(
-                name="Required Permissions", value="Staff role required", inline=False
-            )
-            await ctx.respond(embed=error_embed, ephemeral=True)
+            await ctx.respond(embed=THREAD_STAFF_ONLY.embed, ephemeral=True)
             return False
 
         channel = self.bot.get_channel(ctx.channel_id)
@@ -77,7 +139,8 @@ class AdminCog(commands.Cog):
 
         logger.debug(f"close command executed by {ctx.author.id}")
 
-        await ctx.defer()
+        with tracer.span("defer"):
+            await ctx.defer()
 
         channel = self.bot.get_channel(ctx.channel_id)
         thread = cast(discord.Thread, channel)
@@ -88,7 +151,8 @@ class AdminCog(commands.Cog):
             if len(new_name) > 70:
                 new_name = new_name[:70]
 
-            await thread.edit(name=f"{new_name} (CLOSED)", locked=True)
+            with tracer.span("edit"):
+                await thread.edit(name=f"{new_name} (CLOSED)", locked=True)
 
             embed = discord.Embed(
                 title="🔒 Thread Closed",
@@ -106,8 +170,10 @@ class AdminCog(commands.Cog):
                 icon_url=ctx.author.display_avatar.url,
             )
 
-            await ctx.followup.send(embed=embed)
-            await thread.archive()
+            with tracer.span("send"):
+                await ctx.followup.send(embed=embed)
+            with tracer.span("archive"):
+                await thread.archive()
 
         except discord.HTTPException as e:
             logger.error(f"Failed to close thread: {e}")
@@ -130,7 +196,8 @@ class AdminCog(commands.Cog):
 
         logger.debug(f"fixed command executed by {ctx.author.id}")
 
-        await ctx.defer()
+        with tracer.span("defer"):
+            await ctx.defer()
 
         channel = self.bot.get_channel(ctx.channel_id)
         thread = cast(discord.Thread, channel)
@@ -141,7 +208,8 @@ class AdminCog(commands.Cog):
             if len(new_name) > 70:
                 new_name = new_name[:70]
 
-            await thread.edit(name=f"{new_name} (FIXED)")
+            with tracer.span("edit"):
+                await thread.edit(name=f"{new_name} (FIXED)")
 
             embed = discord.Embed(
                 title="🔧 Thread Marked as Fixed",
@@ -164,7 +232,8 @@ class AdminCog(commands.Cog):
                 icon_url=ctx.author.display_avatar.url,
             )
 
-            await ctx.followup.send(embed=embed)
+            with tracer.span("send"):
+                await ctx.followup.send(embed=embed)
 
         except discord.HTTPException as e:
             logger.error(f"Failed to mark thread as fixed: {e}")
@@ -182,7 +251,8 @@ class AdminCog(commands.Cog):
 
         logger.debug(f"added command executed by {ctx.author.id}")
 
-        await ctx.defer()
+        with tracer.span("defer"):
+            await ctx.defer()
 
         channel = self.bot.get_channel(ctx.channel_id)
         thread = cast(discord.Thread, channel)
@@ -192,7 +262,8 @@ class AdminCog(commands.Cog):
             new_name = original_name
             if len(new_name) > 70:
                 new_name = new_name[:70]
-            await thread.edit(name=f"{new_name} (ADDED)")
+            with tracer.span("edit"):
+                await thread.edit(name=f"{new_name} (ADDED)")
 
             embed = discord.Embed(
                 title="➕ Client Added",
@@ -206,8 +277,10 @@ class AdminCog(commands.Cog):
             )
             embed.add_field(name="👤 Added by", value=ctx.author.mention, inline=True)
 
-            await ctx.followup.send(embed=embed)
-            await thread.archive()
+            with tracer.span("send"):
+                await ctx.followup.send(embed=embed)
+            with tracer.span("archive"):
+                await thread.archive()
 
         except discord.HTTPException as e:
             logger.error(f"Failed to mark thread as added: {e}")
@@ -243,11 +316,14 @@ class AdminCog(commands.Cog):
             text="Thread is now read-only", icon_url=ctx.author.display_avatar.url
         )
 
-        await ctx.respond(embed=embed)
+        with tracer.span("send"):
+            await ctx.respond(embed=embed)
 
         try:
-            await thread.edit(locked=True)
-            await thread.archive()
+            with tracer.span("edit"):
+                await thread.edit(locked=True)
+            with tracer.span("archive"):
+                await thread.archive()
         except discord.HTTPException as e:
             logger.error(f"Failed to lock thread: {e}")
 
@@ -260,16 +336,11 @@ class AdminCog(commands.Cog):
         name: discord.Option(
             str,
             description="Name of the snippet to send",
-            autocomplete=discord.utils.basic_autocomplete(get_snippets_list),
+            autocomplete=get_snippets_list,
         ), # type: ignore
     ):
         if not (isinstance(ctx.author, discord.Member) and is_staff(ctx.author)):
-            embed = discord.Embed(
-                title="❌ Access Denied",
-                description="You don't have permission to use this command.",
-                color=0xFF4444,
-            )
-            await ctx.respond(embed=embed, ephemeral=True)
+            await ctx.respond(embed=STAFF_ONLY.embed, ephemeral=True)
             return
 
         if name not in self.snippets:
@@ -286,35 +357,23 @@ class AdminCog(commands.Cog):
             await ctx.respond(embed=embed, ephemeral=True)
             return
 
-        snippet = self.snippets[name]
-
-        embed = discord.Embed(
-            title=snippet.get("title", f"📋 {name.title()}"),
-            description=snippet.get("content", "No content available"),
-            color=snippet.get("color", 0x00FF88),
-        )
-
-        embed.set_footer(
-            text=f"Snippet: {name} | Sent by {ctx.author.display_name}",
-            icon_url=ctx.author.display_avatar.url,
+        embed = self.snippet_embeds[name].render(
+            footer=f"Snippet: {name} | Sent by {ctx.author.display_name}",
+            footer_icon=ctx.author.display_avatar.url,
         )
 
-        await ctx.respond(embed=embed)
+        with tracer.span("send"):
+            await ctx.respond(embed=embed)
 
         logger.info(f"Snippet '{name}' sent by {ctx.author.id} in {ctx.channel_id}")
 
     @commands.slash_command(name="snippets", description="List all available snippets")
     async def snippets_list(self, ctx: discord.ApplicationContext):
         if not (isinstance(ctx.author, discord.Member) and is_staff(ctx.author)):
-            embed = discord.Embed(
-                title="❌ Access Denied",
-                description="You don't have permission to use this command.",
-                color=0xFF4444,
-            )
-            await ctx.respond(embed=embed, ephemeral=True)
+            await ctx.respond(embed=STAFF_ONLY.embed, ephemeral=True)
             return
 
-        if not self.snippets:
+        if self.snippets_list_embed is None:
             embed = discord.Embed(
                 title="📋 No Snippets Available",
                 description="No snippets have been configured yet.",
@@ -323,46 +382,28 @@ class AdminCog(commands.Cog):
             await ctx.respond(embed=embed, ephemeral=True)
             return
 
-        embed = discord.Embed(
-            title="📋 Available Snippets",
-            description="Here are all the available snippet commands:",
-            color=0x00FF88,
-        )
-
-        snippet_list = []
-        for snippet_name, snippet_data in self.snippets.items():
-            title = snippet_data.get("title", snippet_name.title())
-            snippet_list.append(f"`{snippet_name}` - {title}")
-
-        chunk_size = 10
-        chunks = [
-            snippet_list[i : i + chunk_size]
-            for i in range(0, len(snippet_list), chunk_size)
-        ]
-
-        for i, chunk in enumerate(chunks):
-            field_name = "Snippets" if i == 0 else f"Snippets (continued {i+1})"
-            embed.add_field(name=field_name, value="\n".join(chunk), inline=False)
-
-        embed.set_footer(text="Use /snippet <name> to send a snippet")
-        await ctx.respond(embed=embed, ephemeral=True)
+        await ctx.respond(embed=self.snippets_list_embed.embed, ephemeral=True)
 
     @commands.slash_command(
         name="reload_snippets", description="Reload snippets from file"
     )
     async def reload_snippets(self, ctx: discord.ApplicationContext):
         if ctx.author.id != config.ADMIN_USER_ID:
+            await ctx.respond(embed=MAIN_ADMIN_ONLY.embed, ephemeral=True)
+            return
+
+        with tracer.span("defer"):
+            await ctx.defer()
+        old_count = len(self.snippets)
+        if not await self.reload_snippets_file():
             embed = discord.Embed(
-                title="❌ Access Denied",
-                description="This command is only available to the main administrator.",
+                title="❌ Reload Failed",
+                description="Failed to parse the snippets file, the last good version is still in use.",
                 color=0xFF4444,
             )
-            await ctx.respond(embed=embed, ephemeral=True)
+            with tracer.span("send"):
+                await ctx.followup.send(embed=embed)
             return
-
-        await ctx.defer()
-        old_count = len(self.snippets)
-        self.load_snippets()
         new_count = len(self.snippets)
 
         embed = discord.Embed(
@@ -377,7 +418,8 @@ class AdminCog(commands.Cog):
         )
         embed.set_footer(text=f"Reloaded by {ctx.author}")
 
-        await ctx.followup.send(embed=embed)
+        with tracer.span("send"):
+            await ctx.followup.send(embed=embed)
 
     @commands.slash_command(
         name="delete_category_channels",
@@ -387,12 +429,7 @@ class AdminCog(commands.Cog):
         self, ctx: discord.ApplicationContext, category: discord.CategoryChannel
     ):
         if ctx.author.id != config.ADMIN_USER_ID:
-            embed = discord.Embed(
-                title="❌ Access Denied",
-                description="This command is only available to the main administrator.",
-                color=0xFF4444,
-            )
-            await ctx.respond(embed=embed, ephemeral=True)
+            await ctx.respond(embed=MAIN_ADMIN_ONLY.embed, ephemeral=True)
             return
 
         if not category.channels:
@@ -422,35 +459,44 @@ class AdminCog(commands.Cog):
             async def confirm(
                 self, button: discord.ui.Button, interaction: discord.Interaction
             ):
-                await interaction.response.defer(ephemeral=True)
-                deleted_count = 0
-                for ch in list(category.channels):
-                    try:
-                        await ch.delete()
-                        deleted_count += 1
-                    except Exception as e:
-                        logger.error(f"Failed to delete channel {ch.id}: {e}")
-
                 for child in self.children:
                     try:
                         setattr(child, "disabled", True)
                     except Exception:
                         pass
-                if interaction.message is not None:
-                    try:
-                        await interaction.message.edit(view=self)
-                    except Exception:
-                        pass
 
-                embed = discord.Embed(
-                    title="✅ Channels Deleted",
-                    description=f"Deleted {deleted_count} channel(s) in {category.name}.",
-                    color=0x00FF88,
-                )
-                await interaction.followup.send(embed=embed, ephemeral=True)
                 self._confirmed = True
+                channels = list(category.channels)
+                await interaction.response.edit_message(
+                    embed=_deletion_embed(category, BulkResult(len(channels))), view=self
+                )
+
+                async def show_progress(result: BulkResult):
+                    await interaction.edit_original_response(
+                        embed=_deletion_embed(category, result)
+                    )
+
+                result = await run_bulk(
+                    channels,
+                    lambda ch: ch.delete(),
+                    concurrency=config.BULK_DELETE_CONCURRENCY,
+                    on_progress=show_progress,
+                    progress_interval=config.BULK_PROGRESS_INTERVAL,
+                )
+                for ch, error in result.failures:
+                    logger.error(f"Failed to delete channel {ch.id}: {error}")
+
+                try:
+                    await interaction.edit_original_response(
+                        embed=_deletion_embed(category, result)
+                    )
+                except discord.HTTPException:
+                    await interaction.followup.send(
+                        embed=_deletion_embed(category, result), ephemeral=True
+                    )
                 logger.info(
-                    f"User {ctx.author.id} confirmed deletion of {deleted_count} channels in category {category.id}"
+                    f"User {ctx.author.id} confirmed deletion of {result.succeeded} channels in category {category.id} "
+                    f"({len(result.failures)} failed, {result.rate:.1f}/s, {result.rate_limited} rate limits)"
                 )
                 self.stop()
 
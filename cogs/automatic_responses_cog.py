@@ -1,134 +1,157 @@
+import asyncio
 import random
 import time
-from datetime import datetime
-from typing import Dict
+from functools import partial
 
 import discord
-import yaml
 from discord.ext import commands
 from loguru import logger
 
 import config
+from utils.cooldowns import CooldownStore
+from utils.embeds import MAIN_ADMIN_ONLY_RU, STAFF_ONLY_RU
 from utils.helpers import is_staff
+from utils.metrics import metrics
+from utils.outbound import OutboundReply, ReplyScheduler
+from utils.persistence import DebouncedYAMLWriter
+from utils.ratelimits import SlidingWindowLimiter
+from utils.registry import ConfigError
+from utils.response_templates import ResponseTemplate
+from utils.rules import AutomaticResponse, Ruleset
+from utils.tracing import tracer
+from utils.watcher import FileWatcher
 
 
 class AutomaticResponsesCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.automatic_responses: Dict = {}
-        self.user_cooldowns: Dict[str, float] = {}
+        self.ruleset = Ruleset({})
+        self.cooldowns = CooldownStore(config.COOLDOWN_STORE_MAX_SIZE)
+        self.rate_limits = SlidingWindowLimiter(config.COOLDOWN_STORE_MAX_SIZE)
+        self.replies = ReplyScheduler(
+            global_rate=config.OUTBOUND_GLOBAL_RATE,
+            global_burst=config.OUTBOUND_GLOBAL_BURST,
+            channel_rate=config.OUTBOUND_CHANNEL_RATE,
+            channel_burst=config.OUTBOUND_CHANNEL_BURST,
+            max_pending=config.OUTBOUND_MAX_PENDING,
+            flood_threshold=config.OUTBOUND_FLOOD_THRESHOLD,
+            max_age=config.OUTBOUND_MAX_AGE,
+        )
+        self.watcher = FileWatcher(
+            bot.registry.path("automatic_responses"),
+            self.reload_automatic_responses_file,
+            interval=config.CONFIG_WATCH_INTERVAL,
+        )
+        self.writer = DebouncedYAMLWriter(
+            bot.registry.path("automatic_responses"),
+            lambda: self.ruleset.raw,
+            delay=config.SAVE_DEBOUNCE_DELAY,
+        )
         self.load_automatic_responses()
 
-    def load_automatic_responses(self):
-        """Load automatic responses from YAML file"""
+    def cog_unload(self):
+        self.watcher.stop()
+        self.writer.flush()
+        self.replies.close()
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        self.watcher.start()
+
+    def apply_ruleset(self, ruleset: Ruleset):
+        """Atomically replace the active ruleset"""
+        for error in ruleset.errors:
+            logger.error(f"Invalid automatic response rule: {error}")
+        for warning in ruleset.warnings:
+            logger.warning(f"Automatic response rule: {warning}")
+
+        self.ruleset = ruleset
+        logger.info(f"✅ Loaded {len(ruleset)} automatic responses")
+
+    def load_automatic_responses(self) -> bool:
+        """Load automatic responses from the config registry, keeping the current ones on failure"""
         try:
-            with open("automatic_responses.yml", "r", encoding="utf-8") as file:
-                self.automatic_responses = yaml.safe_load(file) or {}
-                logger.info(
-                    f"✅ Loaded {len(self.automatic_responses)} automatic responses"
-                )
-        except FileNotFoundError:
-            logger.warning("Automatic responses file not found, creating empty config")
-            self.automatic_responses = {}
-        except yaml.YAMLError as e:
+            self.apply_ruleset(self.bot.registry.load("automatic_responses"))
+            return True
+        except ConfigError as e:
             logger.error(f"Failed to parse automatic responses YAML: {e}")
-            self.automatic_responses = {}
+            return False
 
-    def save_automatic_responses(self):
-        """Save automatic responses to YAML file"""
+    async def reload_automatic_responses_file(self) -> bool:
+        """Like load_automatic_responses, but parses and compiles off the event loop"""
         try:
-            with open("automatic_responses.yml", "w", encoding="utf-8") as file:
-                yaml.dump(
-                    self.automatic_responses,
-                    file,
-                    default_flow_style=False,
-                    allow_unicode=True,
-                )
-                logger.info("Automatic responses saved successfully")
-                return True
-        except Exception as e:
-            logger.error(f"Failed to save automatic responses: {e}")
+            self.apply_ruleset(await self.bot.registry.reload("automatic_responses"))
+            return True
+        except ConfigError as e:
+            logger.error(
+                f"Failed to parse automatic responses YAML, keeping the last good version: {e}"
+            )
             return False
 
-    def check_conditions(self, response_data: Dict, message: discord.Message) -> bool:
+    def save_automatic_responses(self) -> "asyncio.Future[bool]":
+        """Schedule a debounced, atomic save; the future resolves once it is on disk"""
+        return self.writer.save()
+
+    def check_conditions(
+        self, rule: AutomaticResponse, message: discord.Message
+    ) -> bool:
         """Check if response conditions are met"""
-        conditions = response_data.get("conditions", {})
-
-        channel_types = conditions.get("channel_types", ["any"])
-        if "any" not in channel_types:
-            if (
-                isinstance(message.channel, discord.Thread)
-                and "thread" not in channel_types
-            ):
-                return False
-            if (
-                isinstance(message.channel, discord.TextChannel)
-                and "text" not in channel_types
-            ):
-                return False
-            if (
-                isinstance(message.channel, discord.DMChannel)
-                and "dm" not in channel_types
-            ):
-                return False
+        if rule.blocked_channels and isinstance(message.channel, rule.blocked_channels):
+            return False
 
-        probability = conditions.get("probability", 1.0)
-        if random.random() > probability:
+        if rule.probability < 1.0 and random.random() > rule.probability:
             return False
 
-        required_keywords = conditions.get("require_keywords", [])
-        if required_keywords:
+        if rule.require_keywords:
             message_lower = message.content.lower()
-            if not any(
-                keyword.lower() in message_lower for keyword in required_keywords
-            ):
+            if not any(keyword in message_lower for keyword in rule.require_keywords):
                 return False
 
         return True
 
     def check_cooldown(
-        self, response_name: str, user_id: int, cooldown_duration: int
+        self, response_name: str, user_id: int, cooldown_duration: float
     ) -> bool:
         """Check if user is on cooldown for specific response"""
-        cooldown_key = f"{response_name}_{user_id}"
-        current_time = time.time()
-
-        if cooldown_key in self.user_cooldowns:
-            if current_time - self.user_cooldowns[cooldown_key] < cooldown_duration:
-                return True
-
-        self.user_cooldowns[cooldown_key] = current_time
-        return False
-
-    def format_response(self, response: str, message: discord.Message) -> str:
-        """Format response with placeholders"""
-        user = message.author
-        guild = message.guild
-
-        placeholders = {
-            "user": user.display_name,
-            "mention": user.mention,
-            "username": user.name,
-            "server": guild.name if guild else "DM",
-            "channel": (getattr(message.channel, "name", None) or "DM"),
-            "time": datetime.now().strftime("%H:%M"),
-            "date": datetime.now().strftime("%d.%m.%Y"),
+        return self.cooldowns.hit((response_name, user_id), cooldown_duration)
+
+    def rate_limit_keys(self, rule: AutomaticResponse, message: discord.Message):
+        """Counter keys for each of the rule's scoped rate limits"""
+        scope_ids = {
+            "user": message.author.id,
+            "channel": message.channel.id,
+            "guild": message.guild.id if message.guild else message.channel.id,
+            "global": 0,
         }
+        return [
+            ((rule.name, limit.scope, scope_ids[limit.scope]), limit)
+            for limit in rule.rate_limits
+        ]
 
-        formatted_response = response
-        for placeholder, value in placeholders.items():
-            formatted_response = formatted_response.replace(
-                f"{{{placeholder}}}", str(value)
-            )
-
-        return formatted_response
+    def format_response(
+        self, response: ResponseTemplate, message: discord.Message
+    ) -> str:
+        """Format response with placeholders"""
+        return response.render(message)
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
+        if not metrics.enabled:
+            await self.handle_message(message)
+            return
+
+        started = time.perf_counter()
+        try:
+            await self.handle_message(message)
+        finally:
+            metrics.on_message_seconds.observe(time.perf_counter() - started)
+
+    async def handle_message(self, message: discord.Message):
         if message.author.bot:
             return
 
-        if not self.automatic_responses:
+        ruleset = self.ruleset
+        if not ruleset.rules:
             return
 
         if (
@@ -139,62 +162,79 @@ class AutomaticResponsesCog(commands.Cog):
 
         message_content = message.content.lower()
 
-        for response_name, response_data in self.automatic_responses.items():
-            if not response_data.get("enabled", True):
+        for rule_index in ruleset.matcher.match(message_content):
+            rule = ruleset.rules[rule_index]
+            if not rule.enabled:
                 continue
 
-            triggers = response_data.get("triggers", [])
-            if not any(trigger.lower() in message_content for trigger in triggers):
+            if not self.check_conditions(rule, message):
                 continue
 
-            if not self.check_conditions(response_data, message):
+            limit_keys = self.rate_limit_keys(rule, message) if rule.rate_limits else None
+            if limit_keys and not self.rate_limits.check(limit_keys):
                 continue
 
-            cooldown = response_data.get("conditions", {}).get("cooldown", 30)
-            if self.check_cooldown(response_name, message.author.id, cooldown):
+            if self.check_cooldown(rule.name, message.author.id, rule.cooldown):
                 continue
 
-            responses = response_data.get("responses", [])
-            if not responses:
-                continue
+            if limit_keys:
+                self.rate_limits.record(limit_keys)
 
-            selected_response = random.choice(responses)
+            selected_response = random.choice(rule.responses)
             formatted_response = self.format_response(selected_response, message)
 
-            try:
-                delete_trigger = response_data.get("conditions", {}).get(
-                    "delete_trigger", False
+            self.replies.submit(
+                OutboundReply(
+                    message.channel.id,
+                    partial(self.send_reply, message, formatted_response, rule.delete_trigger),
+                    priority=rule.priority,
+                    key=rule.name,
                 )
-                if delete_trigger:
-                    try:
-                        await message.delete()
-                    except:
-                        pass
+            )
+            if metrics.enabled:
+                metrics.rule_matches.inc(rule.name)
 
-                await message.reply(formatted_response)
+            logger.debug(
+                f"Automatic response '{rule.name}' triggered by {message.author.id}"
+            )
+            break
 
-                logger.debug(
-                    f"Automatic response '{response_name}' triggered by {message.author.id}"
-                )
-                break
+    async def delete_trigger(self, message: discord.Message):
+        """Delete a trigger message, issued alongside its reply"""
+        try:
+            await message.delete()
+        except discord.HTTPException as e:
+            logger.debug(f"Failed to delete trigger message {message.id}: {e}")
 
-            except discord.HTTPException as e:
-                logger.error(f"Failed to send automatic response: {e}")
+    async def send_reply(
+        self, message: discord.Message, content: str, delete_trigger: bool
+    ):
+        """Reply to ``message``, deleting it at the same time if the rule asks for that.
+
+        Runs only when the scheduler actually sends the reply, so a merged,
+        dropped or expired reply never costs the user their message.
+        """
+        if not delete_trigger:
+            await message.reply(content)
+            return
+        # The reference tolerates the trigger being gone by the time the reply lands
+        await asyncio.gather(
+            message.channel.send(
+                content, reference=message.to_reference(fail_if_not_exists=False)
+            ),
+            self.delete_trigger(message),
+        )
 
     @commands.slash_command(
         name="automatic_responses", description="Управление автоматическими ответами"
     )
     async def automatic_responses_cmd(self, ctx: discord.ApplicationContext):
         if not (isinstance(ctx.author, discord.Member) and is_staff(ctx.author)):
-            embed = discord.Embed(
-                title="❌ Доступ запрещен",
-                description="Эта команда доступна только персоналу.",
-                color=0xFF4444,
-            )
-            await ctx.respond(embed=embed, ephemeral=True)
+            await ctx.respond(embed=STAFF_ONLY_RU.embed, ephemeral=True)
             return
 
-        await ctx.defer()
+        with tracer.span("defer"):
+            await ctx.defer()
 
         embed = discord.Embed(
             title="🧠 Автоматические Ответы",
@@ -202,20 +242,20 @@ class AutomaticResponsesCog(commands.Cog):
             color=0x00FF88,
         )
 
-        enabled_responses = [
-            name
-            for name, data in self.automatic_responses.items()
-            if data.get("enabled", True)
-        ]
-        disabled_responses = [
-            name
-            for name, data in self.automatic_responses.items()
-            if not data.get("enabled", True)
-        ]
+        rules = self.ruleset.rules
+        enabled_responses = [rule.name for rule in rules if rule.enabled]
+        disabled_responses = [rule.name for rule in rules if not rule.enabled]
 
         embed.add_field(
             name="📊 Статистика",
-            value=f"**Всего:** {len(self.automatic_responses)}\n**Включено:** {len(enabled_responses)}\n**Отключено:** {len(disabled_responses)}",
+            value=f"**Всего:** {len(rules)}\n**Включено:** {len(enabled_responses)}\n**Отключено:** {len(disabled_responses)}",
+            inline=True,
+        )
+
+        cooldown_stats = self.cooldowns.stats()
+        embed.add_field(
+            name="🧊 Кулдауны",
+            value=f"**Записей:** {cooldown_stats['size']:,} / {cooldown_stats['max_size']:,}\n**Истекло:** {cooldown_stats['expired']:,}\n**Вытеснено:** {cooldown_stats['evicted']:,}\n**Лимитов сработало:** {self.rate_limits.limited:,}",
             inline=True,
         )
 
@@ -235,7 +275,8 @@ class AutomaticResponsesCog(commands.Cog):
 
         embed.set_footer(text="Используйте команды управления для настройки")
 
-        await ctx.followup.send(embed=embed)
+        with tracer.span("send"):
+            await ctx.followup.send(embed=embed)
 
     @commands.slash_command(
         name="toggle_automatic_response",
@@ -247,33 +288,35 @@ class AutomaticResponsesCog(commands.Cog):
         name: discord.Option(str, description="Название ответа для переключения"),  # type: ignore
     ):
         if ctx.author.id != config.ADMIN_USER_ID:
-            embed = discord.Embed(
-                title="❌ Доступ запрещен",
-                description="Эта команда доступна только главному администратору.",
-                color=0xFF4444,
-            )
-            await ctx.respond(embed=embed, ephemeral=True)
+            await ctx.respond(embed=MAIN_ADMIN_ONLY_RU.embed, ephemeral=True)
             return
 
-        await ctx.defer()
+        with tracer.span("defer"):
+            await ctx.defer()
 
-        if name not in self.automatic_responses:
+        ruleset = self.ruleset
+        if name not in ruleset.by_name:
             embed = discord.Embed(
                 title="❌ Ответ не найден",
                 description=f"Автоматический ответ `{name}` не существует.",
                 color=0xFF4444,
             )
-            available = ", ".join([f"`{n}`" for n in self.automatic_responses.keys()])
+            available = ", ".join([f"`{n}`" for n in ruleset.by_name.keys()])
             if available:
                 embed.add_field(name="Доступные ответы", value=available, inline=False)
             await ctx.followup.send(embed=embed, ephemeral=True)
             return
 
-        old_status = self.automatic_responses[name].get("enabled", True)
-        self.automatic_responses[name]["enabled"] = not old_status
-        new_status = self.automatic_responses[name]["enabled"]
+        rule = ruleset.by_name[name]
+        old_status = rule.enabled
+        new_status = not old_status
+        ruleset.raw[name]["enabled"] = new_status
+        rule.enabled = new_status
 
-        if self.save_automatic_responses():
+        with tracer.span("save"):
+            saved = await self.save_automatic_responses()
+
+        if saved:
             embed = discord.Embed(
                 title="🔄 Статус изменен",
                 description=f"Автоматический ответ `{name}` {'включен' if new_status else 'отключен'}",
@@ -291,7 +334,8 @@ class AutomaticResponsesCog(commands.Cog):
                 color=0xFF4444,
             )
 
-        await ctx.followup.send(embed=embed)
+        with tracer.span("send"):
+            await ctx.followup.send(embed=embed)
 
     @commands.slash_command(
         name="reload_automatic_responses",
@@ -299,19 +343,23 @@ class AutomaticResponsesCog(commands.Cog):
     )
     async def reload_automatic_responses(self, ctx: discord.ApplicationContext):
         if ctx.author.id != config.ADMIN_USER_ID:
+            await ctx.respond(embed=MAIN_ADMIN_ONLY_RU.embed, ephemeral=True)
+            return
+
+        with tracer.span("defer"):
+            await ctx.defer()
+
+        old_count = len(self.ruleset)
+        if not await self.reload_automatic_responses_file():
             embed = discord.Embed(
-                title="❌ Доступ запрещен",
-                description="Эта команда доступна только главному администратору.",
+                title="❌ Ошибка загрузки",
+                description="Не удалось разобрать файл, используется последняя рабочая версия.",
                 color=0xFF4444,
             )
-            await ctx.respond(embed=embed, ephemeral=True)
+            with tracer.span("send"):
+                await ctx.followup.send(embed=embed)
             return
-
-        await ctx.defer()
-
-        old_count = len(self.automatic_responses)
-        self.load_automatic_responses()
-        new_count = len(self.automatic_responses)
+        new_count = len(self.ruleset)
 
         embed = discord.Embed(
             title="🔄 Автоматические ответы перезагружены",
@@ -325,7 +373,8 @@ class AutomaticResponsesCog(commands.Cog):
         )
         embed.set_footer(text=f"Перезагружено {ctx.author}")
 
-        await ctx.followup.send(embed=embed)
+        with tracer.span("send"):
+            await ctx.followup.send(embed=embed)
 
 
 def setup(bot: discord.Bot):
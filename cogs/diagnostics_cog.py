@@ -0,0 +1,149 @@
+import discord
+from discord.ext import commands
+from loguru import logger
+
+from utils.embeds import ADMIN_ONLY, STAFF_ONLY
+from utils.helpers import get_rss_mb, is_admin, is_staff
+from utils.memory import cache_sizes, format_location, format_size, profiler
+from utils.tracing import tracer
+
+
+def _format_rows(rows, with_phase: bool) -> str:
+    lines = []
+    for command, phase, samples, p50, p99 in rows:
+        label = f"/{command} › {phase}" if with_phase else f"/{command}"
+        lines.append(
+            f"`{label}` p50 **{p50 * 1000:.0f}ms** • p99 **{p99 * 1000:.0f}ms** • n={samples}"
+        )
+    value = "\n".join(lines)
+    return value if len(value) <= 1024 else value[:1021] + "..."
+
+
+def _format_allocations(stats) -> str:
+    lines = [
+        f"`{format_location(stat)}` **{format_size(stat.size_diff)}** ({stat.count_diff:+} blocks)"
+        for stat in stats
+    ]
+    value = "\n".join(lines)
+    return value if len(value) <= 1024 else value[:1021] + "..."
+
+
+class DiagnosticsCog(commands.Cog):
+    def __init__(self, bot: discord.Bot):
+        self.bot = bot
+
+    def cog_unload(self):
+        profiler.stop()
+
+    @commands.slash_command(name="perf", description="Show the slowest commands and phases")
+    async def perf(self, ctx: discord.ApplicationContext):
+        if not (isinstance(ctx.author, discord.Member) and is_staff(ctx.author)):
+            await ctx.respond(embed=STAFF_ONLY.embed, ephemeral=True)
+            return
+
+        logger.debug(f"perf command executed by {ctx.author.id}")
+
+        embed = discord.Embed(
+            title="⏱️ Command Performance",
+            description=f"Rolling percentiles over the last {tracer.window} invocations",
+            color=0x5865F2,
+        )
+
+        commands_rows = tracer.slowest(limit=10)
+        phase_rows = tracer.slowest(limit=10, phases=True)
+        if not commands_rows:
+            embed.description = "No commands have been traced yet."
+
+        if commands_rows:
+            embed.add_field(
+                name="🐢 Slowest Commands",
+                value=_format_rows(commands_rows, with_phase=False),
+                inline=False,
+            )
+        if phase_rows:
+            embed.add_field(
+                name="🔍 Slowest Phases",
+                value=_format_rows(phase_rows, with_phase=True),
+                inline=False,
+            )
+
+        embed.set_footer(text="Staff Only")
+        await ctx.respond(embed=embed, ephemeral=True)
+
+    @commands.slash_command(name="memory", description="Inspect the bot's memory usage")
+    async def memory(
+        self,
+        ctx: discord.ApplicationContext,
+        action: discord.Option(
+            str,
+            description="status shows cache sizes; start/snapshot/stop control a tracemalloc capture",
+            choices=["status", "start", "snapshot", "stop"],
+            default="status",
+        ),  # type: ignore
+        log_interval: discord.Option(
+            int,
+            description="With start: also log the top allocations every N minutes",
+            min_value=1,
+            required=False,
+        ),  # type: ignore
+    ):
+        if not is_admin(ctx.author.id):
+            await ctx.respond(embed=ADMIN_ONLY.embed, ephemeral=True)
+            return
+
+        logger.debug(f"memory {action} executed by {ctx.author.id}")
+
+        embed = discord.Embed(title="🧠 Memory", color=0x5865F2)
+        embed.add_field(name="📦 RSS", value=f"**{get_rss_mb():.1f}** MB", inline=True)
+
+        if action == "start":
+            started = profiler.start()
+            if started and log_interval:
+                profiler.log_every(log_interval * 60)
+            embed.description = (
+                "Capture started, allocations are now traced against a baseline."
+                if started
+                else "A capture is already running."
+            )
+            if started and log_interval:
+                embed.description += f" Logging the top sites every {log_interval} min."
+        elif action in ("snapshot", "stop"):
+            if not profiler.active:
+                embed.description = "No capture is running, use `start` first."
+            else:
+                await ctx.defer(ephemeral=True)
+                with tracer.span("snapshot"):
+                    stats = await profiler.diff(limit=10)
+                traced = profiler.traced()
+                embed.add_field(
+                    name="🔬 Traced",
+                    value=f"**{traced['current'] / 2**20:.1f}** MB (peak {traced['peak'] / 2**20:.1f} MB)",
+                    inline=True,
+                )
+                embed.add_field(
+                    name="📈 Top Allocation Sites Since Start",
+                    value=_format_allocations(stats) if stats else "No growth since the baseline.",
+                    inline=False,
+                )
+                if action == "stop":
+                    profiler.stop()
+                    embed.description = "Capture stopped, tracing overhead removed."
+        else:
+            embed.description = (
+                "A capture is running." if profiler.active else "No capture is running."
+            )
+
+        sizes = cache_sizes(self.bot)
+        embed.add_field(
+            name="🗃️ Cache Sizes",
+            value="\n".join(f"`{name}` **{count:,}**" for name, count in sizes.items()),
+            inline=False,
+        )
+
+        embed.set_footer(text="Admin Only")
+        with tracer.span("send"):
+            await ctx.respond(embed=embed, ephemeral=True)
+
+
+def setup(bot: discord.Bot):
+    bot.add_cog(DiagnosticsCog(bot))
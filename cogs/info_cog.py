@@ -1,84 +1,45 @@
+import asyncio
 import time
-from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import discord
-import requests
 from discord.ext import commands
 from loguru import logger
 
 import config
+from utils.catalog import Client
+from utils.embeds import ADMIN_ONLY, SOCIALS, bot_avatar
+from utils.gateway import fetch_member
 from utils.helpers import get_emoji, get_uptime_string
+from utils.tracing import tracer
 
 
-@dataclass
-class Client:
-    """Client data structure matching API response."""
-    id: int
-    name: str
-    version: str
-    filename: str
-    md5_hash: str
-    size: int
-    main_class: str
-    show: bool
-    working: bool
-    launches: int
-    downloads: int
-    client_type: str
-    created_at: str
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "Client":
-        """Create Client instance from dictionary."""
-        return cls(
-            id=data.get("id", 0),
-            name=data.get("name", ""),
-            version=data.get("version", ""),
-            filename=data.get("filename", ""),
-            md5_hash=data.get("md5_hash", ""),
-            size=data.get("size", 0),
-            main_class=data.get("main_class", ""),
-            show=data.get("show", False),
-            working=data.get("working", False),
-            launches=data.get("launches", 0),
-            downloads=data.get("downloads", 0),
-            client_type=data.get("client_type", "default"),
-            created_at=data.get("created_at", ""),
-        )
+def get_clients(ctx: discord.AutocompleteContext):
+    """Get ranked client names from the catalog index for autocomplete"""
+    return ctx.bot.catalog.name_index("clients").search(ctx.value or "")
 
 
 class InfoCog(commands.Cog):
     def __init__(self, bot: discord.Bot):
         self.bot = bot
+        self._stats_embed: Optional[Tuple[Tuple[int, int], discord.Embed]] = None
 
-    def _fetch_clients(self, endpoint: str = "clients") -> Optional[List[Client]]:
-        """Fetch and parse clients from the API endpoint."""
-        try:
-            response = requests.get(
-                f"{config.API_BASE_URL}/api/v1/{endpoint}",
-                headers={"User-Agent": "CollapseBot"},
-                timeout=10,
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            if isinstance(data, dict) and "data" in data:
-                clients_data = data["data"]
-            elif isinstance(data, list):
-                clients_data = data
-            else:
-                logger.error(f"Unexpected API response format: {type(data)}")
-                return None
-            
-            return [Client.from_dict(client) for client in clients_data]
-        except requests.RequestException as e:
-            logger.error(f"Failed to fetch clients from {endpoint}: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Error parsing client data: {e}")
-            return None
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        self.bot.stats.guild_joined(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.bot.stats.guild_left(guild)
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self.bot.stats.member_joined()
+
+    @commands.Cog.listener()
+    async def on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent):
+        if self.bot.get_guild(payload.guild_id) is not None:
+            self.bot.stats.member_left()
 
     def _create_clients_embed(self, clients: List[Client], title: str, emoji: str = "clients") -> discord.Embed:
         """Create an embed for displaying clients list."""
@@ -89,12 +50,15 @@ class InfoCog(commands.Cog):
         )
 
         if clients:
-            regular_list = "\n".join(
-                [
-                    f"{'🔒' if not client.show else '🟢'} **{client.name}** `{client.version}`"
-                    for client in clients
-                ]
-            )
+            # Only as many lines as can show up in the 1024 character field
+            lines, length = [], -1
+            for client in clients:
+                line = f"{'🔒' if not client.show else '🟢'} **{client.name}** `{client.version}`"
+                lines.append(line)
+                length += len(line) + 1
+                if length > 1024:
+                    break
+            regular_list = "\n".join(lines)
             embed.add_field(
                 name="Clients",
                 value=(
@@ -125,89 +89,101 @@ class InfoCog(commands.Cog):
     @commands.slash_command(name="clients", description="Get list of all clients")
     async def clients(self, ctx: discord.ApplicationContext):
         logger.debug(f"clients command executed")
-        await ctx.defer()
+        clients = self.bot.catalog.get("clients")
+        if clients is None:
+            with tracer.span("defer"):
+                await ctx.defer()
+            with tracer.span("fetch"):
+                clients = await self.bot.catalog.fetch("clients")
 
-        clients = self._fetch_clients("clients")
         if clients is None:
             error_embed = discord.Embed(
                 title="❌ Error",
                 description="Failed to fetch client data. Please try again later.",
                 color=0xFF4444,
             )
-            await ctx.followup.send(embed=error_embed, ephemeral=True)
+            await ctx.respond(embed=error_embed, ephemeral=True)
             return
 
-        embed = self._create_clients_embed(clients, "Client Library")
-        await ctx.followup.send(embed=embed)
+        with tracer.span("embed"):
+            embed = self._create_clients_embed(clients, "Client Library")
+        with tracer.span("send"):
+            await ctx.respond(embed=embed)
 
     @commands.slash_command(name="fabric-clients", description="Get list of Fabric clients")
     async def fabric_clients(self, ctx: discord.ApplicationContext):
         logger.debug(f"fabric-clients command executed")
-        await ctx.defer()
+        clients = self.bot.catalog.get("fabric-clients")
+        if clients is None:
+            with tracer.span("defer"):
+                await ctx.defer()
+            with tracer.span("fetch"):
+                clients = await self.bot.catalog.fetch("fabric-clients")
 
-        clients = self._fetch_clients("fabric-clients")
         if clients is None:
             error_embed = discord.Embed(
                 title="❌ Error",
                 description="Failed to fetch Fabric client data. Please try again later.",
                 color=0xFF4444,
             )
-            await ctx.followup.send(embed=error_embed, ephemeral=True)
+            await ctx.respond(embed=error_embed, ephemeral=True)
             return
 
-        embed = self._create_clients_embed(clients, "Fabric Client Library", "clients")
-        await ctx.followup.send(embed=embed)
+        with tracer.span("embed"):
+            embed = self._create_clients_embed(clients, "Fabric Client Library", "clients")
+        with tracer.span("send"):
+            await ctx.respond(embed=embed)
 
     @commands.slash_command(name="forge-clients", description="Get list of Forge clients")
     async def forge_clients(self, ctx: discord.ApplicationContext):
         logger.debug(f"forge-clients command executed")
-        await ctx.defer()
+        clients = self.bot.catalog.get("forge-clients")
+        if clients is None:
+            with tracer.span("defer"):
+                await ctx.defer()
+            with tracer.span("fetch"):
+                clients = await self.bot.catalog.fetch("forge-clients")
 
-        clients = self._fetch_clients("forge-clients")
         if clients is None:
             error_embed = discord.Embed(
                 title="❌ Error",
                 description="Failed to fetch Forge client data. Please try again later.",
                 color=0xFF4444,
             )
-            await ctx.followup.send(embed=error_embed, ephemeral=True)
+            await ctx.respond(embed=error_embed, ephemeral=True)
             return
 
-        embed = self._create_clients_embed(clients, "Forge Client Library", "clients")
-        await ctx.followup.send(embed=embed)
-
-    def get_clients(self):
-        """Fetch the list of clients from the API."""
-        return config.CLIENTS
+        with tracer.span("embed"):
+            embed = self._create_clients_embed(clients, "Forge Client Library", "clients")
+        with tracer.span("send"):
+            await ctx.respond(embed=embed)
 
     @commands.slash_command(name="client", description="Get information about client")
     async def client_cmd(
         self,
         ctx: discord.ApplicationContext,
-        client: discord.Option(str, description="Client to get information about", autocomplete=discord.utils.basic_autocomplete(get_clients)), # type: ignore
+        client: discord.Option(str, description="Client to get information about", autocomplete=get_clients), # type: ignore
     ):
         logger.debug(f"client command executed")
-        await ctx.defer()
+        clients = self.bot.catalog.get("clients")
+        if clients is None:
+            with tracer.span("defer"):
+                await ctx.defer()
+            with tracer.span("fetch"):
+                clients = await self.bot.catalog.fetch("clients")
 
-        clients = self._fetch_clients("clients")
         if clients is None:
             error_embed = discord.Embed(
                 title="❌ Network Error",
                 description="Failed to fetch client data. Please try again later.",
                 color=0xFF4444,
             )
-            await ctx.followup.send(embed=error_embed, ephemeral=True)
+            await ctx.respond(embed=error_embed, ephemeral=True)
             return
 
-        found_client = next(
-            (
-                c
-                for c in clients
-                if client.lower() in c.name.lower()
-                or client.lower() in c.filename.lower()
-            ),
-            None,
-        )
+        index = self.bot.catalog.lookup_index("clients")
+        matches = index.lookup(client, limit=5)
+        found_client = matches[0] if matches else None
 
         if found_client:
             embed = discord.Embed(
@@ -264,20 +240,20 @@ class InfoCog(commands.Cog):
                 inline=True,
             )
 
-            try:
-                created_at = datetime.strptime(
-                    found_client.created_at, "%Y-%m-%dT%H:%M:%S.%fZ"
-                )
-            except ValueError:
-                created_at = datetime.fromisoformat(
-                    found_client.created_at.replace("Z", "+00:00")
+            if found_client.created_at is not None:
+                embed.add_field(
+                    name=f"{get_emoji('timeline', 1292468817234104401)} Created",
+                    value=f"<t:{int(found_client.created_at.timestamp())}:R>",
+                    inline=True,
                 )
 
-            embed.add_field(
-                name=f"{get_emoji('timeline', 1292468817234104401)} Created",
-                value=f"<t:{int(created_at.timestamp())}:R>",
-                inline=True,
-            )
+            others = [match.name for match in matches[1:]]
+            if others and found_client.name.lower() != client.strip().lower():
+                embed.add_field(
+                    name="🔎 Other Matches",
+                    value=", ".join(f"`{name}`" for name in others),
+                    inline=False,
+                )
 
             embed.set_footer(
                 text="CollapseLoader Client Info",
@@ -288,108 +264,64 @@ class InfoCog(commands.Cog):
                 ),
             )
 
-            await ctx.followup.send(embed=embed)
+            with tracer.span("send"):
+                await ctx.respond(embed=embed)
         else:
+            description = f"No client found matching `{client}`"
+            suggestions = index.suggest(client)
+            if suggestions:
+                description += "\n\nDid you mean " + ", ".join(
+                    f"`{suggestion.name}`" for suggestion in suggestions
+                ) + "?"
             error_embed = discord.Embed(
                 title="❌ Client Not Found",
-                description=f"No client found matching `{client}`\n\nUse `/clients` to see all available clients.",
+                description=f"{description}\n\nUse `/clients` to see all available clients.",
                 color=0xFF4444,
             )
-            await ctx.followup.send(embed=error_embed, ephemeral=True)
-
-    @commands.slash_command(name="stats", description="Get CollapseLoader stats")
-    async def stats(self, ctx: discord.ApplicationContext):
-        logger.debug(f"stats command executed")
-
-        await ctx.defer()
-
-        try:
-            from main import start_time
-
-            analytics = requests.get(
-                f"{config.API_BASE_URL}/api/statistics",
-                headers={"User-Agent": "CollapseBot"},
-                timeout=10,
-            ).json()
-
-            total_loader_launches = analytics.get("total_loader_launches", 0)
-            total_client_downloads = analytics.get("total_client_downloads", 0)
-            total_client_launches = analytics.get("total_client_launches", 0)
-
-            embed = discord.Embed(
-                title="📊 CollapseLoader Statistics",
-                color=0x5865F2,
-                description="Real-time statistics and metrics",
-            )
-
-            embed.add_field(
-                name="🤖 Bot Statistics",
-                value=f"{get_emoji('servers', 1292468955490812007)} **{len(self.bot.guilds)}** servers\n"
-                f"{get_emoji('users', 1292468955490812007)} **{sum(guild.member_count for guild in self.bot.guilds):,}** users\n"
-                f"{get_emoji('ping', 1292468045662654568)} **{self.bot.latency * 1000:.1f}ms** ping\n"
-                f"{get_emoji('timeline', 1292468817234104401)} **{get_uptime_string(start_time)}** uptime",
-                inline=True,
-            )
+            await ctx.respond(embed=error_embed, ephemeral=True)
 
-            embed.add_field(
-                name="💾 System Statistics",
-                value=(
-                    f"{get_emoji('commands', 1292469546283958403)} **{len(self.bot.commands)}** commands\n"
-                ),
-                inline=True,
-            )
+    def _create_stats_embed(self) -> discord.Embed:
+        """Build the /stats embed from the background-maintained statistics"""
+        stats = self.bot.stats
+        analytics = stats.analytics or {}
 
-            embed.add_field(
-                name="📈 Usage Analytics",
-                value=f"{get_emoji('analytics', 1292468265108635729)} **{total_loader_launches}** loader starts\n"
-                f"{get_emoji('analytics', 1292468265108635729)} **{total_client_downloads}** client downloads\n"
-                f"{get_emoji('analytics', 1292468265108635729)} **{total_client_launches}** client launches",
-                inline=True,
-            )
-
-            embed.set_thumbnail(
-                url=(
-                    self.bot.user.avatar.url
-                    if self.bot.user and self.bot.user.avatar
-                    else None
-                )
-            )
-            embed.set_footer(
-                text="Live statistics • Updates every few minutes",
-                icon_url=(
-                    self.bot.user.avatar.url
-                    if self.bot.user and self.bot.user.avatar
-                    else None
-                ),
-            )
+        def analytic(key: str) -> str:
+            return str(analytics[key]) if key in analytics else "n/a"
 
-            await ctx.followup.send(embed=embed)
+        age = self.bot.catalog.age("clients")
+        catalog_age = f"{age:.0f}s" if age != float("inf") else "n/a"
 
-        except Exception as e:
-            logger.error(f"Failed to get stats: {e}")
-            error_embed = discord.Embed(
-                title="❌ Error",
-                description="Failed to fetch statistics. Please try again later.",
-                color=0xFF4444,
-            )
-            await ctx.followup.send(embed=error_embed, ephemeral=True)
+        embed = discord.Embed(
+            title="📊 CollapseLoader Statistics",
+            color=0x5865F2,
+            description="Real-time statistics and metrics",
+        )
 
-    @commands.slash_command(name="socials", description="Get CollapseLoader socials")
-    async def socials(self, ctx: discord.ApplicationContext):
-        logger.debug(f"socials command executed")
+        embed.add_field(
+            name="🤖 Bot Statistics",
+            value=f"{get_emoji('servers', 1292468955490812007)} **{stats.guild_count}** servers\n"
+            f"{get_emoji('users', 1292468955490812007)} **{stats.member_count:,}** users\n"
+            f"{get_emoji('ping', 1292468045662654568)} **{self.bot.latency * 1000:.1f}ms** ping\n"
+            f"{get_emoji('timeline', 1292468817234104401)} **{get_uptime_string(self.bot.started_at)}** uptime",
+            inline=True,
+        )
 
-        embed = discord.Embed(
-            title="🌐 CollapseLoader Social Links",
-            color=0x1DA1F2,
-            description="Connect with us on various platforms!",
+        embed.add_field(
+            name="💾 System Statistics",
+            value=(
+                f"{get_emoji('commands', 1292469546283958403)} **{len(self.bot.commands)}** commands\n"
+                f"{get_emoji('timeline', 1292468817234104401)} **{catalog_age}** catalog age\n"
+                f"{get_emoji('analytics', 1292468265108635729)} **{self.bot.catalog.hit_rate:.0%}** cache hit rate\n"
+            ),
+            inline=True,
         )
 
         embed.add_field(
-            name="📱 Social Platforms",
-            value="📱 [Telegram](https://t.me/collapseloader)\n"
-            "💬 [Discord](https://discord.com/invite/FyKtnFqs6J)\n"
-            "🌐 [Website](https://collapseloader.org)",
-            inline=False,
+            name="📈 Usage Analytics",
+            value=f"{get_emoji('analytics', 1292468265108635729)} **{analytic('total_loader_launches')}** loader starts\n"
+            f"{get_emoji('analytics', 1292468265108635729)} **{analytic('total_client_downloads')}** client downloads\n"
+            f"{get_emoji('analytics', 1292468265108635729)} **{analytic('total_client_launches')}** client launches",
+            inline=True,
         )
 
         embed.set_thumbnail(
@@ -399,16 +331,62 @@ class InfoCog(commands.Cog):
                 else None
             )
         )
-        embed.set_footer(text="Join our community!")
+        embed.set_footer(
+            text="Live statistics • Updates every few minutes",
+            icon_url=(
+                self.bot.user.avatar.url
+                if self.bot.user and self.bot.user.avatar
+                else None
+            ),
+        )
+        return embed
+
+    def get_stats_embed(self) -> discord.Embed:
+        """Cached /stats embed, rebuilt when the statistics change or once per refresh interval"""
+        stats = self.bot.stats
+        key = (stats.version, int(time.monotonic() // stats.refresh_interval))
+        if self._stats_embed is None or self._stats_embed[0] != key:
+            self._stats_embed = (key, self._create_stats_embed())
+        return self._stats_embed[1]
+
+    @commands.slash_command(name="stats", description="Get CollapseLoader stats")
+    async def stats(self, ctx: discord.ApplicationContext):
+        logger.debug(f"stats command executed")
+
+        stats = self.bot.stats
+        if stats.analytics is None:
+            # Nothing polled yet: wait briefly on the shared refresh, well inside the interaction deadline
+            with tracer.span("fetch"):
+                try:
+                    await asyncio.wait_for(
+                        asyncio.shield(stats.refresh()),
+                        timeout=config.STATS_FIRST_LOAD_TIMEOUT,
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        elif stats.age() > stats.refresh_interval * 2:
+            stats.refresh()
+
+        with tracer.span("embed"):
+            embed = self.get_stats_embed()
+
+        with tracer.span("send"):
+            await ctx.respond(embed=embed)
+
+    @commands.slash_command(name="socials", description="Get CollapseLoader socials")
+    async def socials(self, ctx: discord.ApplicationContext):
+        logger.debug(f"socials command executed")
 
-        await ctx.respond(embed=embed)
+        embed = SOCIALS.render(thumbnail=bot_avatar(self.bot))
+
+        with tracer.span("send"):
+            await ctx.respond(embed=embed)
 
     @commands.slash_command(name="uptime", description="Get uptime of CollapseBot")
     async def uptime(self, ctx: discord.ApplicationContext):
         logger.debug(f"uptime command executed")
 
-        from main import start_time
-
+        start_time = self.bot.started_at
         uptime_seconds = int(time.time() - start_time)
 
         embed = discord.Embed(
@@ -425,7 +403,8 @@ class InfoCog(commands.Cog):
 
         embed.set_footer(text="CollapseBot Status")
 
-        await ctx.respond(embed=embed)
+        with tracer.span("send"):
+            await ctx.respond(embed=embed)
 
     @commands.slash_command(name="user", description="Get information about user")
     async def user(
@@ -436,15 +415,12 @@ class InfoCog(commands.Cog):
         logger.debug(f"user command executed")
 
         if ctx.author.id != config.ADMIN_USER_ID:
-            error_embed = discord.Embed(
-                title="❌ Access Denied",
-                description="This command is restricted to administrators.",
-                color=0xFF4444,
-            )
-            await ctx.respond(embed=error_embed, ephemeral=True)
+            await ctx.respond(embed=ADMIN_ONLY.embed, ephemeral=True)
             return
 
-        user_member = user if isinstance(user, discord.Member) else None
+        presences = self.bot.intents.presences
+        with tracer.span("fetch"):
+            user_member = await fetch_member(ctx.guild, user, presences)
 
         embed = discord.Embed(
             title=f"👤 {user.display_name}",
@@ -491,7 +467,7 @@ class InfoCog(commands.Cog):
                 inline=False,
             )
 
-        if hasattr(user, "status"):
+        if presences and user_member:
             status_emoji = {
                 "online": "🟢",
                 "idle": "🟡",
@@ -500,7 +476,7 @@ class InfoCog(commands.Cog):
             }
             embed.add_field(
                 name=f"{get_emoji('status', 1292471789628428409)} Status",
-                value=f"{status_emoji.get(str(user.status), '❓')} {str(user.status).title()}",
+                value=f"{status_emoji.get(str(user_member.status), '❓')} {str(user_member.status).title()}",
                 inline=True,
             )
 
@@ -514,7 +490,8 @@ class InfoCog(commands.Cog):
             ),
         )
 
-        await ctx.respond(embed=embed)
+        with tracer.span("send"):
+            await ctx.respond(embed=embed)
 
 
 def setup(bot: discord.Bot):
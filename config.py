@@ -2,12 +2,16 @@ import os
 
 from dotenv import load_dotenv
 
-from logger import logger
-
 load_dotenv()
 
 TOKEN = os.getenv("TOKEN")
 
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "").lower() in ("1", "true", "yes")
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9108"))
+TRACE_FILE = os.getenv("TRACE_FILE")
+GATEWAY_PROFILE = os.getenv("GATEWAY_PROFILE", "lean")
+
 ADMIN_USER_ID = 556864778576986144
 ADMIN_ROLES = [1231334945041944628, 1231330785886212177, 1240356360604881027]
 TICKETS_CATEGORY_ID = 1348431299290857552
@@ -23,50 +27,27 @@ IGNORED_CATEGORIES = [
     1348431299290857552,
 ]
 
-API_BASE_URL = "https://atlas.collapseloader.org"
-CLIENTS = []
-FABRIC_CLIENTS = []
-FORGE_CLIENTS = []
-
-def _fetch_clients_from_api(endpoint: str) -> list:
-    """Helper function to fetch clients from API."""
-    try:
-        response = requests.get(
-            f"{API_BASE_URL}/api/v1/{endpoint}",
-            headers={"User-Agent": "CollapseBot"},
-            timeout=10
-        )
-        response.raise_for_status()
-        data = response.json()
-        
-        if isinstance(data, dict) and "data" in data:
-            return data["data"]
-        elif isinstance(data, list):
-            return data
-        else:
-            logger.warning(f"Unexpected API response format from {endpoint}: {type(data)}")
-            return []
-    except requests.RequestException as e:
-        logger.error(f"Failed to fetch clients from {endpoint}: {e}")
-        return []
-
-try:
-    import requests
-    
-    all_clients = _fetch_clients_from_api("clients")
-    CLIENTS = [client["name"] for client in all_clients if client.get("show", True)]
-    logger.info(f"Loaded {len(CLIENTS)} clients from API")
-    
-    fabric_clients = _fetch_clients_from_api("fabric-clients")
-    FABRIC_CLIENTS = [client["name"] for client in fabric_clients if client.get("show", True)]
-    logger.info(f"Loaded {len(FABRIC_CLIENTS)} Fabric clients from API")
-    
-    forge_clients = _fetch_clients_from_api("forge-clients")
-    FORGE_CLIENTS = [client["name"] for client in forge_clients if client.get("show", True)]
-    logger.info(f"Loaded {len(FORGE_CLIENTS)} Forge clients from API")
-    
-except Exception as e:
-    logger.error(f"Failed to fetch clients from API: {e}")
-    CLIENTS = []
-    FABRIC_CLIENTS = []
-    FORGE_CLIENTS = []
+AUTOMATIC_RESPONSES_FILE = "automatic_responses.yml"
+SNIPPETS_FILE = "snippets.yml"
+CONFIG_SNAPSHOT_DIR = ".cache/config"
+CONFIG_WATCH_INTERVAL = 2.0
+SAVE_DEBOUNCE_DELAY = 0.5
+
+COOLDOWN_STORE_MAX_SIZE = 50_000
+
+OUTBOUND_GLOBAL_RATE = 40
+OUTBOUND_GLOBAL_BURST = 40
+OUTBOUND_CHANNEL_RATE = 1.0
+OUTBOUND_CHANNEL_BURST = 5
+OUTBOUND_MAX_PENDING = 20
+OUTBOUND_FLOOD_THRESHOLD = 3
+OUTBOUND_MAX_AGE = 30
+
+BULK_DELETE_CONCURRENCY = 5
+BULK_PROGRESS_INTERVAL = 2.0
+
+API_BASE_URL = os.getenv("API_BASE_URL", "https://atlas.collapseloader.org")
+HTTP_TIMEOUT = 10
+CATALOG_REFRESH_INTERVAL = 300
+STATS_REFRESH_INTERVAL = 120
+STATS_FIRST_LOAD_TIMEOUT = 2.0
@@ -1,45 +1,111 @@
+import asyncio
 import sys
 import time
 from pathlib import Path
 
 import discord
-import yaml
 from discord.ext import commands
 from dotenv import load_dotenv
 
 import config
 from logger import logger
-from utils.helpers import validate_config
-
+from utils.catalog import ClientCatalog
+from utils.embeds import COMMAND_ERROR, COMMAND_ON_COOLDOWN, MISSING_PERMISSIONS
+from utils.gateway import get_profile
+from utils.helpers import get_rss_mb, validate_config
+from utils.http import AtlasClient
+from utils.metrics import start_metrics_server
+from utils.registry import ConfigRegistry
+from utils.rules import Ruleset
+from utils.snippets import SnippetSet
+from utils.stats import StatsCache
+from utils.timeline import StartupTimeline
+from utils.tracing import tracer
+
+timeline = StartupTimeline()
 load_dotenv()
 
-
+timeline.begin("config")
 if not validate_config():
     logger.error("Configuration validation failed. Exiting.")
     sys.exit(1)
+timeline.end("config")
+
 
-intents = discord.Intents.all()
+class CollapseBot(discord.Bot):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.registry = ConfigRegistry(config.CONFIG_SNAPSHOT_DIR)
+        self.registry.register(
+            "automatic_responses", config.AUTOMATIC_RESPONSES_FILE, Ruleset.from_data
+        )
+        self.registry.register("snippets", config.SNIPPETS_FILE, SnippetSet.from_data)
+        self.metrics_runner = None
+        self.atlas = AtlasClient(config.API_BASE_URL, timeout=config.HTTP_TIMEOUT)
+        self.catalog = ClientCatalog(
+            self.atlas, refresh_interval=config.CATALOG_REFRESH_INTERVAL
+        )
+        self.stats = StatsCache(self.atlas, refresh_interval=config.STATS_REFRESH_INTERVAL)
+        self.started_at = time.time()
+
+    async def start(self, *args, **kwargs):
+        if config.METRICS_ENABLED:
+            self.metrics_runner = await start_metrics_server(
+                self, config.METRICS_HOST, config.METRICS_PORT
+            )
+
+        timeline.begin("gateway connect")
+        warm_up_task = asyncio.create_task(self.warm_up())
+        try:
+            await super().start(*args, **kwargs)
+        finally:
+            warm_up_task.cancel()
+
+    async def warm_up(self):
+        """Load the client catalogs and statistics concurrently while the gateway connects.
+
+        This is the first load for both caches; their periodic refresh tasks are
+        started only afterwards, and they sleep a full interval before refreshing.
+        """
+
+        async def load(endpoint: str):
+            with timeline.phase(f"catalog {endpoint}"):
+                clients = await self.catalog.refresh(endpoint)
+            logger.info(f"Loaded {len(clients or [])} {endpoint} from API")
+
+        async def load_stats():
+            with timeline.phase("statistics"):
+                await self.stats.refresh()
+
+        with timeline.phase("catalog warm-up"):
+            await asyncio.gather(
+                *(load(e) for e in ClientCatalog.ENDPOINTS), load_stats()
+            )
+        self.catalog.start()
+        self.stats.start()
+
+    async def close(self):
+        if self.metrics_runner is not None:
+            await self.metrics_runner.cleanup()
+        await self.catalog.stop()
+        await self.stats.stop()
+        await self.atlas.close()
+        tracer.close()
+        await super().close()
+
+
+gateway_profile = get_profile(config.GATEWAY_PROFILE)
 activity = discord.Activity(type=discord.ActivityType.watching, name="/stats")
-bot = discord.Bot(intents=intents, activity=activity, status=discord.Status.online)
-
-start_time = time.time()
-
-automatic_responses_filename = "automatic_responses.yml"
-try:
-    with open(automatic_responses_filename, "r", encoding="utf-8") as file:
-        automatic_responses_raw = file.read()
-        automatic_responses: dict = yaml.safe_load(automatic_responses_raw)
-except FileNotFoundError:
-    logger.warning(f"Automatic responses file {automatic_responses_filename} not found")
-    automatic_responses = {}
-    automatic_responses_raw = ""
-except yaml.YAMLError as e:
-    logger.error(f"Failed to parse automatic responses YAML: {e}")
-    automatic_responses = {}
-    automatic_responses_raw = ""
-
-use_automatic_responses = True
+bot = CollapseBot(
+    **gateway_profile.options(), activity=activity, status=discord.Status.online
+)
+
+bot.before_invoke(tracer.begin)
+bot.after_invoke(tracer.finish)
+if config.TRACE_FILE:
+    tracer.open_log(config.TRACE_FILE)
 
+timeline.begin("cogs")
 cog_dir = Path("./cogs")
 loaded_cogs = 0
 failed_cogs = 0
@@ -55,13 +121,18 @@ for cog_file in cog_dir.glob("*_cog.py"):
         failed_cogs += 1
 
 logger.info(f"📦 Loaded {loaded_cogs} cogs successfully, {failed_cogs} failed")
+timeline.end("cogs")
 
 
 @bot.event
 async def on_ready():
     logger.info(f"🚀 Bot is ready! Logged in as {bot.user}")
-    logger.info(f"🌐 Connected to {len(bot.guilds)} guilds")
-    logger.info(f"👥 Serving {sum(guild.member_count for guild in bot.guilds):,} users")
+    bot.stats.reset_members(bot.guilds)
+    logger.info(f"🌐 Connected to {bot.stats.guild_count} guilds")
+    logger.info(f"👥 Serving {bot.stats.member_count:,} users")
+    logger.info(f"🧠 Resident memory: {get_rss_mb():.1f} MB ({config.GATEWAY_PROFILE} gateway profile)")
+    if timeline.end("gateway connect"):
+        logger.info(f"🕒 Startup timeline:\n{timeline.summary()}")
 
 
 @bot.event
@@ -72,38 +143,17 @@ async def on_command_error(ctx, error):
         return
 
     elif isinstance(error, commands.MissingPermissions):
-        embed = discord.Embed(
-            title="❌ Missing Permissions",
-            description="You don't have the required permissions to use this command.",
-            color=0xFF4444,
-        )
-        embed.add_field(
-            name="Required Permissions",
-            value=", ".join(error.missing_permissions),
-            inline=False,
+        embed = MISSING_PERMISSIONS.render(
+            fields=[("Required Permissions", ", ".join(error.missing_permissions), False)]
         )
         await ctx.respond(embed=embed, ephemeral=True)
     elif isinstance(error, commands.CommandOnCooldown):
-        embed = discord.Embed(
-            title="⏰ Command on Cooldown",
-            description=f"Please wait **{error.retry_after:.1f} seconds** before using this command again.",
-            color=0xFFAA00,
+        embed = COMMAND_ON_COOLDOWN.render(
+            description=f"Please wait **{error.retry_after:.1f} seconds** before using this command again."
         )
         await ctx.respond(embed=embed, ephemeral=True)
     else:
-        embed = discord.Embed(
-            title="❌ An Error Occurred",
-            description="An unexpected error occurred while processing your command.",
-            color=0xFF4444,
-        )
-
-        embed.add_field(
-            name="💡 What to do",
-            value="• Try the command again\n• Contact an administrator if the issue persists",
-            inline=False,
-        )
-
-        await ctx.respond(embed=embed, ephemeral=True)
+        await ctx.respond(embed=COMMAND_ERROR.embed, ephemeral=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,81 @@
+import asyncio
+import types
+
+from benchmarks.fakes import FakeMember, RecordingScheduler, make_bot
+from cogs.automatic_responses_cog import AutomaticResponsesCog
+from utils.rules import Ruleset
+
+
+class RecordingMessage:
+    def __init__(self, content: str, events: list):
+        self.id = 1
+        self.content = content
+        self.author = FakeMember()
+        self.guild = None
+        self.events = events
+        self.channel = types.SimpleNamespace(id=10, send=self._send)
+
+    async def _send(self, content, reference=None):
+        self.events.append(("send", content))
+        await asyncio.sleep(0.01)
+        self.events.append(("sent", content))
+
+    async def reply(self, content):
+        self.events.append(("reply", content))
+
+    async def delete(self):
+        self.events.append(("delete", None))
+        await asyncio.sleep(0.01)
+        self.events.append(("deleted", None))
+
+    def to_reference(self, fail_if_not_exists=True):
+        return None
+
+
+def make_cog(tmp_path) -> AutomaticResponsesCog:
+    cog = AutomaticResponsesCog(make_bot(tmp_path, rule_count=0))
+    cog.apply_ruleset(
+        Ruleset.from_data(
+            {
+                "cleanup": {
+                    "triggers": ["bad word"],
+                    "responses": ["Please keep it civil"],
+                    "conditions": {"delete_trigger": True},
+                }
+            }
+        )
+    )
+    cog.replies = RecordingScheduler()
+    return cog
+
+
+def test_trigger_is_deleted_alongside_the_sent_reply(tmp_path):
+    events = []
+    cog = make_cog(tmp_path)
+    message = RecordingMessage("a bad word here", events)
+
+    async def main():
+        await cog.handle_message(message)
+        await asyncio.sleep(0)
+        assert events == []
+
+        (reply,) = cog.replies.submitted
+        await reply.send()
+
+    asyncio.run(main())
+    # Both requests are in flight before either completes
+    assert events[:2] == [("send", "Please keep it civil"), ("delete", None)]
+    assert sorted(events[2:]) == [("deleted", None), ("sent", "Please keep it civil")]
+
+
+def test_unsent_reply_leaves_the_trigger(tmp_path):
+    events = []
+    cog = make_cog(tmp_path)
+
+    async def main():
+        await cog.handle_message(RecordingMessage("a bad word here", events))
+        cog.replies.close()
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+    assert events == []
@@ -0,0 +1,97 @@
+import asyncio
+import logging
+import types
+
+import discord
+
+from utils.bulk import AdaptiveLimiter, run_bulk
+
+http_log = logging.getLogger("discord.http")
+
+
+def rate_limited_warning():
+    http_log.warning(
+        'We are being rate limited. Retrying in %.2f seconds. Handled under the bucket "%s"',
+        0.0,
+        "1:None:/channels/{channel_id}",
+    )
+
+
+def test_collects_failures_without_aborting():
+    async def action(item):
+        if item % 3 == 0:
+            raise ValueError(f"bad {item}")
+
+    result = asyncio.run(run_bulk(range(10), action, concurrency=3))
+
+    assert result.succeeded == 6
+    assert [item for item, _ in result.failures] == [0, 3, 6, 9]
+    assert result.failures[0][1] == "bad 0"
+
+
+def test_counts_only_rate_limits_of_its_own_requests():
+    async def action(item):
+        await asyncio.sleep(0)
+        if item == 2:
+            rate_limited_warning()
+
+    async def other_traffic():
+        for _ in range(5):
+            rate_limited_warning()
+            await asyncio.sleep(0)
+
+    async def main():
+        other = asyncio.create_task(other_traffic())
+        result = await run_bulk(range(5), action, concurrency=5)
+        await other
+        return result
+
+    assert asyncio.run(main()).rate_limited == 1
+
+
+def test_http_429_counts_as_rate_limited():
+    response = types.SimpleNamespace(status=429, reason="Too Many Requests")
+
+    async def action(item):
+        raise discord.HTTPException(response, "rate limited")
+
+    result = asyncio.run(run_bulk([1, 2], action))
+
+    assert result.rate_limited == 2
+    assert len(result.failures) == 2
+
+
+def test_progress_failures_are_logged_and_do_not_stop_the_job(monkeypatch):
+    warnings = []
+    monkeypatch.setattr("utils.bulk.logger.warning", warnings.append)
+    reports = []
+
+    async def on_progress(result):
+        reports.append(result.done)
+        raise discord.ClientException("edit failed")
+
+    async def action(item):
+        await asyncio.sleep(0.02)
+
+    result = asyncio.run(
+        run_bulk(range(4), action, concurrency=1, on_progress=on_progress, progress_interval=0.01)
+    )
+
+    assert result.succeeded == 4
+    assert len(reports) >= 2
+    assert warnings and "edit failed" in warnings[0]
+
+
+def test_limiter_halves_on_rate_limit_and_recovers():
+    async def main():
+        limiter = AdaptiveLimiter(4)
+        await limiter.acquire()
+        await limiter.release(rate_limited=True)
+        assert limiter.limit == 2
+
+        for _ in range(2):
+            await limiter.acquire()
+            await limiter.release(rate_limited=False)
+        assert limiter.limit == 3
+
+    asyncio.run(main())
@@ -0,0 +1,53 @@
+from utils.cooldowns import CooldownStore
+
+
+def test_hit_starts_and_enforces_cooldown():
+    store = CooldownStore()
+
+    assert not store.hit("key", 10, now=0)
+    assert store.hit("key", 10, now=5)
+    assert not store.hit("key", 10, now=10)
+
+
+def test_zero_duration_never_cools_down():
+    store = CooldownStore()
+
+    assert not store.hit("key", 0, now=0)
+    assert not store.hit("key", 0, now=0)
+    assert len(store) == 0
+
+
+def test_expired_entries_are_purged():
+    store = CooldownStore()
+    for user in range(100):
+        store.hit(("rule", user), 10, now=user / 10)
+
+    store.purge(now=15)
+    assert len(store) == 49
+
+    store.purge(now=20)
+    assert len(store) == 0
+    assert store.stats()["expired"] == 100
+
+
+def test_size_is_capped_by_evicting_closest_to_expiry():
+    store = CooldownStore(max_size=3)
+    store.hit("long", 100, now=0)
+    store.hit("short", 1, now=0)
+    store.hit("medium", 50, now=0)
+
+    store.hit("new", 10, now=0)
+
+    assert len(store) == 3
+    assert store.stats()["evicted"] == 1
+    assert not store.hit("short", 1, now=0.5)
+    assert store.hit("long", 100, now=0.5)
+
+
+def test_repeated_hits_do_not_grow_the_heap():
+    store = CooldownStore(max_size=10)
+    for now in range(1000):
+        store.hit("key", 5, now=now)
+
+    assert len(store) == 1
+    assert len(store._heap) <= 2
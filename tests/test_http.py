@@ -0,0 +1,94 @@
+import asyncio
+import time
+
+import pytest
+
+from benchmarks.mock_atlas import MockAtlas, serve_in_thread
+from utils.catalog import ClientCatalog
+from utils.http import AtlasClient
+
+
+@pytest.fixture
+def mock():
+    return MockAtlas(clients=20, fabric_clients=5, forge_clients=5)
+
+
+@pytest.fixture
+def url(mock):
+    with serve_in_thread(mock) as url:
+        yield url
+
+
+def run_with_client(url, timeout, coro):
+    async def main():
+        atlas = AtlasClient(url, timeout=timeout)
+        try:
+            return await coro(atlas)
+        finally:
+            await atlas.close()
+
+    return asyncio.run(main())
+
+
+def test_default_timeout_applies_to_every_request(mock, url):
+    mock.latency = 3
+
+    async def fetch(atlas):
+        started = time.perf_counter()
+        with pytest.raises(asyncio.TimeoutError):
+            await atlas.get_json("/api/statistics")
+        return time.perf_counter() - started
+
+    assert run_with_client(url, 0.3, fetch) < 2
+
+
+def test_per_request_timeout_overrides_default(mock, url):
+    mock.latency = 0.5
+
+    async def fetch(atlas):
+        with pytest.raises(asyncio.TimeoutError):
+            await atlas.get_json("/api/statistics", timeout=0.1)
+        return await atlas.get_json("/api/statistics")
+
+    assert run_with_client(url, 5, fetch) == mock.statistics
+
+
+def test_conditional_get_returns_none_when_not_modified(mock, url):
+    async def fetch(atlas):
+        data, validators = await atlas.get_json_if_changed("/api/v1/clients")
+        assert len(data["data"]) == 20
+        return await atlas.get_json_if_changed("/api/v1/clients", validators)
+
+    assert run_with_client(url, 5, fetch) is None
+    assert mock.not_modified == 1
+
+
+def test_catalog_keeps_serving_stale_list_when_atlas_is_slow(mock, url):
+    async def refresh(atlas):
+        catalog = ClientCatalog(atlas)
+        fresh = await catalog.refresh("clients")
+        assert len(fresh) == 20
+
+        mock.set_catalog("clients", [])
+        mock.latency = 3
+        started = time.perf_counter()
+        stale = await catalog.refresh("clients")
+        assert time.perf_counter() - started < 2
+        assert stale is fresh
+        assert catalog.get("clients") is fresh
+        assert catalog.failures == 1
+
+    run_with_client(url, 0.3, refresh)
+
+
+def test_catalog_not_modified_keeps_list_and_version(mock, url):
+    async def refresh(atlas):
+        catalog = ClientCatalog(atlas)
+        first = await catalog.refresh("forge-clients")
+        second = await catalog.refresh("forge-clients")
+        assert second is first
+        assert catalog.version("forge-clients") == 1
+        assert catalog.not_modified == 1
+        assert {client.client_type for client in first} == {"forge"}
+
+    run_with_client(url, 5, refresh)
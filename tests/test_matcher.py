@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from utils.matcher import TriggerMatcher
+
+
+def linear_scan(rules, text):
+    """The per-rule substring scan the matcher replaced"""
+    return [
+        index
+        for index, (_, triggers) in enumerate(rules)
+        if any(str(trigger).lower() in text for trigger in triggers)
+    ]
+
+
+def random_rules(rng, count):
+    # A tiny alphabet makes overlapping and nested triggers common
+    return [
+        (
+            f"rule{index}",
+            ["".join(rng.choices("abc ", k=rng.randint(1, 5))) for _ in range(rng.randint(1, 3))],
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_linear_scan(seed):
+    rng = random.Random(seed)
+    rules = random_rules(rng, 30)
+    matcher = TriggerMatcher(rules)
+
+    for _ in range(50):
+        text = "".join(rng.choices("abcd ", k=rng.randint(0, 40)))
+        expected = linear_scan(rules, text)
+        found = matcher.match(text)
+        assert found == expected
+        assert found[:1] == expected[:1]
+
+
+def test_first_match_follows_rule_order():
+    rules = [("specific", ["game crash"]), ("generic", ["crash"]), ("later", ["game"])]
+    matcher = TriggerMatcher(rules)
+
+    assert matcher.match("my game crashed") == [0, 1, 2]
+    assert matcher.match("it crashed") == [1]
+    assert TriggerMatcher(rules[::-1]).match("my game crashed")[0] == 0
+
+
+def test_triggers_are_lowercased_and_empty_trigger_always_matches():
+    matcher = TriggerMatcher([("upper", ["HeLLo"]), ("always", [""]), ("number", [404])])
+
+    assert matcher.match("hello there") == [0, 1]
+    assert matcher.match("error 404") == [1, 2]
+    assert matcher.match("") == [1]
@@ -0,0 +1,43 @@
+import types
+
+from utils import metrics as metrics_module
+from utils.cooldowns import CooldownStore
+from utils.metrics import Metrics, register_bot_gauges
+from utils.outbound import ReplyScheduler
+
+
+def metric_types(text: str) -> dict:
+    return {
+        line.split()[2]: line.split()[3]
+        for line in text.splitlines()
+        if line.startswith("# TYPE")
+    }
+
+
+def test_totals_are_counters_and_levels_are_gauges(monkeypatch):
+    registry = Metrics()
+    monkeypatch.setattr(metrics_module, "metrics", registry)
+
+    cog = types.SimpleNamespace(cooldowns=CooldownStore(), replies=ReplyScheduler())
+    catalog = types.SimpleNamespace(
+        hit_rate=0.5, age=lambda endpoint: 1.0, ENDPOINTS=("clients",), not_modified=2, failures=1
+    )
+    bot = types.SimpleNamespace(latency=0.1, catalog=catalog, get_cog=lambda name: cog)
+    register_bot_gauges(bot)
+    text = registry.render()
+    types_by_name = metric_types(text)
+
+    for name, kind in types_by_name.items():
+        assert name.endswith("_total") == (kind == "counter"), name
+    assert types_by_name["collapsebot_outbound_pending"] == "gauge"
+    assert types_by_name["collapsebot_cooldown_entries"] == "gauge"
+    assert 'collapsebot_catalog_refreshes_total{outcome="not_modified"} 2.0' in text
+    assert 'collapsebot_outbound_replies_total{outcome="pending"}' not in text
+
+
+def test_failing_callback_renders_no_samples():
+    registry = Metrics()
+    registry.counter("broken_total", "Raises", lambda: 1 / 0)
+
+    assert "# TYPE broken_total counter" in registry.render()
+    assert "\nbroken_total " not in registry.render()
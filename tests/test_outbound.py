@@ -0,0 +1,133 @@
+import asyncio
+
+from utils.outbound import PRIORITIES, OutboundReply, ReplyScheduler, TokenBucket
+
+LOW, NORMAL, HIGH = PRIORITIES["low"], PRIORITIES["normal"], PRIORITIES["high"]
+
+
+def scheduler(**options) -> ReplyScheduler:
+    options = {"channel_rate": 1000, "channel_burst": 1000, **options}
+    return ReplyScheduler(**options)
+
+
+def reply(sent: list, label: str, priority: int = NORMAL, key=None, channel_id: int = 1):
+    async def send():
+        sent.append(label)
+
+    return OutboundReply(channel_id, send, priority=priority, key=key)
+
+
+async def drain(replies: ReplyScheduler):
+    while replies._workers:
+        await asyncio.gather(*list(replies._workers.values()))
+
+
+def test_sends_highest_priority_first():
+    sent = []
+
+    async def main():
+        replies = scheduler()
+        for label, priority in (("low", LOW), ("normal", NORMAL), ("high", HIGH)):
+            assert replies.submit(reply(sent, label, priority))
+        await drain(replies)
+        return replies
+
+    replies = asyncio.run(main())
+    assert sent == ["high", "normal", "low"]
+    assert replies.stats()["sent"] == 3
+    assert len(replies) == 0
+
+
+def test_low_priority_duplicate_is_merged():
+    sent = []
+
+    async def main():
+        replies = scheduler()
+        assert replies.submit(reply(sent, "first", key="rule"))
+        assert not replies.submit(reply(sent, "duplicate", LOW, key="rule"))
+        assert replies.submit(reply(sent, "other channel", LOW, key="rule", channel_id=2))
+        await drain(replies)
+        return replies
+
+    replies = asyncio.run(main())
+    assert sorted(sent) == ["first", "other channel"]
+    assert replies.merged == 1
+
+
+def test_low_priority_dropped_past_flood_threshold():
+    sent = []
+
+    async def main():
+        replies = scheduler(flood_threshold=2)
+        replies.submit(reply(sent, "a"))
+        replies.submit(reply(sent, "b"))
+        assert not replies.submit(reply(sent, "flood", LOW))
+        assert replies.submit(reply(sent, "normal"))
+        await drain(replies)
+        return replies
+
+    replies = asyncio.run(main())
+    assert sent == ["a", "b", "normal"]
+    assert replies.dropped == 1
+
+
+def test_full_queue_evicts_lowest_priority():
+    sent = []
+
+    async def main():
+        replies = scheduler(max_pending=2, flood_threshold=10)
+        replies.submit(reply(sent, "low", LOW))
+        replies.submit(reply(sent, "normal"))
+        assert replies.submit(reply(sent, "high", HIGH))
+        assert not replies.submit(reply(sent, "another low", LOW))
+        await drain(replies)
+        return replies
+
+    replies = asyncio.run(main())
+    assert sent == ["high", "normal"]
+    assert replies.dropped == 2
+
+
+def test_replies_older_than_max_age_are_not_sent():
+    sent = []
+
+    async def main():
+        replies = scheduler(max_age=5)
+        stale = reply(sent, "stale", HIGH)
+        stale.created -= 10
+        replies.submit(stale)
+        replies.submit(reply(sent, "fresh"))
+        await drain(replies)
+        return replies
+
+    replies = asyncio.run(main())
+    assert sent == ["fresh"]
+    assert replies.dropped == 1
+
+
+def test_failed_send_is_counted_and_queue_continues():
+    sent = []
+
+    async def fail():
+        raise RuntimeError("boom")
+
+    async def main():
+        replies = scheduler()
+        replies.submit(OutboundReply(1, fail, priority=HIGH))
+        replies.submit(reply(sent, "next"))
+        await drain(replies)
+        return replies
+
+    replies = asyncio.run(main())
+    assert sent == ["next"]
+    assert replies.failed == 1
+
+
+def test_token_bucket_refills_at_rate():
+    bucket = TokenBucket(rate=2, capacity=2)
+    now = bucket.updated
+    assert bucket.take(now) == 0
+    assert bucket.take(now) == 0
+    assert bucket.take(now) == 0.5
+    assert bucket.take(now + 0.5) == 0
+    assert bucket.full(now + 1.5)
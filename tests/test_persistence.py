@@ -0,0 +1,99 @@
+import asyncio
+import os
+import stat
+
+import yaml
+
+from utils import persistence
+from utils.persistence import DebouncedYAMLWriter, atomic_write_yaml
+
+
+def test_atomic_write_keeps_file_mode(tmp_path):
+    path = tmp_path / "rules.yml"
+    path.write_text("old: 1\n")
+    path.chmod(0o644)
+
+    atomic_write_yaml(str(path), {"new": 2})
+
+    assert yaml.safe_load(path.read_text()) == {"new": 2}
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
+    assert os.listdir(tmp_path) == ["rules.yml"]
+
+
+def counting_writes(monkeypatch):
+    writes = []
+    write = persistence.atomic_write_yaml
+
+    def record(path, data):
+        writes.append(data)
+        write(path, data)
+
+    monkeypatch.setattr(persistence, "atomic_write_yaml", record)
+    return writes
+
+
+def test_burst_of_saves_is_one_write(tmp_path, monkeypatch):
+    writes = counting_writes(monkeypatch)
+    path = tmp_path / "rules.yml"
+    data = {}
+
+    async def main():
+        writer = DebouncedYAMLWriter(str(path), lambda: data, delay=0.05)
+        futures = []
+        for i in range(5):
+            data[f"rule{i}"] = i
+            futures.append(writer.save())
+        return await asyncio.gather(*futures)
+
+    assert asyncio.run(main()) == [True] * 5
+    assert writes == [{f"rule{i}": i for i in range(5)}]
+    assert yaml.safe_load(path.read_text()) == writes[0]
+
+
+def test_save_during_write_gets_another_write(tmp_path, monkeypatch):
+    writes = counting_writes(monkeypatch)
+    data = {"a": 1}
+
+    async def main():
+        writer = DebouncedYAMLWriter(str(tmp_path / "rules.yml"), lambda: data, delay=0.01)
+        first = writer.save()
+        await first
+        data["b"] = 2
+        return await writer.save()
+
+    assert asyncio.run(main())
+    assert writes == [{"a": 1}, {"a": 1, "b": 2}]
+
+
+def test_failed_write_resolves_false(tmp_path):
+    async def main():
+        writer = DebouncedYAMLWriter(str(tmp_path / "missing" / "rules.yml"), dict, delay=0)
+        return await writer.save()
+
+    assert asyncio.run(main()) is False
+
+
+def test_flush_writes_pending_changes_immediately(tmp_path, monkeypatch):
+    writes = counting_writes(monkeypatch)
+    path = tmp_path / "rules.yml"
+
+    async def main():
+        writer = DebouncedYAMLWriter(str(path), lambda: {"a": 1}, delay=60)
+        future = writer.save()
+        assert writer.flush()
+        assert future.result() is True
+        assert writer.flush()
+
+    asyncio.run(main())
+    assert writes == [{"a": 1}]
+    assert yaml.safe_load(path.read_text()) == {"a": 1}
+
+
+def test_stale_write_does_not_overwrite_newer_flush(tmp_path):
+    path = tmp_path / "rules.yml"
+    writer = DebouncedYAMLWriter(str(path), dict)
+
+    writer._write(2, {"new": 2})
+    writer._write(1, {"old": 1})
+
+    assert yaml.safe_load(path.read_text()) == {"new": 2}
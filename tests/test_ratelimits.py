@@ -0,0 +1,95 @@
+import types
+
+import pytest
+
+from cogs.automatic_responses_cog import AutomaticResponsesCog
+from utils.ratelimits import RateLimit, SlidingWindowLimiter
+
+
+def hits_allowed(limiter, limits, times):
+    allowed = 0
+    for now in times:
+        if limiter.check(limits, now):
+            limiter.record(limits, now)
+            allowed += 1
+    return allowed
+
+
+def test_burst_within_window():
+    limiter = SlidingWindowLimiter()
+    limits = [("key", RateLimit("user", 10, 3))]
+
+    assert hits_allowed(limiter, limits, [0, 1, 2, 3, 4]) == 3
+    assert limiter.limited == 2
+
+
+def test_previous_window_is_weighted_by_overlap():
+    limiter = SlidingWindowLimiter()
+    limit = RateLimit("user", 10, 4)
+    limiter.record([("key", limit)] * 4, now=5)
+
+    assert limiter.count("key", 10, now=9) == 4
+    assert limiter.count("key", 10, now=15) == pytest.approx(2)
+    assert limiter.count("key", 10, now=19) == pytest.approx(0.4)
+    assert limiter.count("key", 10, now=25) == 0
+    assert limiter.check([("key", limit)], now=15)
+
+
+def test_every_scope_must_have_room():
+    limiter = SlidingWindowLimiter()
+    user = RateLimit("user", 60, 1)
+    channel = RateLimit("channel", 60, 2)
+
+    def limits(user_id):
+        return [(("rule", "user", user_id), user), (("rule", "channel", 10), channel)]
+
+    assert hits_allowed(limiter, limits(1), [0, 1]) == 1
+    assert hits_allowed(limiter, limits(2), [2]) == 1
+    # User 3 has room but the shared channel limit is used up
+    assert hits_allowed(limiter, limits(3), [3]) == 0
+
+
+def test_size_is_capped():
+    limiter = SlidingWindowLimiter(max_size=100)
+    limit = RateLimit("user", 10, 5)
+    for user in range(1000):
+        limiter.record([(user, limit)], now=0)
+
+    assert len(limiter) <= 100
+    assert limiter.evicted > 0
+
+
+def test_stale_counters_are_evicted_first():
+    limiter = SlidingWindowLimiter(max_size=10)
+    limit = RateLimit("user", 1, 5)
+    for user in range(10):
+        limiter.record([(user, limit)], now=0)
+
+    limiter.record([("fresh", limit)], now=100)
+
+    assert len(limiter) == 1
+    assert limiter.evicted == 0
+
+
+def test_rate_limit_keys_per_scope():
+    limits = [RateLimit(scope, 60, 1) for scope in ("user", "channel", "guild", "global")]
+    rule = types.SimpleNamespace(name="rule", rate_limits=limits)
+    message = types.SimpleNamespace(
+        author=types.SimpleNamespace(id=1),
+        channel=types.SimpleNamespace(id=2),
+        guild=types.SimpleNamespace(id=3),
+    )
+
+    keys = AutomaticResponsesCog.rate_limit_keys(None, rule, message)
+
+    assert [key for key, _ in keys] == [
+        ("rule", "user", 1),
+        ("rule", "channel", 2),
+        ("rule", "guild", 3),
+        ("rule", "global", 0),
+    ]
+
+    # Direct messages fall back to the channel for the guild scope
+    message.guild = None
+    keys = AutomaticResponsesCog.rate_limit_keys(None, rule, message)
+    assert keys[2][0] == ("rule", "guild", 2)
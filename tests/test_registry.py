@@ -0,0 +1,86 @@
+import importlib
+import sys
+
+import pytest
+
+from utils.registry import ConfigError, ConfigRegistry, code_fingerprint
+
+
+def compile_keys(data):
+    return sorted(data)
+
+
+@pytest.fixture
+def registry(tmp_path):
+    registry = ConfigRegistry(str(tmp_path / "snapshots"))
+    registry.register("keys", str(tmp_path / "keys.yml"), compile_keys)
+    return registry
+
+
+def snapshots(registry):
+    return sorted(path.name for path in registry.snapshot_dir.glob("*.pickle"))
+
+
+def test_unchanged_file_is_restored_from_snapshot(registry, tmp_path, monkeypatch):
+    (tmp_path / "keys.yml").write_text("b: 1\na: 2\n")
+    assert registry.load("keys") == ["a", "b"]
+    assert len(snapshots(registry)) == 1
+
+    monkeypatch.setattr("utils.registry.yaml.load", lambda *args, **kwargs: pytest.fail())
+    assert registry.build("keys") == ["a", "b"]
+
+
+def test_changed_file_invalidates_snapshot(registry, tmp_path):
+    (tmp_path / "keys.yml").write_text("a: 1\n")
+    registry.load("keys")
+    before = snapshots(registry)
+
+    (tmp_path / "keys.yml").write_text("c: 1\n")
+    assert registry.load("keys") == ["c"]
+    assert len(snapshots(registry)) == 1
+    assert snapshots(registry) != before
+
+
+def test_changed_code_invalidates_snapshot(registry, tmp_path):
+    (tmp_path / "keys.yml").write_text("a: 1\n")
+    registry.load("keys")
+    before = snapshots(registry)
+
+    entry = registry._entries["keys"]
+    registry._entries["keys"] = entry._replace(
+        compile=lambda data: ["recompiled"], fingerprint=b"other code"
+    )
+    assert registry.load("keys") == ["recompiled"]
+    assert snapshots(registry) != before
+
+
+@pytest.mark.parametrize("content", [b"", b"not a pickle", b"\x80\x05\x95garbage"])
+def test_unreadable_snapshot_is_a_miss(registry, tmp_path, content):
+    (tmp_path / "keys.yml").write_text("a: 1\n")
+    registry.load("keys")
+    (snapshot,) = registry.snapshot_dir.glob("*.pickle")
+    snapshot.write_bytes(content)
+
+    assert registry.build("keys") == ["a"]
+
+
+def test_invalid_yaml_raises_config_error(registry, tmp_path):
+    (tmp_path / "keys.yml").write_text("a: [1\n")
+    with pytest.raises(ConfigError):
+        registry.load("keys")
+
+
+def test_fingerprint_follows_imported_source(tmp_path, monkeypatch):
+    (tmp_path / "fp_helper.py").write_text("VALUE = 1\n")
+    (tmp_path / "fp_compile.py").write_text(
+        "from fp_helper import VALUE\n\ndef compile(data):\n    return VALUE\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = importlib.import_module("fp_compile")
+    try:
+        before = code_fingerprint(module.compile, root=tmp_path)
+        (tmp_path / "fp_helper.py").write_text("VALUE = 2\n")
+        assert code_fingerprint(module.compile, root=tmp_path) != before
+    finally:
+        sys.modules.pop("fp_compile", None)
+        sys.modules.pop("fp_helper", None)
@@ -0,0 +1,71 @@
+import types
+
+import pytest
+
+from utils.outbound import PRIORITIES
+from utils.rules import Ruleset, RuleError
+
+VALID = {
+    "triggers": ["my game crashes"],
+    "responses": ["Hi {user}, check the logs"],
+}
+
+
+def rule(**conditions) -> dict:
+    return {**VALID, "conditions": conditions}
+
+
+@pytest.mark.parametrize(
+    "conditions, message",
+    [
+        ({"priority": ["low"]}, "'priority' must be one of"),
+        ({"priority": {"level": "high"}}, "'priority' must be one of"),
+        ({"priority": 2}, "'priority' must be one of"),
+        ({"priority": "urgent"}, "'priority' must be one of"),
+        ({"channel_types": "text"}, "'channel_types' must be a list of strings"),
+        ({"channel_types": [["text"]]}, "'channel_types' must be a list of strings"),
+        ({"channel_types": [{"text": 1}]}, "'channel_types' must be a list of strings"),
+        ({"channel_types": ["voice"]}, "unknown channel types voice"),
+    ],
+)
+def test_malformed_conditions_are_reported_per_rule(conditions, message):
+    ruleset = Ruleset.from_data({"broken": rule(**conditions), "good": rule()})
+
+    assert [r.name for r in ruleset.rules] == ["good"]
+    assert len(ruleset.errors) == 1
+    assert ruleset.errors[0].startswith("broken: ")
+    assert message in ruleset.errors[0]
+
+
+def test_valid_conditions_compile():
+    ruleset = Ruleset.from_data(
+        {"rule": rule(priority="high", channel_types=["text", "thread"], cooldown=5)}
+    )
+
+    compiled = ruleset.by_name["rule"]
+    assert ruleset.errors == []
+    assert compiled.priority == PRIORITIES["high"]
+    assert compiled.channel_types == frozenset({"text", "thread"})
+    assert compiled.cooldown == 5.0
+
+
+def test_non_mapping_file_is_rejected():
+    with pytest.raises(RuleError):
+        Ruleset.from_data(["not", "a", "mapping"])
+
+
+def test_unknown_placeholders_are_kept_as_text_and_reported():
+    ruleset = Ruleset.from_data(
+        {
+            "nick": {
+                "triggers": ["nick"],
+                "responses": ["{user}, поменяйте {ник} в {профиль}", "{ник} again"],
+            }
+        }
+    )
+
+    assert ruleset.errors == []
+    assert ruleset.warnings == ["nick: unknown placeholders {ник}, {профиль} are sent as written"]
+    message = types.SimpleNamespace(author=types.SimpleNamespace(display_name="Alex"))
+    template = ruleset.by_name["nick"].responses[0]
+    assert template.render(message) == "Alex, поменяйте {ник} в {профиль}"
@@ -0,0 +1,90 @@
+import pytest
+
+from utils.catalog import Client, build_indexes
+from utils.search import LookupIndex, NameIndex
+
+STEMS = ("Nova", "Vortex", "Celestial", "Rise", "Dev", "Meteor", "Eclipse", "Zenith")
+CLIENTS = [
+    Client.from_dict(
+        {
+            "id": i,
+            "name": f"{STEMS[i % len(STEMS)]}{i}",
+            "filename": f"{STEMS[i % len(STEMS)].lower()}{i}.jar",
+            "show": i % 5 != 0,
+        }
+    )
+    for i in range(400)
+]
+
+
+@pytest.fixture(scope="module")
+def index() -> LookupIndex:
+    return build_indexes(CLIENTS)["lookup"]
+
+
+def linear_scan(query: str):
+    """What /client matched before the index: a substring of the name or filename"""
+    query = query.lower()
+    return {
+        client.id
+        for client in CLIENTS
+        if query in client.name.lower() or query in client.filename.lower()
+    }
+
+
+def test_single_character_queries_match_like_the_linear_scan(index):
+    characters = {char for client in CLIENTS for char in client.name + client.filename}
+    for char in sorted(characters):
+        found = {client.id for client in index.lookup(char, limit=len(CLIENTS))}
+        assert found == linear_scan(char), char
+
+
+@pytest.mark.parametrize("query", ["dev", "ova1", "12", "jar", "rise3.j", "x", "zzz"])
+def test_lookup_matches_the_linear_scan(index, query):
+    found = {client.id for client in index.lookup(query, limit=len(CLIENTS))}
+    assert found == linear_scan(query)
+
+
+def test_exact_name_ranks_first(index):
+    assert index.lookup("Dev4")[0].name == "Dev4"
+    assert index.lookup("dev4.jar")[0].name == "Dev4"
+
+
+def test_prefix_matches_are_shortest_first(index):
+    names = [client.name for client in index.lookup("nova1", limit=3)]
+    assert names == ["Nova16", "Nova104", "Nova112"]
+
+
+def test_name_prefix_beats_shorter_filename_prefixes():
+    clients = [
+        Client.from_dict({"id": i, "name": f"Foo{i}", "filename": f"dev{i}.jar"})
+        for i in range(10)
+    ]
+    clients.append(Client.from_dict({"id": 10, "name": "DevelopmentClient"}))
+    index = build_indexes(clients)["lookup"]
+
+    assert index.lookup("dev", limit=5)[0].name == "DevelopmentClient"
+
+
+@pytest.mark.parametrize("query", ["dev", "nova1", "ri", "c", "ecl", "1"])
+@pytest.mark.parametrize("limit", [1, 3, 10])
+def test_limited_lookup_is_the_top_of_the_full_ranking(index, query, limit):
+    full = index.lookup(query, limit=len(CLIENTS))
+    assert index.lookup(query, limit=limit) == full[:limit]
+
+
+def test_suggest_offers_close_names_for_typos(index):
+    assert index.lookup("Nvoa16") == []
+    assert "Nova16" in [client.name for client in index.suggest("Nvoa16")]
+
+
+def test_indexes_skip_hidden_clients_only_for_autocomplete():
+    indexes = build_indexes(CLIENTS)
+    hidden = next(client for client in CLIENTS if not client.show)
+    assert hidden.name not in indexes["name"].search(hidden.name)
+    assert indexes["lookup"].lookup(hidden.name)[0] is hidden
+
+
+def test_name_index_ranks_exact_then_prefix_then_substring():
+    index = NameIndex(["Alpha", "Alphabet", "Beta Alpha", "Gamma"])
+    assert index.search("alpha") == ["Alpha", "Alphabet", "Beta Alpha"]
@@ -0,0 +1,77 @@
+import asyncio
+
+from benchmarks.fakes import make_bot
+from cogs.automatic_responses_cog import AutomaticResponsesCog
+from utils.watcher import FileWatcher
+
+
+async def wait_for(condition, timeout: float = 2.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+def test_change_triggers_callback_once(tmp_path):
+    path = tmp_path / "rules.yml"
+    path.write_text("a: 1\n")
+    calls = []
+
+    async def callback():
+        calls.append(path.read_text())
+
+    async def main():
+        watcher = FileWatcher(str(path), callback, interval=0.01)
+        watcher.start()
+        await asyncio.sleep(0.05)
+        assert calls == []
+
+        path.write_text("a: 1\nb: 2\n")
+        await wait_for(lambda: calls)
+        await asyncio.sleep(0.05)
+        watcher.stop()
+
+    asyncio.run(main())
+    assert calls == ["a: 1\nb: 2\n"]
+
+
+def test_failing_callback_keeps_watching(tmp_path):
+    path = tmp_path / "rules.yml"
+    path.write_text("1")
+    calls = []
+
+    async def callback():
+        calls.append(path.read_text())
+        if len(calls) == 1:
+            raise ValueError("broken")
+
+    async def main():
+        watcher = FileWatcher(str(path), callback, interval=0.01)
+        watcher.start()
+        path.write_text("22")
+        await wait_for(lambda: len(calls) == 1)
+        path.write_text("333")
+        await wait_for(lambda: len(calls) == 2)
+        assert watcher.running
+        watcher.stop()
+        assert not watcher.running
+
+    asyncio.run(main())
+
+
+def test_reload_keeps_last_good_rules(tmp_path):
+    bot = make_bot(tmp_path, rule_count=3)
+    cog = AutomaticResponsesCog(bot)
+    rules_file = tmp_path / "automatic_responses.yml"
+
+    async def main():
+        rules_file.write_text("rule: {triggers: [unclosed\n")
+        assert not await cog.reload_automatic_responses_file()
+        assert len(cog.ruleset) == 3
+
+        rules_file.write_text("only: {triggers: [hello], responses: [hi]}\n")
+        assert await cog.reload_automatic_responses_file()
+        assert [rule.name for rule in cog.ruleset.rules] == ["only"]
+
+    asyncio.run(main())
@@ -0,0 +1,162 @@
+import asyncio
+import logging
+import time
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+import discord
+
+from logger import logger
+
+T = TypeVar("T")
+
+
+class BulkResult(Generic[T]):
+    """Running tally of a bulk operation, passed to progress callbacks"""
+
+    __slots__ = ("total", "succeeded", "failures", "rate_limited", "started", "finished")
+
+    def __init__(self, total: int):
+        self.total = total
+        self.succeeded = 0
+        self.failures: List[Tuple[T, str]] = []
+        self.rate_limited = 0
+        self.started = time.monotonic()
+        self.finished: Optional[float] = None
+
+    @property
+    def done(self) -> int:
+        return self.succeeded + len(self.failures)
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def rate(self) -> float:
+        """Completed items per second"""
+        elapsed = self.elapsed
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+
+class _ItemRequests:
+    """Rate limits hit by the requests of one run_bulk item"""
+
+    __slots__ = ("counter", "rate_limited")
+
+    def __init__(self, counter: "_RateLimitCounter"):
+        self.counter = counter
+        self.rate_limited = False
+
+
+_current_item: ContextVar[Optional[_ItemRequests]] = ContextVar("bulk_item", default=None)
+
+
+class _RateLimitCounter(logging.Handler):
+    """Counts discord.py's "We are being rate limited" warnings for this job's own requests.
+
+    discord.py logs the warning from inside the request coroutine, so it is
+    emitted in the context of the item that made the request. Warnings from
+    other tasks, progress edits included, find no item of this job and are
+    ignored.
+    """
+
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.count = 0
+
+    def emit(self, record: logging.LogRecord):
+        item = _current_item.get()
+        if item is None or item.counter is not self:
+            return
+        if str(record.msg).startswith("We are being rate limited"):
+            item.rate_limited = True
+            self.count += 1
+
+
+class AdaptiveLimiter:
+    """Concurrency limit that halves on a 429 and grows back one slot at a time.
+
+    discord.py already sleeps and retries per bucket; this keeps the number of
+    requests in flight near what the shared route limit actually allows.
+    """
+
+    def __init__(self, maximum: int):
+        self.maximum = maximum
+        self.limit = maximum
+        self._active = 0
+        self._streak = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+
+    async def release(self, rate_limited: bool):
+        async with self._condition:
+            self._active -= 1
+            if rate_limited:
+                self.limit = max(1, self.limit // 2)
+                self._streak = 0
+            else:
+                self._streak += 1
+                if self._streak >= self.limit and self.limit < self.maximum:
+                    self.limit += 1
+                    self._streak = 0
+            self._condition.notify_all()
+
+
+async def run_bulk(
+    items: Sequence[T],
+    action: Callable[[T], Awaitable[object]],
+    *,
+    concurrency: int = 5,
+    on_progress: Optional[Callable[[BulkResult[T]], Awaitable[None]]] = None,
+    progress_interval: float = 2.0,
+) -> BulkResult[T]:
+    """Run ``action`` over ``items`` concurrently, collecting per-item failures.
+
+    ``on_progress`` is awaited every ``progress_interval`` seconds while the
+    operation runs; failures never abort the remaining items.
+    """
+    result: BulkResult[T] = BulkResult(len(items))
+    limiter = AdaptiveLimiter(concurrency)
+    rate_limits = _RateLimitCounter()
+    http_logger = logging.getLogger("discord.http")
+
+    async def run_one(item: T):
+        await limiter.acquire()
+        requests = _ItemRequests(rate_limits)
+        _current_item.set(requests)
+        try:
+            await action(item)
+            result.succeeded += 1
+        except Exception as e:
+            if isinstance(e, discord.HTTPException) and e.status == 429:
+                requests.rate_limited = True
+                rate_limits.count += 1
+            result.failures.append((item, str(e) or type(e).__name__))
+        finally:
+            await limiter.release(rate_limited=requests.rate_limited)
+
+    async def report():
+        while True:
+            await asyncio.sleep(progress_interval)
+            result.rate_limited = rate_limits.count
+            try:
+                await on_progress(result)
+            except Exception as e:
+                logger.warning(f"Failed to report bulk operation progress: {e}")
+
+    http_logger.addHandler(rate_limits)
+    reporter = asyncio.create_task(report()) if on_progress is not None else None
+    try:
+        await asyncio.gather(*(run_one(item) for item in items))
+    finally:
+        http_logger.removeHandler(rate_limits)
+        if reporter is not None:
+            reporter.cancel()
+        result.rate_limited = rate_limits.count
+        result.finished = time.monotonic()
+    return result
@@ -0,0 +1,257 @@
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from logger import logger
+from utils.http import AtlasClient, Validators
+from utils.search import LookupIndex, NameIndex
+
+
+def parse_timestamp(value: str) -> Optional[datetime]:
+    """Parse an atlas ISO 8601 timestamp such as ``2024-05-01T12:00:00.000Z``"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
+class Client:
+    """Client data structure matching API response."""
+    id: int
+    name: str
+    version: str
+    filename: str
+    md5_hash: str
+    size: int
+    main_class: str
+    show: bool
+    working: bool
+    launches: int
+    downloads: int
+    client_type: str
+    created_at: Optional[datetime]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Client":
+        """Create Client instance from dictionary, parsing ``created_at`` once."""
+        get = data.get
+        return cls(
+            get("id", 0),
+            get("name", ""),
+            get("version", ""),
+            get("filename", ""),
+            get("md5_hash", ""),
+            get("size", 0),
+            get("main_class", ""),
+            get("show", False),
+            get("working", False),
+            get("launches", 0),
+            get("downloads", 0),
+            get("client_type", "default"),
+            parse_timestamp(get("created_at", "")),
+        )
+
+
+INDEX_BUILDERS: Dict[str, Callable[[List[Client]], object]] = {
+    "name": lambda clients: NameIndex(client.name for client in clients if client.show),
+    "lookup": lambda clients: LookupIndex(
+        clients,
+        fields=(
+            lambda client: (client.name,),
+            lambda client: (client.filename, os.path.splitext(client.filename)[0]),
+        ),
+    ),
+}
+
+
+def build_indexes(clients: List[Client]) -> Dict[str, object]:
+    """Every catalog index over ``clients``"""
+    return {kind: build(clients) for kind, build in INDEX_BUILDERS.items()}
+
+
+class ClientCatalog:
+    """In-memory cache of the atlas client lists shared by every cog.
+
+    A background task refreshes every endpoint on an interval. Readers always
+    get the last good list, both while a refresh is running and after one
+    fails, and concurrent refreshes of the same endpoint share one request.
+    """
+
+    ENDPOINTS = ("clients", "fabric-clients", "forge-clients")
+
+    def __init__(self, atlas: AtlasClient, refresh_interval: float = 300):
+        self.atlas = atlas
+        self.refresh_interval = refresh_interval
+        self._clients: Dict[str, List[Client]] = {}
+        self._fetched_at: Dict[str, float] = {}
+        self._versions: Dict[str, int] = {}
+        self._validators: Dict[str, Validators] = {}
+        self._indexes: Dict[Tuple[str, str], Tuple[int, object]] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+        self.failures = 0
+        self.not_modified = 0
+
+    async def _fetch(self, endpoint: str) -> Optional[List[Client]]:
+        """Fetch and decode ``endpoint``; on 304 Not Modified the cached list is returned as is"""
+        try:
+            cached = self._clients.get(endpoint)
+            response = await self.atlas.get_json_if_changed(
+                f"/api/v1/{endpoint}",
+                self._validators.get(endpoint) if cached is not None else None,
+            )
+            if response is None:
+                return cached
+            data, validators = response
+
+            if isinstance(data, dict) and "data" in data:
+                clients_data = data["data"]
+            elif isinstance(data, list):
+                clients_data = data
+            else:
+                logger.error(f"Unexpected API response format: {type(data)}")
+                return None
+
+            clients = [Client.from_dict(client) for client in clients_data]
+            self._validators[endpoint] = validators
+            return clients
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Failed to fetch clients from {endpoint}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Error parsing client data: {e}")
+            return None
+
+    async def _refresh(self, endpoint: str) -> Optional[List[Client]]:
+        try:
+            clients = await self._fetch(endpoint)
+            if clients is None:
+                self.failures += 1
+                return self._clients.get(endpoint)
+
+            if clients is self._clients.get(endpoint):
+                self.not_modified += 1
+                self._fetched_at[endpoint] = time.monotonic()
+                logger.debug(f"Catalog {endpoint} not modified")
+                return clients
+
+            # Indexing a large catalog takes long enough to stall the event loop
+            indexes = await asyncio.to_thread(build_indexes, clients)
+            self.update(endpoint, clients, indexes)
+            logger.debug(f"Catalog {endpoint} refreshed with {len(clients)} clients")
+            return clients
+        finally:
+            self._inflight.pop(endpoint, None)
+
+    def update(
+        self, endpoint: str, clients: List[Client], indexes: Optional[Dict[str, object]] = None
+    ):
+        """Replace the cached list for ``endpoint`` and bump its version.
+
+        ``indexes`` built ahead of time from ``clients`` are published with the
+        new version; any index not given is built on first use.
+        """
+        version = self._versions.get(endpoint, 0) + 1
+        self._clients[endpoint] = clients
+        self._fetched_at[endpoint] = time.monotonic()
+        self._versions[endpoint] = version
+        for kind, index in (indexes or {}).items():
+            self._indexes[(kind, endpoint)] = (version, index)
+
+    def refresh(self, endpoint: str) -> "asyncio.Task[Optional[List[Client]]]":
+        """Start a refresh of ``endpoint``, or join the one already running"""
+        task = self._inflight.get(endpoint)
+        if task is None:
+            task = asyncio.create_task(self._refresh(endpoint))
+            self._inflight[endpoint] = task
+        return task
+
+    async def refresh_all(self):
+        await asyncio.gather(*(self.refresh(endpoint) for endpoint in self.ENDPOINTS))
+
+    def peek(self, endpoint: str = "clients") -> List[Client]:
+        """Return the cached list (or an empty one) without touching hit statistics"""
+        return self._clients.get(endpoint, [])
+
+    def version(self, endpoint: str = "clients") -> int:
+        """Counter bumped every time ``endpoint`` is refreshed successfully"""
+        return self._versions.get(endpoint, 0)
+
+    def _index(self, kind: str, endpoint: str):
+        version = self.version(endpoint)
+        cached = self._indexes.get((kind, endpoint))
+        if cached is None or cached[0] != version:
+            cached = (version, INDEX_BUILDERS[kind](self.peek(endpoint)))
+            self._indexes[(kind, endpoint)] = cached
+        return cached[1]
+
+    def name_index(self, endpoint: str = "clients") -> NameIndex:
+        """Autocomplete index of visible client names, rebuilt when the catalog changes"""
+        return self._index("name", endpoint)
+
+    def lookup_index(self, endpoint: str = "clients") -> LookupIndex[Client]:
+        """Name and filename lookup index for /client, rebuilt when the catalog changes"""
+        return self._index("lookup", endpoint)
+
+    def get(self, endpoint: str = "clients") -> Optional[List[Client]]:
+        """Return the cached list without waiting, scheduling a refresh if it is stale"""
+        clients = self._clients.get(endpoint)
+        if clients is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        if self.age(endpoint) > self.refresh_interval * 2:
+            self.refresh(endpoint)
+        return clients
+
+    async def fetch(self, endpoint: str = "clients") -> Optional[List[Client]]:
+        """Return the cached list, fetching it first if nothing is cached yet"""
+        clients = self._clients.get(endpoint)
+        if clients is not None:
+            return clients
+        return await asyncio.shield(self.refresh(endpoint))
+
+    def age(self, endpoint: str = "clients") -> float:
+        """Seconds since ``endpoint`` was last refreshed successfully"""
+        fetched_at = self._fetched_at.get(endpoint)
+        return time.monotonic() - fetched_at if fetched_at is not None else float("inf")
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            await self.refresh_all()
+            logger.info(
+                f"Client catalog refreshed, hit rate {self.hit_rate:.0%} "
+                f"({self.hits} hits, {self.misses} misses, {self.failures} failures, "
+                f"{self.not_modified} not modified)"
+            )
+
+    def start(self):
+        """Refresh every endpoint each ``refresh_interval`` seconds, sleeping first"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
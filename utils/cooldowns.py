@@ -0,0 +1,75 @@
+import heapq
+import time
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+class CooldownStore:
+    """Cooldown tracker with heap-based expiry and a hard cap on live entries.
+
+    Keys are small hashables such as ``(rule_name, user_id)`` tuples. Expired
+    entries are dropped lazily on every access, and once ``max_size`` is
+    reached the entry closest to expiry is evicted, so memory stays flat no
+    matter how many distinct users trigger responses.
+    """
+
+    __slots__ = ("max_size", "_expiries", "_heap", "expired", "evicted")
+
+    def __init__(self, max_size: int = 50_000):
+        self.max_size = max_size
+        self._expiries: Dict[Hashable, float] = {}
+        self._heap: List[Tuple[float, Hashable]] = []
+        self.expired = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._expiries)
+
+    def _pop(self) -> bool:
+        """Remove the entry closest to expiry, returning False if the heap is empty"""
+        while self._heap:
+            expiry, key = heapq.heappop(self._heap)
+            if self._expiries.get(key) == expiry:
+                del self._expiries[key]
+                return True
+        return False
+
+    def purge(self, now: Optional[float] = None):
+        """Drop every entry whose cooldown has elapsed"""
+        if now is None:
+            now = time.monotonic()
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            if self._pop():
+                self.expired += 1
+
+    def hit(self, key: Hashable, duration: float, now: Optional[float] = None) -> bool:
+        """Return True if ``key`` is on cooldown, otherwise start its cooldown"""
+        if now is None:
+            now = time.monotonic()
+        self.purge(now)
+
+        if key in self._expiries:
+            return True
+        if duration <= 0:
+            return False
+
+        expiry = now + duration
+        self._expiries[key] = expiry
+        heapq.heappush(self._heap, (expiry, key))
+
+        while len(self._expiries) > self.max_size and self._pop():
+            self.evicted += 1
+
+        return False
+
+    def clear(self):
+        self._expiries.clear()
+        self._heap.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._expiries),
+            "max_size": self.max_size,
+            "expired": self.expired,
+            "evicted": self.evicted,
+        }
@@ -0,0 +1,145 @@
+from typing import Iterable, Optional, Tuple
+
+import discord
+
+Field = Tuple[str, str, bool]
+
+
+class EmbedTemplate:
+    """An embed built once and kept in its payload dict form.
+
+    ``embed`` is a shared instance for responses without per-call parts and
+    must not be modified. ``render`` builds a fresh embed from the payload
+    with the per-call footer, thumbnail, description or extra fields filled in.
+    """
+
+    __slots__ = ("payload", "_embed")
+
+    def __init__(
+        self,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        color: Optional[int] = None,
+        fields: Iterable[Field] = (),
+        footer: Optional[str] = None,
+    ):
+        embed = discord.Embed(title=title, description=description, color=color)
+        for name, value, inline in fields:
+            embed.add_field(name=name, value=value, inline=inline)
+        if footer:
+            embed.set_footer(text=footer)
+        self.payload = embed.to_dict()
+        self._embed: Optional[discord.Embed] = None
+
+    def __getstate__(self):
+        return self.payload
+
+    def __setstate__(self, payload):
+        self.payload = payload
+        self._embed = None
+
+    @property
+    def embed(self) -> discord.Embed:
+        if self._embed is None:
+            self._embed = discord.Embed.from_dict(self.payload)
+        return self._embed
+
+    def render(
+        self,
+        *,
+        description: Optional[str] = None,
+        footer: Optional[str] = None,
+        footer_icon: Optional[str] = None,
+        thumbnail: Optional[str] = None,
+        fields: Iterable[Field] = (),
+    ) -> discord.Embed:
+        embed = discord.Embed.from_dict(self.payload)
+        if description is not None:
+            embed.description = description
+        if footer is not None:
+            embed.set_footer(text=footer, icon_url=footer_icon)
+        if thumbnail:
+            embed.set_thumbnail(url=thumbnail)
+        for name, value, inline in fields:
+            embed.add_field(name=name, value=value, inline=inline)
+        return embed
+
+
+def bot_avatar(bot: discord.Bot) -> Optional[str]:
+    """URL of the bot's avatar once logged in, for thumbnails and footers"""
+    return bot.user.avatar.url if bot.user and bot.user.avatar else None
+
+
+STAFF_ONLY = EmbedTemplate(
+    title="❌ Access Denied",
+    description="You don't have permission to use this command.",
+    color=0xFF4444,
+)
+
+THREAD_STAFF_ONLY = EmbedTemplate(
+    title="❌ Access Denied",
+    description="You don't have permission to use this command.",
+    color=0xFF4444,
+    fields=[("Required Permissions", "Staff role required", False)],
+)
+
+ADMIN_ONLY = EmbedTemplate(
+    title="❌ Access Denied",
+    description="This command is restricted to administrators.",
+    color=0xFF4444,
+)
+
+MAIN_ADMIN_ONLY = EmbedTemplate(
+    title="❌ Access Denied",
+    description="This command is only available to the main administrator.",
+    color=0xFF4444,
+)
+
+STAFF_ONLY_RU = EmbedTemplate(
+    title="❌ Доступ запрещен",
+    description="Эта команда доступна только персоналу.",
+    color=0xFF4444,
+)
+
+MAIN_ADMIN_ONLY_RU = EmbedTemplate(
+    title="❌ Доступ запрещен",
+    description="Эта команда доступна только главному администратору.",
+    color=0xFF4444,
+)
+
+MISSING_PERMISSIONS = EmbedTemplate(
+    title="❌ Missing Permissions",
+    description="You don't have the required permissions to use this command.",
+    color=0xFF4444,
+)
+
+COMMAND_ON_COOLDOWN = EmbedTemplate(title="⏰ Command on Cooldown", color=0xFFAA00)
+
+COMMAND_ERROR = EmbedTemplate(
+    title="❌ An Error Occurred",
+    description="An unexpected error occurred while processing your command.",
+    color=0xFF4444,
+    fields=[
+        (
+            "💡 What to do",
+            "• Try the command again\n• Contact an administrator if the issue persists",
+            False,
+        )
+    ],
+)
+
+SOCIALS = EmbedTemplate(
+    title="🌐 CollapseLoader Social Links",
+    description="Connect with us on various platforms!",
+    color=0x1DA1F2,
+    fields=[
+        (
+            "📱 Social Platforms",
+            "📱 [Telegram](https://t.me/collapseloader)\n"
+            "💬 [Discord](https://discord.com/invite/FyKtnFqs6J)\n"
+            "🌐 [Website](https://collapseloader.org)",
+            False,
+        )
+    ],
+    footer="Join our community!",
+)
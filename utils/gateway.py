@@ -0,0 +1,97 @@
+import asyncio
+from typing import Any, Dict, NamedTuple, Optional, Union
+
+import discord
+
+from logger import logger
+
+
+class GatewayProfile(NamedTuple):
+    """Intents and cache policy the bot connects to the gateway with"""
+
+    intents: discord.Intents
+    member_cache_flags: discord.MemberCacheFlags
+    chunk_guilds_at_startup: bool
+    max_messages: Optional[int]
+
+    def options(self) -> Dict[str, Any]:
+        return self._asdict()
+
+
+def _lean_intents(presences: bool) -> discord.Intents:
+    return discord.Intents(
+        guilds=True,
+        members=True,
+        guild_messages=True,
+        dm_messages=True,
+        message_content=True,
+        presences=presences,
+    )
+
+
+PROFILES = {
+    # Everything streamed and cached, as the bot originally ran
+    "full": lambda: GatewayProfile(
+        intents=discord.Intents.all(),
+        member_cache_flags=discord.MemberCacheFlags.all(),
+        chunk_guilds_at_startup=True,
+        max_messages=1000,
+    ),
+    # Only what the cogs read; members and presences for /user are fetched on demand
+    "lean": lambda: GatewayProfile(
+        intents=_lean_intents(presences=True),
+        member_cache_flags=discord.MemberCacheFlags.none(),
+        chunk_guilds_at_startup=False,
+        max_messages=None,
+    ),
+    # As lean, but presence updates are not streamed at all and /user shows no status
+    "minimal": lambda: GatewayProfile(
+        intents=_lean_intents(presences=False),
+        member_cache_flags=discord.MemberCacheFlags.none(),
+        chunk_guilds_at_startup=False,
+        max_messages=None,
+    ),
+}
+
+
+def get_profile(name: str) -> GatewayProfile:
+    """Build the named gateway profile, falling back to lean for unknown names"""
+    factory = PROFILES.get(name)
+    if factory is None:
+        logger.warning(f"Unknown gateway profile {name!r}, using 'lean'")
+        factory = PROFILES["lean"]
+    return factory()
+
+
+async def fetch_member(
+    guild: Optional[discord.Guild],
+    user: Union[discord.User, discord.Member],
+    presences: bool,
+    timeout: float = 2.0,
+) -> Optional[discord.Member]:
+    """Resolve ``user`` as a member of ``guild`` when a command needs it.
+
+    A cached member is used as is. Otherwise, with the presences intent, the
+    single member is queried over the gateway with its presence, uncached and
+    within ``timeout`` so the interaction does not expire. Without the intent
+    the member resolved from the interaction is used.
+    """
+    resolved = user if isinstance(user, discord.Member) else None
+    if guild is None:
+        return resolved
+
+    cached = guild.get_member(user.id)
+    if cached is not None:
+        return cached
+    if not presences:
+        return resolved
+
+    try:
+        members = await asyncio.wait_for(
+            guild.query_members(user_ids=[user.id], limit=1, presences=True, cache=False),
+            timeout=timeout,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to query member {user.id} in {guild.id}: {e}")
+        return resolved
+    return members[0] if members else None
@@ -1,3 +1,6 @@
+import os
+import resource
+import sys
 import time
 from typing import Optional
 
@@ -49,6 +52,18 @@ def get_uptime_string(start_time: float) -> str:
     return uptime_string
 
 
+def get_rss_mb() -> float:
+    """Current resident set size of the process in MiB"""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, IndexError):
+        # Peak RSS, reported in KiB on Linux and bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (2**20 if sys.platform == "darwin" else 2**10)
+
+
 def bold(msg: str) -> str:
     """Format text as bold for Discord markdown"""
     return f"**{msg}**"
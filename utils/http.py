@@ -0,0 +1,109 @@
+import json
+import time
+from typing import Any, NamedTuple, Optional, Tuple
+
+import aiohttp
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - the stdlib decoder is only slower
+    orjson = None
+
+from logger import logger
+from utils.metrics import metrics
+
+
+def decode_json(body: bytes) -> Any:
+    """Decode a JSON response body, with orjson when it is installed"""
+    if not body:
+        return None
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+class Validators(NamedTuple):
+    """Cache validators of a response, sent back to make the next GET conditional"""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+    def headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class AtlasClient:
+    """Shared keep-alive HTTP client for the atlas API.
+
+    One instance lives on the bot for its whole lifetime so every cog reuses the
+    same connection pool instead of blocking the event loop with ``requests``.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 10.0, pool_size: int = 20):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Lazily create the session, which must happen inside the running loop"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.pool_size, keepalive_timeout=60
+                ),
+                headers={"User-Agent": "CollapseBot", "Accept-Encoding": "gzip"},
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                raise_for_status=True,
+            )
+        return self._session
+
+    async def get_json(self, path: str, *, timeout: Optional[float] = None) -> Any:
+        """GET ``path`` relative to the base URL and decode the JSON body"""
+        data, _ = await self.get_json_if_changed(path, timeout=timeout)
+        return data
+
+    async def get_json_if_changed(
+        self,
+        path: str,
+        validators: Optional[Validators] = None,
+        *,
+        timeout: Optional[float] = None,
+    ) -> Optional[Tuple[Any, Validators]]:
+        """Conditional GET of ``path``, returning the decoded body and its validators.
+
+        Returns None without reading the body when the server answers
+        304 Not Modified to the ``If-None-Match``/``If-Modified-Since`` headers.
+        ``timeout`` overrides the client's default total timeout for this request.
+        """
+        # Passing timeout=None would replace the session's default with no timeout
+        options = {"timeout": aiohttp.ClientTimeout(total=timeout)} if timeout is not None else {}
+        started = time.perf_counter()
+        try:
+            async with self.session.get(
+                f"{self.base_url}{path}",
+                headers=validators.headers() if validators else None,
+                **options,
+            ) as response:
+                if response.status == 304:
+                    return None
+                body = await response.read()
+                return decode_json(body), Validators(
+                    response.headers.get("ETag"), response.headers.get("Last-Modified")
+                )
+        except Exception as e:
+            if metrics.enabled:
+                metrics.atlas_errors.inc(path, type(e).__name__)
+            raise
+        finally:
+            if metrics.enabled:
+                metrics.atlas_seconds.observe(time.perf_counter() - started, path)
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.info("Atlas HTTP session closed")
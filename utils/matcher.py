@@ -0,0 +1,75 @@
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+
+class TriggerMatcher:
+    """Aho-Corasick automaton over the triggers of every automatic response rule.
+
+    Built once per (re)load, it finds every rule with at least one trigger in a
+    message in a single pass over the text. Rule indices are returned in rule
+    order so callers keep the first-match-wins semantics of the YAML file.
+    """
+
+    __slots__ = ("_goto", "_fail", "_output", "_always", "rule_count")
+
+    def __init__(self, rules: Sequence[Tuple[str, Iterable[str]]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[frozenset] = [frozenset()]
+        self._always: frozenset = frozenset()
+        self.rule_count = len(rules)
+
+        outputs: List[set] = [set()]
+        always = set()
+
+        for index, (_, triggers) in enumerate(rules):
+            for trigger in triggers:
+                trigger = str(trigger).lower()
+                if not trigger:
+                    always.add(index)
+                    continue
+
+                node = 0
+                for char in trigger:
+                    next_node = self._goto[node].get(char)
+                    if next_node is None:
+                        next_node = len(self._goto)
+                        self._goto.append({})
+                        self._fail.append(0)
+                        outputs.append(set())
+                        self._goto[node][char] = next_node
+                    node = next_node
+                outputs[node].add(index)
+
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                outputs[child] |= outputs[self._fail[child]]
+
+        self._output = [frozenset(output) for output in outputs]
+        self._always = frozenset(always)
+
+    def match(self, text: str) -> List[int]:
+        """Return indices of rules with a trigger in ``text`` (already lowercased), in rule order"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        found = set(self._always)
+
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node]:
+                found |= output[node]
+
+        return sorted(found)
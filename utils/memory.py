@@ -0,0 +1,144 @@
+import asyncio
+import os
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from logger import logger
+from utils.helpers import get_rss_mb
+
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def format_size(size: float) -> str:
+    units = ("B", "KiB", "MiB", "GiB")
+    index = 0
+    while abs(size) >= 1024 and index < len(units) - 1:
+        size /= 1024
+        index += 1
+    return f"{size:+.1f} {units[index]}"
+
+
+def format_location(stat: tracemalloc.StatisticDiff) -> str:
+    frame = stat.traceback[0]
+    filename = frame.filename
+    marker = f"site-packages{os.sep}"
+    if marker in filename:
+        filename = filename.split(marker, 1)[1]
+    else:
+        filename = os.path.relpath(filename) if os.path.isabs(filename) else filename
+    return f"{filename}:{frame.lineno}"
+
+
+class MemoryProfiler:
+    """tracemalloc captures diffed against the snapshot taken when they start.
+
+    tracemalloc only runs between ``start`` and ``stop``, so allocations carry
+    no tracing overhead outside an explicit capture.
+    """
+
+    def __init__(self, frames: int = 1):
+        self.frames = frames
+        self.started_at: Optional[float] = None
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._periodic: Optional[asyncio.Task] = None
+
+    @property
+    def active(self) -> bool:
+        return self._baseline is not None and tracemalloc.is_tracing()
+
+    def _take(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+
+    def start(self) -> bool:
+        """Start tracing and take the baseline; False if a capture is already running"""
+        if self.active:
+            return False
+        tracemalloc.start(self.frames)
+        self._baseline = self._take()
+        self.started_at = time.monotonic()
+        logger.info("🧠 Memory capture started")
+        return True
+
+    def stop(self):
+        if self._periodic is not None:
+            self._periodic.cancel()
+            self._periodic = None
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        if self._baseline is not None:
+            logger.info("🧠 Memory capture stopped")
+        self._baseline = None
+        self.started_at = None
+
+    def traced(self) -> Dict[str, int]:
+        """Bytes currently held by traced allocations and their peak"""
+        current, peak = tracemalloc.get_traced_memory()
+        return {"current": current, "peak": peak}
+
+    def top(self, limit: int = 10) -> List[tracemalloc.StatisticDiff]:
+        """Allocation sites that grew the most since the baseline"""
+        if not self.active:
+            return []
+        stats = self._take().compare_to(self._baseline, "lineno")
+        return [stat for stat in stats if stat.size_diff > 0][:limit]
+
+    async def diff(self, limit: int = 10) -> List[tracemalloc.StatisticDiff]:
+        """``top`` with the comparison run in a worker thread"""
+        return await asyncio.to_thread(self.top, limit)
+
+    def log_every(self, interval: float, limit: int = 5):
+        """Log RSS and the top allocation sites every ``interval`` seconds while capturing"""
+        if self._periodic is not None:
+            self._periodic.cancel()
+        self._periodic = asyncio.create_task(self._log_loop(interval, limit))
+
+    async def _log_loop(self, interval: float, limit: int):
+        while self.active:
+            await asyncio.sleep(interval)
+            try:
+                stats = await self.diff(limit)
+            except Exception as e:
+                logger.error(f"Memory snapshot failed: {e}")
+                continue
+            lines = [
+                f"  {format_size(stat.size_diff)} ({stat.count_diff:+} blocks) {format_location(stat)}"
+                for stat in stats
+            ]
+            logger.info(
+                f"🧠 RSS {get_rss_mb():.1f} MB, traced {self.traced()['current'] / 2**20:.1f} MB"
+                + ("\n" + "\n".join(lines) if lines else "")
+            )
+
+
+def cache_sizes(bot) -> Dict[str, int]:
+    """Entry counts of the bot's own caches and discord's state caches"""
+    sizes: Dict[str, int] = {}
+
+    responses = bot.get_cog("AutomaticResponsesCog")
+    if responses is not None:
+        sizes["rules"] = len(responses.ruleset)
+        sizes["cooldowns"] = len(responses.cooldowns)
+        sizes["rate limit counters"] = len(responses.rate_limits)
+        sizes["outbound replies"] = len(responses.replies)
+    admin = bot.get_cog("AdminCog")
+    if admin is not None:
+        sizes["snippets"] = len(admin.snippets)
+    for endpoint in bot.catalog.ENDPOINTS:
+        sizes[f"catalog {endpoint}"] = len(bot.catalog.peek(endpoint))
+
+    sizes["discord members"] = sum(len(guild.members) for guild in bot.guilds)
+    sizes["discord users"] = len(bot.users)
+    sizes["discord messages"] = len(bot.cached_messages)
+    sizes["discord channels"] = sum(len(guild.channels) for guild in bot.guilds) + len(
+        bot.private_channels
+    )
+    return sizes
+
+
+profiler = MemoryProfiler()
@@ -0,0 +1,281 @@
+import logging
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from aiohttp import web
+
+from logger import logger
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+def _labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1):
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for label_values, value in self._values.items():
+            lines.append(f"{self.name}{_labels(self.labels, label_values)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = buckets
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, *label_values: str):
+        series = self._series.get(label_values)
+        if series is None:
+            series = self._series[label_values] = [0] * (len(self.buckets) + 3)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for label_values, series in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                le = f'le="{bound}"'
+                lines.append(
+                    f"{self.name}_bucket{_labels(self.labels, label_values, le)} {cumulative}"
+                )
+            le = 'le="+Inf"'
+            lines.append(
+                f"{self.name}_bucket{_labels(self.labels, label_values, le)} {series[-1]}"
+            )
+            lines.append(f"{self.name}_sum{_labels(self.labels, label_values)} {series[-2]}")
+            lines.append(f"{self.name}_count{_labels(self.labels, label_values)} {series[-1]}")
+        return lines
+
+
+CallbackValue = Union[float, Dict[Tuple[str, ...], float]]
+
+
+class CallbackMetric:
+    """Metric whose value is read from ``callback`` at scrape time"""
+
+    type = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        callback: Callable[[], CallbackValue],
+        labels: Tuple[str, ...] = (),
+    ):
+        self.name = name
+        self.help = help
+        self.callback = callback
+        self.labels = labels
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+        try:
+            value = self.callback()
+        except Exception as e:
+            logger.debug(f"Metric {self.name} failed: {e}")
+            return lines
+        values = value if isinstance(value, dict) else {(): value}
+        for label_values, sample in values.items():
+            lines.append(f"{self.name}{_labels(self.labels, label_values)} {_number(sample)}")
+        return lines
+
+
+class Gauge(CallbackMetric):
+    """Current value, such as a queue depth, that can go up and down"""
+
+    type = "gauge"
+
+
+class CallbackCounter(CallbackMetric):
+    """Counter over a total the bot already keeps, such as ``CooldownStore.evicted``"""
+
+    type = "counter"
+
+
+class Metrics:
+    """Process-wide metrics, only recorded while ``enabled`` is set.
+
+    Hot paths check ``metrics.enabled`` before timing anything, so with the
+    endpoint disabled (the default) recording costs one attribute lookup.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.on_message_seconds = Histogram(
+            "collapsebot_on_message_seconds",
+            "Time spent handling a message in AutomaticResponsesCog.on_message",
+        )
+        self.rule_matches = Counter(
+            "collapsebot_rule_matches_total",
+            "Automatic responses sent, per rule",
+            ("rule",),
+        )
+        self.atlas_seconds = Histogram(
+            "collapsebot_atlas_request_seconds",
+            "Atlas API request latency",
+            ("path",),
+        )
+        self.atlas_errors = Counter(
+            "collapsebot_atlas_errors_total",
+            "Failed atlas API requests",
+            ("path", "error"),
+        )
+        self.discord_429 = Counter(
+            "collapsebot_discord_rate_limited_total",
+            "Discord REST 429 responses, per route",
+            ("route",),
+        )
+        self._callbacks: List[CallbackMetric] = []
+
+    def gauge(self, name: str, help: str, callback: Callable[[], CallbackValue], labels=()):
+        self._callbacks.append(Gauge(name, help, callback, labels))
+
+    def counter(self, name: str, help: str, callback: Callable[[], CallbackValue], labels=()):
+        """Export a monotonically growing total kept elsewhere; ``name`` ends in _total"""
+        self._callbacks.append(CallbackCounter(name, help, callback, labels))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in (
+            self.on_message_seconds,
+            self.rule_matches,
+            self.atlas_seconds,
+            self.atlas_errors,
+            self.discord_429,
+            *self._callbacks,
+        ):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
+
+
+class RateLimitLogHandler(logging.Handler):
+    """Counts discord.py's "We are being rate limited" warnings per route"""
+
+    def emit(self, record: logging.LogRecord):
+        if not str(record.msg).startswith("We are being rate limited") or len(record.args) < 2:
+            return
+        bucket = str(record.args[1])
+        route = bucket.split(":", 2)[-1] if bucket.count(":") >= 2 else bucket
+        metrics.discord_429.inc(route)
+
+
+def register_bot_gauges(bot):
+    metrics.gauge(
+        "collapsebot_gateway_latency_seconds",
+        "Discord gateway heartbeat latency",
+        lambda: bot.latency,
+    )
+    metrics.gauge(
+        "collapsebot_catalog_hit_ratio",
+        "Share of catalog reads served from cache",
+        lambda: bot.catalog.hit_rate,
+    )
+    metrics.gauge(
+        "collapsebot_catalog_age_seconds",
+        "Seconds since each catalog endpoint was refreshed",
+        lambda: {(endpoint,): bot.catalog.age(endpoint) for endpoint in bot.catalog.ENDPOINTS},
+        ("endpoint",),
+    )
+    metrics.counter(
+        "collapsebot_catalog_refreshes_total",
+        "Catalog refreshes by outcome; not_modified skipped downloading and decoding",
+        lambda: {
+            ("not_modified",): bot.catalog.not_modified,
+            ("failed",): bot.catalog.failures,
+        },
+        ("outcome",),
+    )
+    metrics.gauge(
+        "collapsebot_cooldown_entries",
+        "Live entries in the automatic response cooldown store",
+        lambda: len(bot.get_cog("AutomaticResponsesCog").cooldowns),
+    )
+    metrics.counter(
+        "collapsebot_cooldown_evictions_total",
+        "Cooldown entries dropped, by reason",
+        lambda: {
+            ("expired",): bot.get_cog("AutomaticResponsesCog").cooldowns.expired,
+            ("evicted",): bot.get_cog("AutomaticResponsesCog").cooldowns.evicted,
+        },
+        ("reason",),
+    )
+    metrics.gauge(
+        "collapsebot_outbound_pending",
+        "Automatic replies waiting in the outbound queue",
+        lambda: len(bot.get_cog("AutomaticResponsesCog").replies),
+    )
+    metrics.counter(
+        "collapsebot_outbound_replies_total",
+        "Automatic replies by outcome",
+        lambda: {
+            (outcome,): count
+            for outcome, count in bot.get_cog("AutomaticResponsesCog").replies.stats().items()
+            if outcome not in ("pending", "channels")
+        },
+        ("outcome",),
+    )
+
+
+async def start_metrics_server(bot, host: str, port: int) -> Optional[web.AppRunner]:
+    """Enable recording and serve /metrics in Prometheus text format"""
+
+    async def handle(_: web.Request) -> web.Response:
+        return web.Response(text=metrics.render(), content_type="text/plain")
+
+    metrics.enabled = True
+    register_bot_gauges(bot)
+    logging.getLogger("discord.http").addHandler(RateLimitLogHandler(logging.WARNING))
+
+    app = web.Application()
+    app.router.add_get("/metrics", handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, host, port).start()
+    except OSError as e:
+        logger.error(f"Failed to start metrics endpoint on {host}:{port}: {e}")
+        await runner.cleanup()
+        return None
+
+    logger.info(f"📈 Metrics endpoint listening on http://{host}:{port}/metrics")
+    return runner
@@ -0,0 +1,203 @@
+import asyncio
+import itertools
+import time
+from heapq import heapify, heappop, heappush
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from logger import logger
+
+PRIORITIES = {"low": 0, "normal": 1, "high": 2}
+LOW = PRIORITIES["low"]
+
+
+class TokenBucket:
+    """Classic token bucket refilled at ``rate`` tokens per second up to ``capacity``"""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self, now: Optional[float] = None) -> float:
+        """Take a token if one is available, otherwise return the seconds until one is"""
+        self._refill(time.monotonic() if now is None else now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def full(self, now: Optional[float] = None) -> bool:
+        self._refill(time.monotonic() if now is None else now)
+        return self.tokens >= self.capacity
+
+
+class OutboundReply:
+    """One queued automatic reply; ``key`` identifies identical replies for merging"""
+
+    __slots__ = ("channel_id", "priority", "key", "send", "created", "merged")
+
+    def __init__(
+        self,
+        channel_id: int,
+        send: Callable[[], Awaitable[object]],
+        priority: int = PRIORITIES["normal"],
+        key: Optional[str] = None,
+    ):
+        self.channel_id = channel_id
+        self.send = send
+        self.priority = priority
+        self.key = key
+        self.created = time.monotonic()
+        self.merged = 0
+
+
+QueueEntry = Tuple[int, int, OutboundReply]
+
+
+class ReplyScheduler:
+    """Global outbound queue for automatic replies.
+
+    Replies are queued per channel, highest priority first, and each busy
+    channel gets its own worker so independent channels are served
+    concurrently. A worker takes a token from its channel's bucket and from the
+    shared global bucket before every send. Under a flood, low-priority replies
+    are merged into an identical pending reply or dropped once the channel's
+    backlog reaches ``flood_threshold``, a full queue evicts its lowest-priority
+    entry, and replies older than ``max_age`` are discarded unsent.
+    """
+
+    def __init__(
+        self,
+        global_rate: float = 40,
+        global_burst: float = 40,
+        channel_rate: float = 1.0,
+        channel_burst: float = 5,
+        max_pending: int = 20,
+        flood_threshold: int = 3,
+        max_age: float = 30.0,
+        max_idle_buckets: int = 1000,
+    ):
+        self.global_bucket = TokenBucket(global_rate, global_burst)
+        self.channel_rate = channel_rate
+        self.channel_burst = channel_burst
+        self.max_pending = max_pending
+        self.flood_threshold = flood_threshold
+        self.max_age = max_age
+        self.max_idle_buckets = max_idle_buckets
+        self._queues: Dict[int, List[QueueEntry]] = {}
+        self._buckets: Dict[int, TokenBucket] = {}
+        self._workers: Dict[int, asyncio.Task] = {}
+        self._sequence = itertools.count()
+        self.sent = 0
+        self.merged = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def submit(self, reply: OutboundReply) -> bool:
+        """Queue ``reply``; False if it was merged into a pending reply or dropped"""
+        queue = self._queues.setdefault(reply.channel_id, [])
+
+        if reply.priority == LOW and queue:
+            if reply.key is not None:
+                for _, _, pending in queue:
+                    if pending.key == reply.key:
+                        pending.merged += 1
+                        self.merged += 1
+                        return False
+            if len(queue) >= self.flood_threshold:
+                self.dropped += 1
+                return False
+
+        if len(queue) >= self.max_pending:
+            lowest = max(queue)
+            if -lowest[0] >= reply.priority:
+                self.dropped += 1
+                return False
+            queue.remove(lowest)
+            heapify(queue)
+            self.dropped += 1
+
+        heappush(queue, (-reply.priority, next(self._sequence), reply))
+        if reply.channel_id not in self._workers:
+            self._workers[reply.channel_id] = asyncio.create_task(
+                self._drain(reply.channel_id)
+            )
+        return True
+
+    def _bucket(self, channel_id: int) -> TokenBucket:
+        bucket = self._buckets.get(channel_id)
+        if bucket is None:
+            if len(self._buckets) >= self.max_idle_buckets:
+                now = time.monotonic()
+                for idle_id in [
+                    idle_id
+                    for idle_id, idle in self._buckets.items()
+                    if idle_id not in self._workers and idle.full(now)
+                ]:
+                    del self._buckets[idle_id]
+            bucket = self._buckets[channel_id] = TokenBucket(
+                self.channel_rate, self.channel_burst
+            )
+        return bucket
+
+    @staticmethod
+    async def _acquire(bucket: TokenBucket):
+        while (wait := bucket.take()) > 0:
+            await asyncio.sleep(wait)
+
+    async def _drain(self, channel_id: int):
+        queue = self._queues[channel_id]
+        bucket = self._bucket(channel_id)
+        try:
+            while queue:
+                await self._acquire(bucket)
+                await self._acquire(self.global_bucket)
+
+                reply = None
+                now = time.monotonic()
+                while queue:
+                    _, _, candidate = heappop(queue)
+                    if now - candidate.created <= self.max_age:
+                        reply = candidate
+                        break
+                    self.dropped += 1
+                if reply is None:
+                    break
+
+                try:
+                    await reply.send()
+                    self.sent += 1
+                except Exception as e:
+                    self.failed += 1
+                    logger.error(f"Failed to send automatic response: {e}")
+        finally:
+            self._workers.pop(channel_id, None)
+            if not queue:
+                self._queues.pop(channel_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "pending": len(self),
+            "channels": len(self._workers),
+            "sent": self.sent,
+            "merged": self.merged,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+    def close(self):
+        """Cancel every worker and forget the pending replies"""
+        for worker in self._workers.values():
+            worker.cancel()
+        self._workers.clear()
+        self._queues.clear()
@@ -0,0 +1,132 @@
+import asyncio
+import copy
+import os
+import stat
+import tempfile
+import threading
+from typing import Callable, List, Optional
+
+import yaml
+
+from logger import logger
+
+
+def atomic_write_yaml(path: str, data) -> None:
+    """Dump ``data`` to a temp file next to ``path`` and rename it into place.
+
+    The temp file gets the permissions of the file it replaces (mkstemp creates
+    it 0600), and the directory is fsynced so the rename survives a crash.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            yaml.dump(data, file, default_flow_style=False, allow_unicode=True)
+            file.flush()
+            os.fsync(file.fileno())
+        try:
+            os.chmod(temp_path, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+    dir_fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+class DebouncedYAMLWriter:
+    """Coalesces bursts of saves into one atomic write done off the event loop.
+
+    Every call to :meth:`save` returns a future that resolves to True once a
+    write containing that change is on disk, or False if the write failed.
+    """
+
+    def __init__(self, path: str, snapshot: Callable[[], object], delay: float = 0.5):
+        self.path = path
+        self.snapshot = snapshot
+        self.delay = delay
+        self._waiters: List[asyncio.Future] = []
+        self._in_flight: List[asyncio.Future] = []
+        self._task: Optional[asyncio.Task] = None
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._written = 0
+
+    def save(self) -> "asyncio.Future[bool]":
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush())
+        return future
+
+    def _take(self):
+        """Snapshot the data and claim the waiters that this write will cover"""
+        waiters, self._waiters = self._waiters, []
+        self._generation += 1
+        return waiters, self._generation, copy.deepcopy(self.snapshot())
+
+    def _write(self, generation: int, data) -> None:
+        # A write still running in a worker thread when flush() is called must
+        # not land after, and overwrite, the newer data flush() wrote
+        with self._lock:
+            if generation <= self._written:
+                return
+            atomic_write_yaml(self.path, data)
+            self._written = generation
+
+    def _finish(self, waiters: List[asyncio.Future], result: bool):
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(result)
+
+    async def _flush(self):
+        while self._waiters:
+            await asyncio.sleep(self.delay)
+            waiters, generation, data = self._take()
+            self._in_flight = waiters
+
+            try:
+                await asyncio.to_thread(self._write, generation, data)
+                logger.info(f"Saved {self.path} ({len(waiters)} coalesced changes)")
+                result = True
+            except Exception as e:
+                logger.error(f"Failed to save {self.path}: {e}")
+                result = False
+
+            self._in_flight = []
+            self._finish(waiters, result)
+
+    def flush(self) -> bool:
+        """Write pending changes now, blocking the caller; for unload and shutdown"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if not self._waiters and not self._in_flight:
+            return True
+
+        # A cancelled background write may still finish, but its waiters are
+        # answered here since this write contains their changes too
+        in_flight, self._in_flight = self._in_flight, []
+        waiters, generation, data = self._take()
+        waiters = in_flight + waiters
+        try:
+            self._write(generation, data)
+            logger.info(f"Saved {self.path} ({len(waiters)} pending changes)")
+            result = True
+        except Exception as e:
+            logger.error(f"Failed to save {self.path}: {e}")
+            result = False
+
+        self._finish(waiters, result)
+        return result
@@ -0,0 +1,108 @@
+import time
+from typing import Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+
+SCOPES = ("user", "channel", "guild", "global")
+
+
+class RateLimit(NamedTuple):
+    """At most ``burst`` hits per sliding ``window`` seconds within one ``scope``"""
+
+    scope: str
+    window: float
+    burst: int
+
+
+LimitKey = Tuple[Hashable, RateLimit]
+
+
+class SlidingWindowLimiter:
+    """Approximate sliding-window counters for scoped rate limits.
+
+    Every key keeps the hit counts of the current and the previous fixed
+    window. The sliding count is the current count plus the previous one
+    weighted by how much of it still overlaps the window ending now, so each
+    check is O(1) and each key costs one four-item list.
+    """
+
+    __slots__ = ("max_size", "_counters", "limited", "evicted")
+
+    def __init__(self, max_size: int = 50_000):
+        self.max_size = max_size
+        # key -> [window, window index, previous count, current count]
+        self._counters: Dict[Hashable, List[float]] = {}
+        self.limited = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+    def count(self, key: Hashable, window: float, now: Optional[float] = None) -> float:
+        """Estimated hits for ``key`` within the last ``window`` seconds"""
+        if now is None:
+            now = time.monotonic()
+        counter = self._counters.get(key)
+        if counter is None:
+            return 0.0
+
+        index = int(now // window)
+        _, start, previous, current = counter
+        if index == start + 1:
+            previous, current = current, 0
+        elif index != start:
+            return 0.0
+        return previous * (1 - (now % window) / window) + current
+
+    def check(self, limits: Sequence[LimitKey], now: Optional[float] = None) -> bool:
+        """True if every limit still has room for one more hit"""
+        if now is None:
+            now = time.monotonic()
+        for key, limit in limits:
+            if self.count(key, limit.window, now) + 1 > limit.burst:
+                self.limited += 1
+                return False
+        return True
+
+    def record(self, limits: Sequence[LimitKey], now: Optional[float] = None):
+        """Count one hit against every limit"""
+        if now is None:
+            now = time.monotonic()
+        counters = self._counters
+        for key, limit in limits:
+            index = int(now // limit.window)
+            counter = counters.get(key)
+            if counter is None or counter[1] < index - 1:
+                counters[key] = [limit.window, index, 0, 1]
+            elif counter[1] == index - 1:
+                counter[1:] = [index, counter[3], 1]
+            else:
+                counter[3] += 1
+
+        if len(counters) > self.max_size:
+            self._evict(now)
+
+    def _evict(self, now: float):
+        """Drop counters that no longer affect any window, then the oldest ones"""
+        counters = self._counters
+        for key in [
+            key
+            for key, (window, index, _, _) in counters.items()
+            if int(now // window) > index + 1
+        ]:
+            del counters[key]
+
+        excess = len(counters) - int(self.max_size * 0.9)
+        if excess > 0:
+            for key in list(counters)[:excess]:
+                del counters[key]
+            self.evicted += excess
+
+    def clear(self):
+        self._counters.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._counters),
+            "max_size": self.max_size,
+            "limited": self.limited,
+            "evicted": self.evicted,
+        }
@@ -0,0 +1,170 @@
+import ast
+import asyncio
+import hashlib
+import importlib.util
+import pickle
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, NamedTuple
+
+import yaml
+
+from logger import logger
+
+YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Layout of the snapshot files themselves; changes to the compiled classes are
+# picked up by code_fingerprint without bumping this
+SNAPSHOT_FORMAT = b"5"
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _imported_modules(module: ModuleType, source: bytes) -> Iterator[ModuleType]:
+    """Modules named by the import statements in ``module``'s source"""
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            package = module.__name__ if hasattr(module, "__path__") else module.__package__
+            base = "." * node.level + (node.module or "")
+            base = importlib.util.resolve_name(base, package) if node.level else base
+            names = [base] + [f"{base}.{alias.name}" for alias in node.names]
+        else:
+            continue
+        for name in names:
+            if name in sys.modules:
+                yield sys.modules[name]
+
+
+def code_fingerprint(obj: Any, root: Path = PROJECT_ROOT) -> bytes:
+    """Hash of the source of the module defining ``obj`` and of every module
+    under ``root`` it imports, transitively"""
+    pending = [sys.modules[obj.__module__]]
+    sources: Dict[str, bytes] = {}
+    while pending:
+        module = pending.pop()
+        path = getattr(module, "__file__", None)
+        if module.__name__ in sources or path is None:
+            continue
+        path = Path(path).resolve()
+        if root not in path.parents:
+            continue
+        sources[module.__name__] = path.read_bytes()
+        pending.extend(_imported_modules(module, sources[module.__name__]))
+
+    digest = hashlib.sha256()
+    for name in sorted(sources):
+        digest.update(name.encode() + b"\0" + sources[name])
+    return digest.digest()
+
+
+class ConfigError(ValueError):
+    """Raised when a config file cannot be parsed or fails schema validation"""
+
+
+class ConfigEntry(NamedTuple):
+    path: str
+    compile: Callable[[Any], Any]
+    fingerprint: bytes
+
+
+class ConfigRegistry:
+    """Single owner of the bot's YAML config files.
+
+    Each file is parsed once with the C loader when libyaml is available,
+    validated and compiled by the registered ``compile`` callable, and the
+    compiled result is pickled to ``snapshot_dir`` under a hash of the file's
+    bytes and of the source of the code that compiled it, so an unchanged file
+    is restored from the snapshot on restart and any code change invalidates
+    it. Unreadable snapshots are treated as missing.
+
+    Snapshots are unpickled on load, so ``snapshot_dir`` (``.cache/config``)
+    must not be writable by other users; it is created owner-only.
+    """
+
+    def __init__(self, snapshot_dir: str):
+        self.snapshot_dir = Path(snapshot_dir)
+        self._entries: Dict[str, ConfigEntry] = {}
+        self._values: Dict[str, Any] = {}
+
+    def register(self, name: str, path: str, compile: Callable[[Any], Any]):
+        self._entries[name] = ConfigEntry(path, compile, code_fingerprint(compile))
+
+    def path(self, name: str) -> str:
+        return self._entries[name].path
+
+    def get(self, name: str) -> Any:
+        """Return the last successfully loaded value, loading it now if needed"""
+        if name not in self._values:
+            return self.load(name)
+        return self._values[name]
+
+    def _snapshot_path(self, name: str, raw: bytes) -> Path:
+        fingerprint = self._entries[name].fingerprint
+        digest = hashlib.sha256(
+            SNAPSHOT_FORMAT + fingerprint + name.encode() + b"\0" + raw
+        ).hexdigest()
+        return self.snapshot_dir / f"{name}-{digest[:16]}.pickle"
+
+    def _read_snapshot(self, snapshot: Path) -> Any:
+        try:
+            with open(snapshot, "rb") as file:
+                return pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable config snapshot {snapshot}: {e}")
+            return None
+
+    def _write_snapshot(self, name: str, snapshot: Path, value: Any):
+        try:
+            self.snapshot_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            for old in self.snapshot_dir.glob(f"{name}-*.pickle"):
+                old.unlink(missing_ok=True)
+            temp = snapshot.with_suffix(".tmp")
+            with open(temp, "wb") as file:
+                pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+            temp.replace(snapshot)
+        except Exception as e:
+            logger.warning(f"Failed to write config snapshot {snapshot}: {e}")
+
+    def build(self, name: str) -> Any:
+        """Read, parse and compile ``name`` without making it the active value"""
+        entry = self._entries[name]
+        started = time.perf_counter()
+
+        try:
+            raw = Path(entry.path).read_bytes()
+        except FileNotFoundError:
+            logger.warning(f"{entry.path} not found, using empty config")
+            raw = b""
+
+        snapshot = self._snapshot_path(name, raw)
+        value = self._read_snapshot(snapshot)
+        source = "snapshot"
+        if value is None:
+            try:
+                data = yaml.load(raw, Loader=YAMLLoader) or {}
+                value = entry.compile(data)
+            except (yaml.YAMLError, ValueError) as e:
+                raise ConfigError(f"{entry.path}: {e}") from e
+            self._write_snapshot(name, snapshot, value)
+            source = "yaml"
+
+        logger.debug(
+            f"Loaded {entry.path} from {source} in {(time.perf_counter() - started) * 1e6:.0f}µs"
+        )
+        return value
+
+    def load(self, name: str) -> Any:
+        value = self.build(name)
+        self._values[name] = value
+        return value
+
+    async def reload(self, name: str) -> Any:
+        """Build ``name`` in a worker thread and swap it in on the event loop"""
+        value = await asyncio.to_thread(self.build, name)
+        self._values[name] = value
+        return value
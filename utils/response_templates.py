@@ -0,0 +1,62 @@
+import re
+from datetime import datetime
+from typing import Callable, Dict, Tuple
+
+import discord
+
+PLACEHOLDER_PATTERN = re.compile(r"\{(\w+)\}")
+
+PLACEHOLDERS: Dict[str, Callable[[discord.Message], str]] = {
+    "user": lambda message: message.author.display_name,
+    "mention": lambda message: message.author.mention,
+    "username": lambda message: message.author.name,
+    "server": lambda message: message.guild.name if message.guild else "DM",
+    "channel": lambda message: getattr(message.channel, "name", None) or "DM",
+    "time": lambda message: datetime.now().strftime("%H:%M"),
+    "date": lambda message: datetime.now().strftime("%d.%m.%Y"),
+}
+
+
+class ResponseTemplate:
+    """Response string split once into literal and placeholder segments.
+
+    ``{name}`` patterns that are not in PLACEHOLDERS stay in the text as
+    written and are listed in ``unknown`` so the loader can report them.
+    """
+
+    __slots__ = ("source", "segments", "placeholders", "unknown")
+
+    def __init__(self, source: str):
+        self.source = source
+
+        segments = []
+        position = 0
+        unknown: Dict[str, None] = {}
+        for match in PLACEHOLDER_PATTERN.finditer(source):
+            name = match.group(1)
+            if name not in PLACEHOLDERS:
+                unknown[name] = None
+                continue
+            if match.start() > position:
+                segments.append((False, source[position : match.start()]))
+            segments.append((True, name))
+            position = match.end()
+        if position < len(source):
+            segments.append((False, source[position:]))
+
+        self.segments: Tuple[Tuple[bool, str], ...] = tuple(segments)
+        self.placeholders = frozenset(
+            text for is_placeholder, text in segments if is_placeholder
+        )
+        self.unknown: Tuple[str, ...] = tuple(unknown)
+
+    def render(self, message: discord.Message) -> str:
+        """Fill in the placeholders used by this template for ``message``"""
+        if not self.placeholders:
+            return self.source
+
+        values = {name: str(PLACEHOLDERS[name](message)) for name in self.placeholders}
+        return "".join(
+            values[text] if is_placeholder else text
+            for is_placeholder, text in self.segments
+        )
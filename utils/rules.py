@@ -0,0 +1,225 @@
+from typing import Dict, List, Tuple
+
+import discord
+
+from utils.matcher import TriggerMatcher
+from utils.outbound import PRIORITIES
+from utils.ratelimits import SCOPES, RateLimit
+from utils.response_templates import ResponseTemplate
+
+CHANNEL_TYPES = {
+    "text": discord.TextChannel,
+    "thread": discord.Thread,
+    "dm": discord.DMChannel,
+}
+
+
+class RuleError(ValueError):
+    """Raised when an automatic response rule does not match the expected schema"""
+
+
+def _string_list(name: str, field: str, value) -> Tuple[str, ...]:
+    if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+        raise RuleError(f"{name}: '{field}' must be a list of strings")
+    return tuple(value)
+
+
+def _number(name: str, field: str, value, minimum: float, maximum: float) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise RuleError(f"{name}: '{field}' must be a number")
+    if not minimum <= value <= maximum:
+        raise RuleError(f"{name}: '{field}' must be between {minimum} and {maximum}")
+    return float(value)
+
+
+def _choice(name: str, field: str, value, choices: Dict[str, int]) -> int:
+    if not isinstance(value, str) or value not in choices:
+        raise RuleError(f"{name}: '{field}' must be one of {', '.join(choices)}")
+    return choices[value]
+
+
+def _rate_limits(name: str, value) -> Tuple[RateLimit, ...]:
+    if not isinstance(value, dict):
+        raise RuleError(f"{name}: 'rate_limits' must be a mapping of scopes")
+    unknown = set(value) - set(SCOPES)
+    if unknown:
+        raise RuleError(f"{name}: unknown rate limit scopes {', '.join(sorted(map(str, unknown)))}")
+
+    limits = []
+    for scope in SCOPES:
+        if scope not in value:
+            continue
+        spec = value[scope]
+        if not isinstance(spec, dict):
+            raise RuleError(f"{name}: 'rate_limits.{scope}' must have a window and a burst")
+        window = _number(name, f"rate_limits.{scope}.window", spec.get("window"), 1, float("inf"))
+        burst = spec.get("burst", 1)
+        if isinstance(burst, bool) or not isinstance(burst, int) or burst < 1:
+            raise RuleError(f"{name}: 'rate_limits.{scope}.burst' must be a positive integer")
+        limits.append(RateLimit(scope, window, burst))
+    return tuple(limits)
+
+
+def _flag(name: str, field: str, value) -> bool:
+    if not isinstance(value, bool):
+        raise RuleError(f"{name}: '{field}' must be true or false")
+    return value
+
+
+class AutomaticResponse:
+    """Compiled automatic response rule, read attribute-only on every message"""
+
+    __slots__ = (
+        "name",
+        "triggers",
+        "responses",
+        "channel_types",
+        "blocked_channels",
+        "probability",
+        "require_keywords",
+        "cooldown",
+        "rate_limits",
+        "delete_trigger",
+        "priority",
+        "enabled",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        triggers: Tuple[str, ...],
+        responses: Tuple[ResponseTemplate, ...],
+        channel_types: frozenset,
+        probability: float,
+        require_keywords: Tuple[str, ...],
+        cooldown: float,
+        rate_limits: Tuple[RateLimit, ...],
+        delete_trigger: bool,
+        priority: int,
+        enabled: bool,
+    ):
+        self.name = name
+        self.triggers = triggers
+        self.responses = responses
+        self.channel_types = channel_types
+        self.blocked_channels: tuple = (
+            ()
+            if "any" in channel_types
+            else tuple(
+                cls for key, cls in CHANNEL_TYPES.items() if key not in channel_types
+            )
+        )
+        self.probability = probability
+        self.require_keywords = require_keywords
+        self.cooldown = cooldown
+        self.rate_limits = rate_limits
+        self.delete_trigger = delete_trigger
+        self.priority = priority
+        self.enabled = enabled
+
+    @classmethod
+    def from_dict(cls, name: str, data) -> "AutomaticResponse":
+        """Validate and normalize a rule from automatic_responses.yml"""
+        if not isinstance(data, dict):
+            raise RuleError(f"{name}: rule must be a mapping")
+
+        triggers = _string_list(name, "triggers", data.get("triggers", []))
+        if not triggers:
+            raise RuleError(f"{name}: at least one trigger is required")
+
+        responses = _string_list(name, "responses", data.get("responses", []))
+        if not responses:
+            raise RuleError(f"{name}: at least one response is required")
+        templates = tuple(ResponseTemplate(response) for response in responses)
+
+        conditions = data.get("conditions", {}) or {}
+        if not isinstance(conditions, dict):
+            raise RuleError(f"{name}: 'conditions' must be a mapping")
+
+        channel_types = frozenset(
+            _string_list(
+                name, "channel_types", conditions.get("channel_types", ["any"])
+            )
+        )
+        unknown = channel_types - CHANNEL_TYPES.keys() - {"any"}
+        if unknown:
+            raise RuleError(
+                f"{name}: unknown channel types {', '.join(sorted(unknown))}"
+            )
+
+        return cls(
+            name=name,
+            triggers=tuple(trigger.lower() for trigger in triggers),
+            responses=templates,
+            channel_types=channel_types,
+            probability=_number(
+                name, "probability", conditions.get("probability", 1.0), 0, 1
+            ),
+            require_keywords=tuple(
+                keyword.lower()
+                for keyword in _string_list(
+                    name, "require_keywords", conditions.get("require_keywords", [])
+                )
+            ),
+            cooldown=_number(
+                name, "cooldown", conditions.get("cooldown", 30), 0, float("inf")
+            ),
+            rate_limits=_rate_limits(name, conditions.get("rate_limits", {}) or {}),
+            delete_trigger=_flag(
+                name, "delete_trigger", conditions.get("delete_trigger", False)
+            ),
+            priority=_choice(
+                name, "priority", conditions.get("priority", "normal"), PRIORITIES
+            ),
+            enabled=_flag(name, "enabled", data.get("enabled", True)),
+        )
+
+
+def compile_rules(data) -> Tuple[List[AutomaticResponse], List[str]]:
+    """Compile the parsed YAML into rules, collecting schema errors instead of raising"""
+    if not isinstance(data, dict):
+        return [], ["automatic responses file must be a mapping of rule names"]
+
+    rules: List[AutomaticResponse] = []
+    errors: List[str] = []
+    for name, rule_data in data.items():
+        try:
+            rules.append(AutomaticResponse.from_dict(str(name), rule_data))
+        except RuleError as e:
+            errors.append(str(e))
+
+    return rules, errors
+
+
+class Ruleset:
+    """Everything on_message needs, built off the event loop and swapped in as one object"""
+
+    __slots__ = ("raw", "rules", "by_name", "matcher", "errors", "warnings")
+
+    def __init__(self, raw: dict):
+        self.raw = raw
+        self.rules, self.errors = compile_rules(raw)
+        self.warnings: List[str] = []
+        for rule in self.rules:
+            unknown = dict.fromkeys(
+                name for template in rule.responses for name in template.unknown
+            )
+            if unknown:
+                self.warnings.append(
+                    f"{rule.name}: unknown placeholders "
+                    f"{', '.join('{' + name + '}' for name in unknown)} are sent as written"
+                )
+        self.by_name: Dict[str, AutomaticResponse] = {
+            rule.name: rule for rule in self.rules
+        }
+        self.matcher = TriggerMatcher([(rule.name, rule.triggers) for rule in self.rules])
+
+    @classmethod
+    def from_data(cls, data) -> "Ruleset":
+        """Compile the parsed YAML file, rejecting anything that is not a mapping"""
+        if not isinstance(data, dict):
+            raise RuleError("automatic responses file must be a mapping of rule names")
+        return cls(data)
+
+    def __len__(self) -> int:
+        return len(self.rules)
@@ -0,0 +1,251 @@
+import difflib
+import heapq
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Callable, Dict, Generic, Iterable, List, Optional, Sequence, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+Rank = Tuple[int, int, int]
+
+EXACT, PREFIX, SUBSTRING = range(3)
+
+
+class NameIndex:
+    """Sorted, case-insensitive name index for autocomplete.
+
+    Results are ranked exact match, then prefix (found by bisecting the sorted
+    keys), then substring, with a small fuzzy fallback over names sharing the
+    first letter when nothing matches. Repeated queries are served from an LRU
+    cache that lives as long as the index, so rebuilding the index on catalog
+    changes also drops stale results.
+    """
+
+    def __init__(self, names: Iterable[str], limit: int = 25, cache_size: int = 256):
+        self.limit = limit
+        unique = {}
+        for name in names:
+            unique.setdefault(name.lower(), name)
+        self._keys: List[str] = sorted(unique)
+        self._names: List[str] = [unique[key] for key in self._keys]
+        self.cache_size = cache_size
+        self.search = lru_cache(maxsize=cache_size)(self._search)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["search"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.search = lru_cache(maxsize=self.cache_size)(self._search)
+
+    def _search(self, query: str) -> List[str]:
+        query = query.strip().lower()
+        keys = self._keys
+        names = self._names
+        if not query:
+            return names[: self.limit]
+
+        results: List[str] = []
+        start = bisect_left(keys, query)
+        if start < len(keys) and keys[start] == query:
+            results.append(names[start])
+            start += 1
+
+        position = start
+        while (
+            position < len(keys)
+            and len(results) < self.limit
+            and keys[position].startswith(query)
+        ):
+            results.append(names[position])
+            position += 1
+
+        if len(results) < self.limit:
+            for key, name in zip(keys, names):
+                if query in key and not key.startswith(query):
+                    results.append(name)
+                    if len(results) >= self.limit:
+                        break
+
+        if not results:
+            first = bisect_left(keys, query[0])
+            last = bisect_left(keys, chr(ord(query[0]) + 1))
+            close = difflib.get_close_matches(
+                query, keys[first:last], n=self.limit, cutoff=0.6
+            )
+            results = [names[bisect_left(keys, key)] for key in close]
+
+        return results
+
+
+class LookupIndex(Generic[T]):
+    """Exact, prefix and n-gram substring lookup over several keys per item.
+
+    ``fields`` extract the keys of an item, most important field first. Exact
+    keys are a dict lookup, prefixes are found by bisecting the sorted keys,
+    and substrings by intersecting the posting sets of the query's n-grams
+    before a final ``in`` check, so a lookup only touches items that can match
+    instead of scanning the whole catalog. Tiers are tried in order and later
+    ones are skipped once ``limit`` items are found. Hits are ranked by tier,
+    then field, then key length, so the closest match comes first.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[T],
+        fields: Sequence[Callable[[T], Iterable[str]]],
+        ngram: int = 3,
+    ):
+        self.ngram = ngram
+        self.items: List[T] = list(items)
+        self._keys: List[List[Tuple[int, str]]] = []
+        self._exact: Dict[str, Set[int]] = defaultdict(set)
+        self._grams: Dict[str, Set[int]] = defaultdict(set)
+        by_field: List[Dict[str, Set[int]]] = [defaultdict(set) for _ in fields]
+
+        for position, item in enumerate(self.items):
+            keys: Dict[str, int] = {}
+            for field, extract in enumerate(fields):
+                for key in extract(item):
+                    if key:
+                        keys.setdefault(key.lower(), field)
+            self._keys.append([(field, key) for key, field in keys.items()])
+
+            grams: Set[str] = set()
+            for key, field in keys.items():
+                self._exact[key].add(position)
+                by_field[field][key].add(position)
+                # A key inside another key of the same item adds no n-grams
+                if not any(key in other for other in keys if other != key):
+                    grams.update(self._ngrams(key))
+            for gram in grams:
+                self._grams[gram].add(position)
+
+        self._exact = dict(self._exact)
+        self._grams = dict(self._grams)
+        # Per field, the keys sorted within each length, so prefix matches can
+        # be collected in rank order: most important field first, then shortest
+        self._fields = [dict(keys) for keys in by_field]
+        self._by_length: List[List[Tuple[int, List[str]]]] = []
+        for keys in self._fields:
+            by_length: Dict[int, List[str]] = defaultdict(list)
+            for key in keys:
+                by_length[len(key)].append(key)
+            self._by_length.append(
+                [(length, sorted(by_length[length])) for length in sorted(by_length)]
+            )
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def _ngrams(self, text: str) -> Set[str]:
+        """Every substring of up to ``ngram`` characters, so short queries are indexed too"""
+        return {
+            text[start : start + size]
+            for size in range(1, self.ngram + 1)
+            for start in range(len(text) - size + 1)
+        }
+
+    def _prefix_candidates(self, query: str, limit: int) -> Set[int]:
+        """Items with a key starting with ``query``, collected in rank order.
+
+        Stops after the first (field, length) group that brings the total to
+        ``limit``, since no item found later can outrank the ones found so far.
+        """
+        positions: Set[int] = set()
+        for keys_by_field, lengths in zip(self._fields, self._by_length):
+            for length, keys in lengths:
+                if length <= len(query):
+                    continue
+                index = bisect_left(keys, query)
+                while index < len(keys) and keys[index].startswith(query):
+                    positions |= keys_by_field[keys[index]]
+                    index += 1
+                if len(positions) >= limit:
+                    return positions
+        return positions
+
+    def _query_grams(self, query: str) -> List[str]:
+        n = self.ngram
+        return [query[start : start + n] for start in range(len(query) - n + 1)]
+
+    def _substring_candidates(self, query: str) -> Set[int]:
+        if len(query) <= self.ngram:
+            return self._grams.get(query, set())
+        postings = sorted(
+            (self._grams.get(gram, set()) for gram in self._query_grams(query)), key=len
+        )
+        return postings[0].intersection(*postings[1:])
+
+    def _rank(self, position: int, query: str) -> Optional[Rank]:
+        best = None
+        for field, key in self._keys[position]:
+            if key == query:
+                tier = EXACT
+            elif key.startswith(query):
+                tier = PREFIX
+            elif query in key:
+                tier = SUBSTRING
+            else:
+                continue
+            rank = (tier, field, len(key))
+            if best is None or rank < best:
+                best = rank
+        return best
+
+    def lookup(self, query: str, limit: int = 10) -> List[T]:
+        """Items with a key equal to, starting with or containing ``query``, best first"""
+        query = query.strip().lower()
+        if not query:
+            return []
+
+        tiers = (
+            lambda: self._exact.get(query, set()),
+            lambda: self._prefix_candidates(query, limit),
+            lambda: self._substring_candidates(query),
+        )
+        positions: Set[int] = set()
+        for tier in tiers:
+            positions |= tier()
+            if len(positions) >= limit:
+                break
+
+        ranked = []
+        for position in positions:
+            rank = self._rank(position, query)
+            if rank is not None:
+                ranked.append((rank, position))
+        return [self.items[position] for _, position in heapq.nsmallest(limit, ranked)]
+
+    def suggest(self, query: str, limit: int = 3, cutoff: float = 0.5) -> List[T]:
+        """Close matches for a query that found nothing, for "did you mean" hints"""
+        query = query.strip().lower()
+        if len(query) < self.ngram:
+            return []
+
+        # Rare n-grams say the most about a misspelling; common ones like the
+        # "cli" of every "client" would only make this a full scan.
+        shared = Counter()
+        budget = max(limit * 100, 500)
+        for posting in sorted(
+            (self._grams.get(gram, set()) for gram in set(self._query_grams(query))), key=len
+        ):
+            if shared and len(posting) > budget:
+                break
+            shared.update(posting)
+            budget -= len(posting)
+
+        scored = []
+        for position, _ in shared.most_common(limit * 5):
+            ratio = max(
+                difflib.SequenceMatcher(None, query, key).ratio()
+                for _, key in self._keys[position]
+            )
+            if ratio >= cutoff:
+                scored.append((-ratio, position))
+        return [self.items[position] for _, position in heapq.nsmallest(limit, scored)]
@@ -0,0 +1,80 @@
+from typing import Dict, List, Optional
+
+from utils.embeds import EmbedTemplate
+from utils.search import NameIndex
+
+
+class SnippetSet:
+    """Validated snippets together with their autocomplete index and embed templates"""
+
+    __slots__ = ("snippets", "index", "embeds", "list_embed", "errors")
+
+    def __init__(self, data: dict):
+        self.snippets: Dict[str, dict] = {}
+        self.errors: List[str] = []
+
+        for name, snippet in data.items():
+            name = str(name)
+            if not isinstance(snippet, dict):
+                self.errors.append(f"{name}: snippet must be a mapping")
+                continue
+            if not all(
+                isinstance(snippet.get(field, ""), str) for field in ("title", "content")
+            ):
+                self.errors.append(f"{name}: 'title' and 'content' must be strings")
+                continue
+            color = snippet.get("color", 0)
+            if isinstance(color, bool) or not isinstance(color, int):
+                self.errors.append(f"{name}: 'color' must be an integer")
+                continue
+            self.snippets[name] = snippet
+
+        self.index = NameIndex(self.snippets)
+        self.embeds: Dict[str, EmbedTemplate] = {
+            name: EmbedTemplate(
+                title=snippet.get("title", f"📋 {name.title()}"),
+                description=snippet.get("content", "No content available"),
+                color=snippet.get("color", 0x00FF88),
+            )
+            for name, snippet in self.snippets.items()
+        }
+        self.list_embed = self._build_list_embed()
+
+    def _build_list_embed(self) -> Optional[EmbedTemplate]:
+        """The /snippets listing, None when there are no snippets"""
+        if not self.snippets:
+            return None
+
+        snippet_list = [
+            f"`{name}` - {snippet.get('title', name.title())}"
+            for name, snippet in self.snippets.items()
+        ]
+        chunk_size = 10
+        chunks = [
+            snippet_list[i : i + chunk_size]
+            for i in range(0, len(snippet_list), chunk_size)
+        ]
+        return EmbedTemplate(
+            title="📋 Available Snippets",
+            description="Here are all the available snippet commands:",
+            color=0x00FF88,
+            fields=[
+                (
+                    "Snippets" if i == 0 else f"Snippets (continued {i+1})",
+                    "\n".join(chunk),
+                    False,
+                )
+                for i, chunk in enumerate(chunks)
+            ],
+            footer="Use /snippet <name> to send a snippet",
+        )
+
+    @classmethod
+    def from_data(cls, data) -> "SnippetSet":
+        """Compile the parsed YAML file, rejecting anything that is not a mapping"""
+        if not isinstance(data, dict):
+            raise ValueError("snippets file must be a mapping of snippet names")
+        return cls(data)
+
+    def __len__(self) -> int:
+        return len(self.snippets)
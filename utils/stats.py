@@ -0,0 +1,107 @@
+import asyncio
+import time
+from typing import Iterable, Optional
+
+import aiohttp
+import discord
+
+from logger import logger
+from utils.http import AtlasClient
+
+
+class StatsCache:
+    """Bot and atlas statistics for /stats, maintained in the background.
+
+    Guild and member totals are computed once per READY and then kept up to
+    date from join/leave events, and the atlas analytics are polled on an
+    interval. ``version`` is bumped whenever anything shown by /stats changes,
+    so the finished embed can be cached against it.
+    """
+
+    def __init__(self, atlas: AtlasClient, refresh_interval: float = 120):
+        self.atlas = atlas
+        self.refresh_interval = refresh_interval
+        self.guild_count = 0
+        self.member_count = 0
+        self.analytics: Optional[dict] = None
+        self.version = 0
+        self.failures = 0
+        self._fetched_at: Optional[float] = None
+        self._inflight: Optional[asyncio.Task] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def reset_members(self, guilds: Iterable[discord.Guild]):
+        """Recount every guild, done on READY when the gateway resyncs"""
+        guilds = list(guilds)
+        self.guild_count = len(guilds)
+        self.member_count = sum(guild.member_count or 0 for guild in guilds)
+        self.version += 1
+
+    def guild_joined(self, guild: discord.Guild):
+        self.guild_count += 1
+        self.member_count += guild.member_count or 0
+        self.version += 1
+
+    def guild_left(self, guild: discord.Guild):
+        self.guild_count = max(0, self.guild_count - 1)
+        self.member_count = max(0, self.member_count - (guild.member_count or 0))
+        self.version += 1
+
+    def member_joined(self):
+        self.member_count += 1
+        self.version += 1
+
+    def member_left(self):
+        self.member_count = max(0, self.member_count - 1)
+        self.version += 1
+
+    async def _refresh(self) -> Optional[dict]:
+        try:
+            data = await self.atlas.get_json("/api/statistics")
+            if not isinstance(data, dict):
+                raise ValueError(f"unexpected response format: {type(data)}")
+            self.update(data)
+            return data
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self.failures += 1
+            logger.error(f"Failed to fetch statistics: {e}")
+            return self.analytics
+        finally:
+            self._inflight = None
+
+    def update(self, analytics: dict):
+        """Replace the cached analytics and bump the version"""
+        self.analytics = analytics
+        self._fetched_at = time.monotonic()
+        self.version += 1
+
+    def refresh(self) -> "asyncio.Task[Optional[dict]]":
+        """Start an analytics refresh, or join the one already running"""
+        if self._inflight is None:
+            self._inflight = asyncio.create_task(self._refresh())
+        return self._inflight
+
+    def age(self) -> float:
+        """Seconds since the analytics were last fetched successfully"""
+        if self._fetched_at is None:
+            return float("inf")
+        return time.monotonic() - self._fetched_at
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            await self.refresh()
+
+    def start(self):
+        """Re-fetch the analytics every ``refresh_interval`` seconds, sleeping first"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,43 @@
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+from logger import logger
+
+
+class StartupTimeline:
+    """Records when each startup phase began and ended, relative to process start"""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self._open: Dict[str, float] = {}
+        self.phases: List[Tuple[str, float, float]] = []
+
+    def begin(self, name: str):
+        self._open[name] = time.perf_counter() - self.origin
+
+    def end(self, name: str) -> bool:
+        """Close ``name``, returning False if it was not open"""
+        started = self._open.pop(name, None)
+        if started is None:
+            return False
+        finished = time.perf_counter() - self.origin
+        self.phases.append((name, started, finished))
+        logger.info(
+            f"⏱️ {name}: {finished - started:.2f}s (+{started:.2f}s → +{finished:.2f}s)"
+        )
+        return True
+
+    @contextmanager
+    def phase(self, name: str):
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    def summary(self) -> str:
+        return "\n".join(
+            f"{name:<24} {started:>7.2f}s → {finished:>7.2f}s  ({finished - started:.2f}s)"
+            for name, started, finished in sorted(self.phases, key=lambda p: p[1])
+        )
@@ -0,0 +1,136 @@
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Deque, Dict, List, Optional, TextIO, Tuple
+
+import discord
+
+from logger import logger
+
+
+class Trace:
+    """Phases recorded for one slash command invocation"""
+
+    __slots__ = ("command", "started", "wall", "phases")
+
+    def __init__(self, command: str):
+        self.command = command
+        self.started = time.perf_counter()
+        self.wall = time.time()
+        self.phases: Dict[str, float] = {}
+
+
+_current: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class Tracer:
+    """Records per-phase spans of slash commands with rolling latency windows.
+
+    ``begin``/``finish`` are registered as the bot's global before/after invoke
+    hooks, and commands mark their phases with ``with tracer.span("fetch"):``.
+    The last ``window`` samples of each (command, phase) pair are kept for
+    percentiles, and finished traces can optionally be appended to a JSONL file.
+    """
+
+    def __init__(self, window: int = 500):
+        self.window = window
+        self._samples: Dict[Tuple[str, str], Deque[float]] = {}
+        self._file: Optional[TextIO] = None
+
+    def open_log(self, path: str):
+        """Append every finished trace to ``path`` as one JSON line"""
+        try:
+            self._file = open(path, "a", encoding="utf-8", buffering=1)
+        except OSError as e:
+            logger.error(f"Failed to open trace log {path}: {e}")
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _record(self, command: str, phase: str, seconds: float):
+        samples = self._samples.get((command, phase))
+        if samples is None:
+            samples = self._samples[(command, phase)] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    async def begin(self, ctx: discord.ApplicationContext):
+        command = ctx.command.qualified_name if ctx.command else "unknown"
+        _current.set(Trace(command))
+
+    async def finish(self, ctx: discord.ApplicationContext):
+        trace = _current.get()
+        if trace is None:
+            return
+        _current.set(None)
+
+        total = time.perf_counter() - trace.started
+        self._record(trace.command, "total", total)
+        for phase, seconds in trace.phases.items():
+            self._record(trace.command, phase, seconds)
+
+        if self._file is not None:
+            self._file.write(
+                json.dumps(
+                    {
+                        "command": trace.command,
+                        "started": trace.wall,
+                        "total_ms": round(total * 1000, 3),
+                        "phases_ms": {
+                            phase: round(seconds * 1000, 3)
+                            for phase, seconds in trace.phases.items()
+                        },
+                    }
+                )
+                + "\n"
+            )
+
+    @contextmanager
+    def span(self, phase: str):
+        """Time a phase of the current command; a no-op outside of a command"""
+        trace = _current.get()
+        if trace is None:
+            yield
+            return
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            trace.phases[phase] = trace.phases.get(phase, 0.0) + (
+                time.perf_counter() - started
+            )
+
+    def summary(self) -> List[Tuple[str, str, int, float, float]]:
+        """(command, phase, samples, p50, p99) for every recorded pair"""
+        rows = []
+        for (command, phase), samples in self._samples.items():
+            ordered = sorted(samples)
+            rows.append(
+                (
+                    command,
+                    phase,
+                    len(ordered),
+                    _percentile(ordered, 0.5),
+                    _percentile(ordered, 0.99),
+                )
+            )
+        return rows
+
+    def slowest(self, limit: int = 10, phases: bool = False):
+        """Slowest commands by p99 total, or slowest individual phases"""
+        rows = [
+            row for row in self.summary() if (row[1] != "total") == phases
+        ]
+        return sorted(rows, key=lambda row: row[4], reverse=True)[:limit]
+
+
+tracer = Tracer()
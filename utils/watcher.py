@@ -0,0 +1,59 @@
+import asyncio
+import os
+from typing import Awaitable, Callable, Optional, Tuple
+
+from logger import logger
+
+
+class FileWatcher:
+    """Polls a file's stat and awaits ``callback`` whenever it changes.
+
+    mtime polling is used instead of inotify because it also works for the
+    single-file bind mounts in compose.yml and needs no extra dependency.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        callback: Callable[[], Awaitable[object]],
+        interval: float = 2.0,
+    ):
+        self.path = path
+        self.callback = callback
+        self.interval = interval
+        self._signature = self._stat()
+        self._task: Optional[asyncio.Task] = None
+
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            signature = self._stat()
+            if signature == self._signature:
+                continue
+
+            self._signature = signature
+            logger.info(f"🔁 Detected change in {self.path}, reloading")
+            try:
+                await self.callback()
+            except Exception as e:
+                logger.error(f"Failed to reload {self.path}: {e}")
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.create_task(self._watch())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None